@@ -0,0 +1,128 @@
+# Declared arrays: padded nested lists (plithon <= 1.10) versus the flat
+# typed buffers of plithon_runtime.arrays
+#
+#   memory : bytes allocated for dcl t(n,n) fixed bin(31) / char(8)
+#   fill   : t(i,j) = i + j for all elements (the loop the PL/I code runs)
+#   sum    : s = s + t(i,j) for all elements
+#
+# The typed version is the code plithon generates for a PL/I program, the
+# list version the code of the former code generator for the same program.
+#
+# Usage: python bench/bench_arrays.py [n]
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_runtime.arrays import CharArray, fixed_array
+
+PROGRAM = """
+prog: proc options(main);
+dcl t({n},{n}) fixed bin(31);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl s fixed bin(31);
+i = 1;
+do while(i <= {n});
+  j = 1;
+  do while(j <= {n});
+    t(i,j) = i + j;
+    j = j + 1;
+  end;
+  i = i + 1;
+end;
+s = 0;
+i = 1;
+do while(i <= {n});
+  j = 1;
+  do while(j <= {n});
+    s = s + t(i,j);
+    j = j + 1;
+  end;
+  i = i + 1;
+end;
+put skip list(s);
+end prog;
+"""
+
+def list_program(n):
+    """The former translation of PROGRAM: padded nested lists."""
+    t = [[0] * (n + 2) for _ in range(n + 2)]
+    i = 1
+    while (i <= n):
+        j = 1
+        while (j <= n):
+            t[i][j] = (i + j)
+            j = (j + 1)
+        i = (i + 1)
+    s = 0
+    i = 1
+    while (i <= n):
+        j = 1
+        while (j <= n):
+            s = (s + t[i][j])
+            j = (j + 1)
+        i = (i + 1)
+    return s
+
+def allocated(func):
+    """Bytes still allocated by the object that func returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = func()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del value
+    return size
+
+def filled_list(n):
+    t = [[0] * (n + 2) for _ in range(n + 2)]
+    for i in range(1, n + 1):
+        for j in range(1, n + 1):
+            t[i][j] = 100000 + i * n + j   # values outside the small int cache
+    return t
+
+def filled_array(n):
+    t = fixed_array(31, n * n)
+    for k in range(n * n):
+        t[k] = 100000 + k
+    return t
+
+def char_list(n):
+    t = [[''] * (n + 2) for _ in range(n + 2)]
+    for i in range(1, n + 1):
+        for j in range(1, n + 1):
+            t[i][j] = f"{i:04}{j:04}"
+    return t
+
+def char_array(n):
+    t = CharArray(8, n * n)
+    for k in range(n * n):
+        t.store(k, f"{k:08}")
+    return t
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    code = plithon.transpile(PROGRAM.format(n=n)).code
+    typed_module = {}
+    exec(compile(code.replace("print(s)", "return s"), '<typed>', 'exec'), typed_module)
+    print(f"dcl t({n},{n})")
+    print(f"memory fixed bin(31): list {allocated(lambda: filled_list(n)) / 1e6:8.1f} MB, "
+          f"array('i') {allocated(lambda: filled_array(n)) / 1e6:8.1f} MB")
+    print(f"memory char(8)      : list {allocated(lambda: char_list(n)) / 1e6:8.1f} MB, "
+          f"CharArray  {allocated(lambda: char_array(n)) / 1e6:8.1f} MB")
+    list_time = timed(lambda: list_program(n))
+    typed_time = timed(typed_module['prog'])
+    print(f"fill + sum          : list {list_time:8.2f} s,  "
+          f"array('i') {typed_time:8.2f} s")
+
+if __name__ == '__main__':
+    main()
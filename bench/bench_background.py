@@ -0,0 +1,92 @@
+# Read-transform-write of a record file with and without OPEN ... BACKGROUND
+# (read-ahead and write-behind threads), wall-clock time
+#
+#   lines  : text lines
+#   recsize: RECSIZE(80) fixed-length records
+#
+# The gain depends on how long the file system keeps the program waiting;
+# files in the page cache of a local disk leave little to overlap.
+#
+# Usage: python bench/bench_background.py [records]
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+
+RECSIZE = 80
+
+PROGRAM = """
+prog: proc options(main);
+dcl line char(80);
+dcl out char(80);
+dcl eof fixed bin(15);
+dcl n fixed bin(31);
+eof = 0;
+n = 0;
+on endfile(infile) eof = 1;
+open file('infile') input {options};
+open file('outfile') output {options};
+read file('infile') into(line);
+do while(eof = 0);
+  n = n + 1;
+  out = substr(line, 41, 40) || substr(line, 1, 40);
+  write file('outfile') from(out);
+  read file('infile') into(line);
+end;
+close file('infile');
+close file('outfile');
+put skip list(n);
+end prog;
+"""
+
+def program_function(options):
+    """Translates the program; returns its function (returning n instead of printing)."""
+    result = plithon.transpile(PROGRAM.format(options=options))
+    assert result.ok, result.errors
+    namespace = {}
+    exec(compile(result.code.replace("print(n)", "return n"), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(func, records):
+    """Seconds of the best of three runs."""
+    best = None
+    for run in range(3):
+        start = time.perf_counter()
+        count = func()
+        elapsed = time.perf_counter() - start
+        assert count == records, (count, records)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def compare(label, options, records):
+    plain = timed(program_function(options), records)
+    with open('outfile.txt', 'rb') as file:
+        expected = file.read()
+    background = timed(program_function(options + ' background'), records)
+    with open('outfile.txt', 'rb') as file:
+        assert file.read() == expected
+    print(f"{label}: {plain:7.3f} s, background {background:7.3f} s ({plain / background:.2f}x)")
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            data = [f"RECORD {n:010} ".ljust(RECSIZE, 'x') for n in range(records)]
+            print(f"{records} records of {RECSIZE} bytes read, transformed and written")
+            with open('infile.txt', 'w') as file:
+                file.write("\n".join(data) + "\n")
+            compare('lines  ', '', records)
+            with open('infile.txt', 'w') as file:
+                file.write("".join(data))
+            compare('recsize', f'recsize({RECSIZE})', records)
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# Artifact cache: time to get a runnable code object for a PL/I member
+#
+#   no cache  : PL/I parse + code generation + Python compile
+#   cache miss: the same plus writing the .py and .code files
+#   cache hit : reading the marshalled code object
+#
+# Usage: python bench/bench_cache.py [statements]
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+
+def member(statements):
+    """Returns a PL/I program with the given number of assignments."""
+    lines = ["prog: proc options(main);", "dcl i fixed bin(31);"]
+    lines += [f"i = i + {n};" for n in range(statements)]
+    lines.append("end prog;")
+    return "\n".join(lines)
+
+def best_of(runs, func):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    statements = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    transpiler = plithon.Transpiler()
+    with tempfile.TemporaryDirectory() as directory:
+        cache = plithon.open_cache(directory)
+        sources = [member(statements) + f"\n/* {n} */" for n in range(5)]
+        no_cache = best_of(5, lambda: transpiler.compile(sources[0]))
+        misses = iter(sources)
+        miss = best_of(5, lambda: transpiler.compile(next(misses), cache))
+        hit = best_of(5, lambda: transpiler.compile(sources[0], cache))
+        print(f"{statements} statements")
+        print(f"no cache  : {no_cache * 1000:8.2f} ms")
+        print(f"cache miss: {miss * 1000:8.2f} ms")
+        print(f"cache hit : {hit * 1000:8.2f} ms ({no_cache / hit:.0f}x faster)")
+        print(cache.stats())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+# Declared SQL cursors on a local SQLite table: rows per second of
+#
+#   FETCH c INTO id, name;       one row per FETCH statement, the cursor
+#                                fetches fetch_size rows at a time
+#   FETCH c INTO ids, names;     ids(n), names(n): n rows per FETCH (one
+#                                fetchmany), stored into the typed arrays
+#
+# for growing batch sizes.
+#
+# Usage: python bench/bench_fetch.py [rows]
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_runtime import sql
+
+HEADER = """
+prog: proc options(main);
+dcl id fixed bin(31);
+dcl name char(12);
+dcl ids({size}) fixed bin(31);
+dcl names({size}) char(12);
+dcl n fixed bin(31);
+dcl sqlcode fixed bin(31);
+dcl sqlrows fixed bin(31);
+n = 0;
+EXEC SQL DECLARE c CURSOR FOR "SELECT actor_id, last_name FROM actor";
+EXEC SQL OPEN c;
+"""
+
+SCALAR = """
+EXEC SQL FETCH c INTO id, name;
+do while(sqlcode = 0);
+  n = n + 1;
+  EXEC SQL FETCH c INTO id, name;
+end;
+"""
+
+ARRAY = """
+do while(sqlcode = 0);
+  EXEC SQL FETCH c INTO ids, names;
+  n = n + sqlrows;
+end;
+"""
+
+TRAILER = """
+EXEC SQL CLOSE c;
+put skip list(n);
+end prog;
+"""
+
+def create_database(path, rows):
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE actor (actor_id INTEGER PRIMARY KEY, last_name TEXT)")
+    db.executemany("INSERT INTO actor VALUES (?, ?)", [(n, f"NAME{n}") for n in range(rows)])
+    db.commit()
+    db.close()
+
+def program_function(source, path, fetch_size=100):
+    """Translates the program; returns its function (returning n instead of printing)."""
+    config = {'driver': 'sqlite', 'database': path, 'fetch_size': fetch_size}
+    result = plithon.transpile(source, sql_config=config)
+    assert result.ok, result.errors
+    namespace = {}
+    exec(compile(result.code.replace("print(n)", "return n"), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def rate(func, rows):
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    sql.close_all()
+    assert count == rows, (count, rows)
+    return rows / elapsed
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'actor.db')
+        create_database(path, rows)
+        print(f"{rows} rows")
+        for size in (1, 10, 100, 1000):
+            scalar = program_function((HEADER + SCALAR + TRAILER).format(size=1), path, size)
+            print(f"FETCH INTO scalars, fetch_size {size:5}: {rate(scalar, rows):12,.0f} rows/s")
+        for size in (1, 10, 100, 1000, 10000):
+            arrays = program_function((HEADER + ARRAY + TRAILER).format(size=size), path)
+            print(f"FETCH INTO arrays({size:5})          : {rate(arrays, rows):12,.0f} rows/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+# FIXED BIN / FIXED DEC arithmetic in a loop, with and without range checks
+#
+#   checked  : every assignment to a FIXED variable is range-checked
+#              (CodeGenerator.range_analysis = False)
+#   generated: the code plithon emits - checks only where the range analysis
+#              can't prove that the value fits
+#   unchecked: the generated code with all checks removed (the lower bound)
+#   Decimal  : the money kernel with decimal.Decimal values and quantize(),
+#              instead of ints scaled by 100
+#
+# Kernels: "money" computes interest on a FIXED DEC(15,2) balance, "binary"
+# is a FIXED BIN(31) random number generator whose values provably stay in
+# range (MOD takes a variable, t = ...; x = mod(t, n); keeps the products).
+#
+# Usage: python bench/bench_fixed.py [iterations]
+import os
+import re
+import sys
+import time
+from decimal import Decimal, ROUND_DOWN
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_codegen import CodeGenerator
+
+MONEY = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl h fixed bin(31);
+dcl t fixed bin(63);
+dcl balance fixed dec(15,2);
+dcl rate fixed dec(7,6);
+dcl interest fixed dec(15,2);
+dcl total fixed dec(15,2);
+dcl payment fixed dec(15,2);
+balance = 250000.00;
+rate = 0.003750;
+payment = 1500.00;
+h = 0;
+i = 0;
+do while(i < {count});
+  interest = balance * rate;
+  total = total + interest;
+  balance = (balance + interest) - payment;
+  if balance < 0 then balance = 250000.00; else balance = balance;
+  t = (h * 31) + i;
+  h = mod(t, 1000003);
+  i = i + 1;
+end;
+put skip list(total);
+end prog;
+"""
+
+BINARY = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl x fixed bin(31);
+dcl s fixed bin(31);
+dcl t fixed bin(63);
+x = 1;
+i = 0;
+do while(i < {count});
+  t = (x * 1103) + 12345;
+  x = mod(t, 65536);
+  j = x / 256;
+  t = s + j;
+  s = mod(t, 1000000);
+  i = i + 1;
+end;
+put skip list(s);
+end prog;
+"""
+
+# the range check after an assignment, see plithon_runtime.fixed
+CHECK = re.compile(r"\n( *)if not -?\d+ <= \w+ <= \d+:\n\1    raise FixedOverflow\([^\n]*\)")
+
+def decimal_money(count):
+    """The money kernel with decimal.Decimal."""
+    cent = Decimal('0.01')
+    balance = Decimal('250000.00')
+    rate = Decimal('0.003750')
+    payment = Decimal('1500.00')
+    total = Decimal('0.00')
+    h = 0
+    i = 0
+    while i < count:
+        interest = (balance * rate).quantize(cent, ROUND_DOWN)
+        total = total + interest
+        balance = balance + interest - payment
+        if balance < 0:
+            balance = Decimal('250000.00')
+        h = (h * 31 + i) % 1000003
+        i = i + 1
+    return str(total)
+
+def generated_code(source, range_analysis=True):
+    parser = plithon.Transpiler()
+    program = parser.transpile(source).program
+    generator = CodeGenerator(parser.sql_config)
+    generator.range_analysis = range_analysis
+    return generator.generate(program)
+
+def program_function(code, result):
+    """Compiles generated code; returns its function (returning result instead of printing)."""
+    namespace = {}
+    code = re.sub(rf"print\((.*{result}.*)\)", r"return \1", code)
+    exec(compile(code, '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(func, *args):
+    best, value = None, None
+    for run in range(3):
+        start = time.perf_counter()
+        value = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+def compare(label, program, result, count, baseline=None):
+    source = program.format(count=count)
+    generated = generated_code(source)
+    variants = [('checked  ', generated_code(source, range_analysis=False)),
+                ('generated', generated),
+                ('unchecked', CHECK.sub("", generated))]
+    print(f"{label}: {count} iterations, "
+          f"{len(CHECK.findall(variants[0][1]))} checks, {len(CHECK.findall(generated))} left")
+    times = []
+    expected = None
+    for name, code in variants:
+        elapsed, value = timed(program_function(code, result))
+        assert expected is None or value == expected, (value, expected)
+        expected = value
+        times.append((name, elapsed))
+    if baseline is not None:
+        elapsed, value = timed(baseline, count)
+        assert value == expected, (value, expected)
+        times.append(('Decimal  ', elapsed))
+    unchecked = times[2][1]
+    for name, elapsed in times:
+        print(f"  {name}: {elapsed * 1000:9.1f} ms ({elapsed / unchecked:.2f}x unchecked)")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    compare('money ', MONEY, 'total', count, decimal_money)
+    compare('binary', BINARY, 's', count)
+
+if __name__ == '__main__':
+    main()
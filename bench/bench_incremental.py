@@ -0,0 +1,63 @@
+# Watch mode: latency of a re-translation after a one-line edit
+#
+#   full       : Transpiler.transpile of the whole member
+#   incremental: IncrementalTranspiler.transpile of the edited member
+#                (only the changed statements are lexed, parsed and generated)
+#
+# Usage: python bench/bench_incremental.py [lines]
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_incremental import IncrementalTranspiler
+
+def member(lines):
+    """Returns a PL/I program of about the given number of lines."""
+    parts = ["prog: proc options(main);", "dcl i fixed bin(31);", "dcl k fixed bin(31);"]
+    n = 0
+    while len(parts) < lines:
+        if n % 10 == 0:
+            parts += [f"if i > {n} then do;", f"  k = k + {n};",
+                      f"  select(k);", f"    when({n}) i = 0;", "    other k = k - 1;",
+                      "  end;", "end;", "else k = 0;"]
+        else:
+            parts.append(f"i = i + {n};")
+        n += 1
+    parts.append("end prog;")
+    return parts
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    random.seed(1)
+    parts = member(lines)
+    transpiler = plithon.Transpiler()
+    start = time.perf_counter()
+    reference = transpiler.transpile("\n".join(parts))
+    full = time.perf_counter() - start
+    assert reference.ok, reference.errors
+
+    incremental = IncrementalTranspiler()
+    incremental.transpile("\n".join(parts))
+    latencies = []
+    for edit in range(200):
+        n = random.randrange(3, len(parts) - 1)
+        if parts[n].startswith("i = i + "):
+            parts[n] = f"i = i + {edit};"
+        else:
+            parts[n] += " "
+        result = incremental.transpile("\n".join(parts))
+        latencies.append(incremental.stats['seconds'])
+        assert result.ok, result.errors
+    assert result.code == transpiler.transpile("\n".join(parts)).code
+    latencies.sort()
+    print(f"{len(parts)} lines, {incremental.stats['units']} top-level units")
+    print(f"full        : {full * 1000:8.2f} ms")
+    print(f"incremental : {latencies[len(latencies) // 2] * 1000:8.2f} ms median, "
+          f"{latencies[-1] * 1000:.2f} ms max")
+
+if __name__ == '__main__':
+    main()
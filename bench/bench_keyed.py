@@ -0,0 +1,160 @@
+# Lookups by key: READ ... KEY() of a KEYED file against a scan of a file of
+# fixed-length records
+#
+#   load      : a program copying the text file into a KEYED file with
+#               WRITE ... KEYFROM(i) (the records of key 1 to n)
+#   scan      : READ of the text file until the record of the key is found,
+#               as a program without KEYED files has to look a record up
+#               (a few keys, each lookup reads half of the file on average)
+#   keyed     : READ ... KEY(k) of the KEYED file for pseudo-random keys
+#   sequential: READ of all records of the text file and (in the order of
+#               the keys) of the KEYED file
+#
+# With 1M records a keyed READ takes about 11 us, a lookup by scan about
+# 0.3 s (the scan grows with the file, the B-tree lookup with its log).
+# Loading costs about 4 us per record; a sequential READ of the KEYED file is
+# about 3 times slower than one of the text file (a batch of SQLite rows
+# against a C iterator over the decoded buffer).
+#
+# Usage: python bench/bench_keyed.py [records] [lookups]
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+
+RECSIZE = 40
+
+LOAD = """
+prog: proc options(main);
+dcl line char(40);
+dcl i fixed bin(31);
+open file('records') input recsize(40);
+open file('keyed') output keyed;
+do i = 1 to {count};
+  read file('records') into(line);
+  write file('keyed') from(line) keyfrom(i);
+end;
+close file('records');
+close file('keyed');
+put skip list(i);
+end prog;
+"""
+
+SCAN = """
+prog: proc options(main);
+dcl line char(40);
+dcl id char(10);
+dcl found char(40);
+dcl eof fixed bin(15);
+eof = 0;
+on endfile(records) eof = 1;
+open file('records') input recsize(40);
+read file('records') into(line);
+do while(eof = 0);
+  id = substr(line, 1, 10);
+  if id = '{key:010}' then do; found = line; eof = 1; end;
+  else read file('records') into(line);
+end;
+close file('records');
+put skip list(found);
+end prog;
+"""
+
+KEYED = """
+prog: proc options(main);
+dcl line char(40);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl n fixed bin(31);
+n = 0;
+open file('keyed') input keyed;
+do i = 1 to {lookups};
+  j = i * 7919;
+  j = mod(j, {count}) + 1;
+  read file('keyed') into(line) key(j);
+  n = n + 1;
+end;
+close file('keyed');
+put skip list(n);
+end prog;
+"""
+
+SEQUENTIAL = """
+prog: proc options(main);
+dcl line char(40);
+dcl eof fixed bin(15);
+dcl n fixed bin(31);
+eof = 0;
+n = 0;
+on endfile({file}) eof = 1;
+open file('{file}') input {options};
+read file('{file}') into(line);
+do while(eof = 0);
+  n = n + 1;
+  read file('{file}') into(line);
+end;
+close file('{file}');
+put skip list(n);
+end prog;
+"""
+
+def write_records(count):
+    with open('records.txt', 'w', encoding='latin-1') as file:
+        for n in range(1, count + 1):
+            file.write(f"{n:010}{'customer ' + str(n):30}")
+
+def program_function(source, result):
+    """Translates the program; returns its function (returning the result instead of printing)."""
+    translated = plithon.transpile(source)
+    assert translated.ok, translated.errors
+    namespace = {}
+    exec(compile(translated.code.replace(f"print({result})", f"return {result}"), '<bench>', 'exec'),
+         namespace)
+    return namespace['prog']
+
+def timed(func):
+    """Seconds of one call and its result."""
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            write_records(count)
+            elapsed, value = timed(program_function(LOAD.format(count=count), 'i'))
+            print(f"{count} records of {RECSIZE} bytes, KEYED file {os.path.getsize('keyed.db') / 2**20:.0f} MiB")
+            print(f"load      : {count / elapsed:12,.0f} records/s")
+
+            keys = random.Random(1).sample(range(1, count + 1), 3)
+            scans = 0.0
+            for key in keys:
+                elapsed, value = timed(program_function(SCAN.format(key=key), 'found'))
+                assert value.startswith(f"{key:010}"), value
+                scans += elapsed
+            scan = scans / len(keys)
+            print(f"scan      : {scan * 1e6:12,.0f} us per lookup ({len(keys)} keys)")
+
+            elapsed, value = timed(program_function(KEYED.format(count=count, lookups=lookups), 'n'))
+            assert value == lookups, value
+            keyed = elapsed / lookups
+            print(f"keyed     : {keyed * 1e6:12,.1f} us per lookup ({lookups} keys)  {scan / keyed:,.0f}x")
+
+            for label, file, options in (('text', 'records', 'recsize(40)'), ('keyed', 'keyed', 'keyed')):
+                elapsed, value = timed(program_function(SEQUENTIAL.format(file=file, options=options), 'n'))
+                assert value == count, value
+                print(f"sequential: {count / elapsed:12,.0f} records/s ({label})")
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+# Nested counted loops: DO WHILE written out by hand, the counted DO
+# lowered to a while loop and the counted DO lowered to range()
+#
+#   do while: i = 1; DO WHILE(i <= n); ... i = i + 1; END; - the only loop
+#             plithon had before the counted DO, as in pl1code/chessboard.pli
+#   while   : DO i = 1 TO n; ... END; as a while loop that steps i
+#             (CodeGenerator.range_loops = False)
+#   range   : the same DO as for i in range(1, n + 1), the code plithon emits
+#             when the body doesn't assign i and its values fit
+#
+# Kernels: "count" counts the cells of a square of n by n in which i < j
+# (the loops are most of the time), "sum" adds i * j over that square (its
+# overflow check too), "matrix" multiplies two FIXED BIN(31) arrays (three
+# nested loops, the inner one short).
+#
+# Usage: python bench/bench_loops.py [n]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_codegen import CodeGenerator
+from plithon_optimize import optimize
+
+COUNT_WHILE = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl s fixed bin(31);
+s = 0;
+i = 1;
+do while(i <= {n});
+  j = 1;
+  do while(j <= {n});
+    if i < j then s = s + 1; else s = s;
+    j = j + 1;
+  end;
+  i = i + 1;
+end;
+put skip list(s);
+end prog;
+"""
+
+COUNT_DO = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl s fixed bin(31);
+s = 0;
+do i = 1 to {n};
+  do j = 1 to {n};
+    if i < j then s = s + 1; else s = s;
+  end;
+end;
+put skip list(s);
+end prog;
+"""
+
+SUM_WHILE = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl s fixed bin(63);
+s = 0;
+i = 1;
+do while(i <= {n});
+  j = 1;
+  do while(j <= {n});
+    s = s + (i * j);
+    j = j + 1;
+  end;
+  i = i + 1;
+end;
+put skip list(s);
+end prog;
+"""
+
+SUM_DO = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl s fixed bin(63);
+s = 0;
+do i = 1 to {n};
+  do j = 1 to {n};
+    s = s + (i * j);
+  end;
+end;
+put skip list(s);
+end prog;
+"""
+
+MATRIX_WHILE = """
+prog: proc options(main);
+dcl a({m},{m}) fixed bin(31);
+dcl b({m},{m}) fixed bin(31);
+dcl c({m},{m}) fixed bin(31);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl k fixed bin(31);
+dcl s fixed bin(31);
+a = 2;
+b = 3;
+i = 1;
+do while(i <= {m});
+  j = 1;
+  do while(j <= {m});
+    s = 0;
+    k = 1;
+    do while(k <= {m});
+      s = s + (a(i,k) * b(k,j));
+      k = k + 1;
+    end;
+    c(i,j) = s;
+    j = j + 1;
+  end;
+  i = i + 1;
+end;
+s = c({m},{m});
+put skip list(s);
+end prog;
+"""
+
+MATRIX_DO = """
+prog: proc options(main);
+dcl a({m},{m}) fixed bin(31);
+dcl b({m},{m}) fixed bin(31);
+dcl c({m},{m}) fixed bin(31);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl k fixed bin(31);
+dcl s fixed bin(31);
+a = 2;
+b = 3;
+do i = 1 to {m};
+  do j = 1 to {m};
+    s = 0;
+    do k = 1 to {m};
+      s = s + (a(i,k) * b(k,j));
+    end;
+    c(i,j) = s;
+  end;
+end;
+s = c({m},{m});
+put skip list(s);
+end prog;
+"""
+
+def program_function(source, range_loops=True):
+    """Translates the program; returns its function (returning the value instead of printing)."""
+    result = plithon.transpile(source)
+    assert result.ok, result.errors
+    generator = CodeGenerator()
+    generator.range_loops = range_loops
+    code = generator.generate(optimize(result.program))
+    namespace = {}
+    exec(compile(code.replace("print(", "return ("), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(funcs):
+    """Seconds of one call of each function, the best of three (taking turns)."""
+    best = [None] * len(funcs)
+    values = set()
+    for round in range(3):
+        for n, func in enumerate(funcs):
+            start = time.perf_counter()
+            values.add(func())
+            elapsed = time.perf_counter() - start
+            best[n] = elapsed if best[n] is None else min(best[n], elapsed)
+    assert len(values) == 1, values
+    return best
+
+def compare(label, loop_while, loop_do, iterations, **sizes):
+    by_hand, stepped, ranged = timed([program_function(loop_while.format(**sizes)),
+                                      program_function(loop_do.format(**sizes), False),
+                                      program_function(loop_do.format(**sizes))])
+    print(f"{label:7} {iterations:9} " +
+          " ".join(f"{elapsed / iterations * 1e9:8.1f}" for elapsed in (by_hand, stepped, ranged)) +
+          f"  {by_hand / ranged:5.2f}x")
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    m = max(2, int(round(n ** (2 / 3))))
+    print("ns per iteration of the innermost loop")
+    print(f"{'kernel':7} {'iters':>9} {'do while':>8} {'while':>8} {'range':>8}  gain")
+    compare('count', COUNT_WHILE, COUNT_DO, n * n, n=n)
+    compare('sum', SUM_WHILE, SUM_DO, n * n, n=n)
+    compare('matrix', MATRIX_WHILE, MATRIX_DO, m ** 3, m=m)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# Reading a large file of fixed-length records: throughput and peak RSS
+#
+#   readline: the former generated code - one line per READ, readline().strip()
+#   recsize : OPEN ... RECSIZE(n), records read with readinto() and decoded
+#   mmap    : OPEN ... RECSIZE(n) MMAP, records are memoryviews of the mapped
+#             file, SUBSTR(line, 1, 6) decodes 6 bytes of every record
+#
+# for short and long records. Every variant runs in a process of its own, so
+# its peak RSS is its own (Linux, macOS).
+#
+# Usage: python bench/bench_mmap.py [megabytes]
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import plithon
+
+PROGRAM = """
+prog: proc options(main);
+dcl line char({recsize});
+dcl eof fixed bin(15);
+dcl n fixed bin(31);
+eof = 0;
+n = 0;
+on endfile(infile) eof = 1;
+open file('infile') input {options};
+read file('infile') into(line);
+do while(eof = 0);
+  if substr(line, 1, 6) = 'RECORD' then n = n + 1; else n = n;
+  read file('infile') into(line);
+end;
+close file('infile');
+put skip list(n);
+end prog;
+"""
+
+def readline():
+    """The loop as the former code generator translated it."""
+    n = 0
+    infile = open('infile.txt', 'r')
+    line = infile.readline().strip()
+    while line != '':
+        if line[0:6] == 'RECORD':
+            n = n + 1
+        line = infile.readline().strip()
+    infile.close()
+    return n
+
+def program_function(recsize, options):
+    """Translates the program; returns its function (returning n instead of printing)."""
+    result = plithon.transpile(PROGRAM.format(recsize=recsize, options=options))
+    assert result.ok, result.errors
+    namespace = {}
+    exec(compile(result.code.replace("print(n)", "return n"), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def child(variant, recsize):
+    """Runs one variant in the current directory; prints records/s and peak RSS in MB."""
+    if variant == 'readline':
+        func = readline
+    else:
+        func = program_function(recsize, f"recsize({recsize}) mmap" if variant == 'mmap'
+                                else f"recsize({recsize})")
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak = peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+    print(count / elapsed, peak)
+
+def write_file(recsize, records, lines):
+    record = "RECORD".ljust(recsize - 1, 'x')
+    with open('infile.txt', 'w') as file:
+        for block in range(0, records, 1000):
+            count = min(1000, records - block)
+            file.write((record + "\n") * count if lines else (record + "y") * count)
+
+def main():
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], int(sys.argv[3]))
+        return
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for recsize in (80, 4096):
+                records = megabytes * 1024 * 1024 // recsize
+                print(f"{records} records of {recsize} bytes ({megabytes} MB)")
+                for variant in ('readline', 'recsize', 'mmap'):
+                    write_file(recsize, records, variant == 'readline')
+                    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child',
+                                             variant, str(recsize)], check=True,
+                                            capture_output=True, text=True).stdout
+                    rate, peak = map(float, output.split())
+                    print(f"  {variant:8}: {rate:12,.0f} records/s, peak RSS {peak:7.1f} MB")
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    main()
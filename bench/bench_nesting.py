@@ -0,0 +1,68 @@
+# Transpile time of deeply nested DO/IF/SELECT programs
+#
+# Every nesting level contains a DO WHILE loop, an IF with a DO-group in the
+# THEN branch and a SELECT, so the generated code is nested three levels deeper
+# per PL/I level. With the AST and the single-pass code generator the time per
+# statement stays flat as the nesting depth grows. (CPython itself only
+# compiles up to 20 nested blocks, the deep programs measure the transpiler.)
+#
+# Usage: python bench/bench_nesting.py [max-depth]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_codegen import CodeGenerator
+
+def nested_program(depth):
+    """Returns a PL/I program nesting DO WHILE, IF and SELECT `depth` times."""
+    lines = ["prog: proc options(main);",
+             "dcl i fixed bin(31);",
+             "dcl k fixed bin(31);"]
+    for level in range(depth):
+        lines += [f"do while(i < {level + 10});",
+                  "  i = i + 1;",
+                  f"  select(k);",
+                  f"    when({level}) k = k + 1;",
+                  f"    other k = k - 1;",
+                  "  end;",
+                  f"  if i = {level} then do;",
+                  "    k = k * 2;"]
+    for level in range(depth):
+        lines += ["  end;",
+                  "  else k = 0;",
+                  "end;"]
+    lines.append("end prog;")
+    return "\n".join(lines)
+
+def best_of(runs, func, *args):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    max_depth = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    transpiler = plithon.Transpiler()
+    print(f"{'depth':>6} {'statements':>10} {'lines out':>10} {'transpile ms':>13} "
+          f"{'codegen ms':>11} {'us/statement':>13}")
+    depth = 25
+    while depth <= max_depth:
+        source = nested_program(depth)
+        result = transpiler.transpile(source)
+        assert result.ok, result.errors
+        statements = depth * 8
+        total = best_of(5, transpiler.transpile, source)
+        codegen = best_of(5, CodeGenerator().generate, result.program)
+        print(f"{depth:6d} {statements:10d} {result.code.count(chr(10)) + 1:10d} "
+              f"{total * 1000:13.2f} {codegen * 1000:11.2f} "
+              f"{total / statements * 1e6:13.1f}")
+        depth *= 2
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+# Effect of the optimization passes (plithon_optimize.py) on the sample
+# programs in pl1code and on a loop kernel
+#
+# Every program is translated with no pass, with each pass alone and with
+# all passes; the table shows the lines of the generated program function
+# and the time of one run (PUT output is discarded, GET LIST reads 3,
+# record_io reads a small infile.txt). The samples hardly loop, their times
+# differ by noise only; the kernel shows what each pass saves in a loop:
+#
+#   fold  : 60 * (60 * 24) computed by the translator - CPython folds
+#           constant int arithmetic itself, folding pays off where the
+#           range analysis then drops an overflow check
+#   select: SELECT(mod(i, 4)) evaluated once instead of per WHEN
+#   hoist : n * m, d * (n + 1), n - m and a concatenation out of DO WHILE
+#   prune : IF 1 > 2 (a constant condition) removed
+#
+# Usage: python bench/bench_optimize.py [iterations]
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_optimize import PASSES
+
+SAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pl1code')
+
+KERNEL = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl n fixed bin(31);
+dcl m fixed bin(31);
+dcl s fixed bin(63);
+dcl c fixed bin(63);
+dcl d fixed dec(9,2);
+dcl e fixed dec(15,2);
+dcl name char(10);
+dcl w char(20) varying;
+n = 1000;
+m = 7;
+d = 1.25;
+name = 'kernel';
+i = 0;
+s = 0;
+c = 0;
+e = 0;
+do while(i < {count});
+  s = s + (n * m);
+  e = e + (d * (n + 1));
+  c = c + (n - m);
+  if 1 > 2 then put skip list(i); else i = i;
+  select(mod(i, 4));
+    when(0) s = s + (60 * (60 * 24));
+    when(1) s = s - (60 * (60 * 24));
+    when(2) w = substr(name, 1, 3) || '-' || 'x';
+    other s = s + 1;
+  end;
+  i = i + 1;
+end;
+put skip list(s);
+put skip list(e);
+put skip list(c);
+put skip list(w);
+end prog;
+"""
+
+CONFIGURATIONS = [('none', ())] + [(name, (name,)) for name in PASSES] + [('all', PASSES)]
+
+def program_function(source, passes):
+    """Translates the program; returns its function and the number of its lines."""
+    result = plithon.transpile(source, passes=passes)
+    if not result.ok:
+        return None, result.errors
+    namespace = {'print': lambda *values: None, 'input': lambda prompt='': '3'}
+    exec(compile(result.code, '<bench>', 'exec'), namespace)
+    code = result.code.splitlines()
+    lines = code.index("if __name__ == '__main__':") - code.index(f"def {result.program.name}():") - 1
+    return namespace[result.program.name], lines
+
+def timed(funcs, runs):
+    """
+    Seconds of one call of each function: the best of five rounds of runs
+    calls, the functions take turns in every round (the machine's speed drifts).
+    """
+    best = [None] * len(funcs)
+    for round in range(5):
+        for n, func in enumerate(funcs):
+            start = time.perf_counter()
+            for run in range(runs):
+                func()
+            elapsed = (time.perf_counter() - start) / runs
+            best[n] = elapsed if best[n] is None else min(best[n], elapsed)
+    return best
+
+def compare(label, source, runs):
+    funcs = []
+    sizes = []
+    for name, passes in CONFIGURATIONS:
+        func, lines = program_function(source, passes)
+        if func is None:
+            print(f"{label:12} not translated: {'; '.join(lines)}")
+            return
+        funcs.append(func)
+        sizes.append(lines)
+    times = timed(funcs, runs)
+    print(f"{label:12}" + "".join(f"{lines:6}{elapsed * 1e6:11.1f}us{times[0] / elapsed:6.2f}x"
+                                  for lines, elapsed in zip(sizes, times)))
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{'':12}" + "".join(f"{name:>26}" for name, passes in CONFIGURATIONS))
+    print(f"{'':12}" + f"{'lines':>6}{'time':>13}{'gain':>7}" * len(CONFIGURATIONS))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            with open('infile.txt', 'w') as file:
+                file.write("line one\nline two\n\nrest\n")
+            for name in sorted(os.listdir(SAMPLES)):
+                with open(os.path.join(SAMPLES, name)) as file:
+                    source = file.read()
+                if 'exec sql' in source.lower():
+                    print(f"{os.path.splitext(name)[0]:12} skipped (needs a database)")
+                    continue
+                compare(os.path.splitext(name)[0], source, 1000)
+            compare('kernel', KERNEL.format(count=count), 1)
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# Run time of a program without and with the profiler (plithon.py -r --profile)
+#
+#   plain   : the compiled module executed as by plithon.run_program() - the
+#             generated code is the same with and without the profiler, its
+#             SOURCE_MAP is one constant of the module
+#   profiled: the same module under plithon_profile.profile(), every line
+#             counted and timed (sys.monitoring on Python 3.12+, else
+#             sys.settrace)
+#
+# The kernel is a counted DO loop and a DO WHILE with short statements, the
+# worst case for a line profiler: the events cost more than the lines. With
+# 200000 iterations the profiled run takes about 14 times the plain one with
+# sys.monitoring (Python 3.13) and about 30 times with sys.settrace (3.11);
+# the time of the profiler is left out of the statements, so their shares
+# stay in proportion (--report prints the profile of the last run).
+#
+# Usage: python bench/bench_profile.py [iterations] [--report]
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+import plithon_profile
+
+KERNEL = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl n fixed bin(31);
+dcl s char(20) varying;
+n = 0;
+s = '';
+do i = 1 to {count};
+  n = n + mod(i, 7);
+  if mod(i, 1000) = 0 then s = s || 'x'; else n = n;
+end;
+i = 0;
+do while(i < {count});
+  i = i + 1;
+end;
+put skip list(n);
+end prog;
+"""
+
+def best_of(func, rounds=5):
+    """Seconds of the fastest of some calls."""
+    best = None
+    for round in range(rounds):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    count = int(args[0]) if args else 200000
+    source = KERNEL.format(count=count)
+    result = plithon.Transpiler().compile(source)
+    assert result.ok, result.errors
+    output = io.StringIO()
+    reports = io.StringIO()
+    stdout = sys.stdout
+    sys.stdout = output
+    try:
+        plain = best_of(lambda: plithon.run_program(result.code_object))
+        profiled = best_of(lambda: plithon_profile.profile(result.code_object, result.code, source,
+                                                           'kernel', reports))
+    finally:
+        sys.stdout = stdout
+    method = 'sys.monitoring' if hasattr(sys, 'monitoring') else 'sys.settrace'
+    print(f"{count} iterations, Python {sys.version.split()[0]} ({method})")
+    print(f"  plain   : {plain:8.3f} s")
+    print(f"  profiled: {profiled:8.3f} s  {profiled / plain:5.1f}x")
+    if '--report' in sys.argv:
+        print(reports.getvalue().split('Profile of')[-1])
+
+if __name__ == '__main__':
+    main()
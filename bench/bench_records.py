@@ -0,0 +1,106 @@
+# READ FILE / WRITE FILE throughput in records per second, reading only and
+# copying every record to an output file
+#
+#   readline : the former generated code - open() with the default buffer,
+#              readline().strip() per READ, a blank record ends the loop
+#   lines    : plithon_runtime.records, text lines through a 1 MiB buffer
+#   recsize  : plithon_runtime.records, RECSIZE(80) fixed-length records
+#              read with readinto() into a reusable buffer
+#
+# Usage: python bench/bench_records.py [records]
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+
+RECSIZE = 80
+
+PROGRAM = """
+prog: proc options(main);
+dcl line char(80);
+dcl eof fixed bin(15);
+dcl n fixed bin(31);
+eof = 0;
+n = 0;
+on endfile(infile) eof = 1;
+open file('infile') input {options};
+open file('outfile') output {options};
+read file('infile') into(line);
+do while(eof = 0);
+  n = n + 1;
+  {write}
+  read file('infile') into(line);
+end;
+close file('infile');
+close file('outfile');
+put skip list(n);
+end prog;
+"""
+
+def readline(copy):
+    """The loop as the former code generator translated it."""
+    n = 0
+    infile = open('infile.txt', 'r')
+    outfile = open('outfile.txt', 'w')
+    line = infile.readline().strip()
+    while line != '':
+        n = n + 1
+        if copy:
+            outfile.write(line + '\n')
+        line = infile.readline().strip()
+    infile.close()
+    outfile.close()
+    return n
+
+def program_function(options, copy):
+    """Translates the program; returns its function (returning n instead of printing)."""
+    write = "write file('outfile') from(line);" if copy else ""
+    result = plithon.transpile(PROGRAM.format(options=options, write=write))
+    assert result.ok, result.errors
+    namespace = {}
+    exec(compile(result.code.replace("print(n)", "return n"), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def rate(func, records, *args):
+    """Records per second of the best of three runs."""
+    best = None
+    for run in range(3):
+        start = time.perf_counter()
+        count = func(*args)
+        elapsed = time.perf_counter() - start
+        assert count == records, (count, records)
+        best = elapsed if best is None else min(best, elapsed)
+    return records / best
+
+def report(label, read, copy, records, old):
+    read, copy = rate(read, records), rate(copy, records)
+    print(f"{label}: {read:12,.0f} read, {copy:12,.0f} copied records/s "
+          f"({read / old[False]:.1f}x, {copy / old[True]:.1f}x)")
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            data = [f"RECORD {n:010} ".ljust(RECSIZE, 'x') for n in range(records)]
+            print(f"{records} records of {RECSIZE} bytes, read and written")
+            with open('infile.txt', 'w') as file:
+                file.write("\n".join(data) + "\n")
+            old = {copy: rate(readline, records, copy) for copy in (False, True)}
+            print(f"readline: {old[False]:12,.0f} read, {old[True]:12,.0f} copied records/s")
+            report('lines   ', program_function('', False), program_function('', True), records, old)
+            with open('infile.txt', 'w') as file:
+                file.write("".join(data))
+            options = f'recsize({RECSIZE})'
+            report('recsize ', program_function(options, False), program_function(options, True),
+                   records, old)
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    main()
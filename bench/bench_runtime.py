@@ -0,0 +1,139 @@
+# Per-statement overhead of the code around the runtime calls: statements in
+# a counted DO loop, in three forms of the generated code
+#
+#   inline : the statement expanded where it stands, as plithon 1.09 did -
+#            GET LIST a try/except per variable, EXEC SQL an import and a
+#            def of the query function before every execution
+#   global : calls of plithon_runtime names imported into the module
+#            (from plithon_runtime.stream import get_item), looked up in
+#            the module globals on every call
+#   local  : the code plithon emits - the runtime modules imported once,
+#            their names bound to locals at the start of the program
+#
+# GET LIST reads from a replaced input(), PUT output is discarded, EXEC SQL
+# runs against an SQLite database in a temporary directory. The times
+# include the loop and the statement's own work, the differences are the
+# overhead. On CPython 3.11, which caches module globals in the byte code,
+# locals and globals are equally fast (older versions look globals up in a
+# dict); the 1.09 GET LIST is faster than a call of get_item - by far less
+# than the input() of a console takes - but 5 lines per variable long.
+#
+# Usage: python bench/bench_runtime.py [iterations]
+import builtins
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_config import SqlConfig
+
+KERNELS = {
+    'get list': """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl a fixed bin(31);
+dcl b fixed bin(31);
+do i = 1 to {count};
+  get list(a, b);
+end;
+put skip list(a);
+end prog;
+""",
+    'exec sql': """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl k fixed bin(31);
+dcl x char(20);
+k = 1;
+do i = 1 to {count};
+  exec sql "select name from t where id = :k" into x;
+end;
+put skip list(x);
+end prog;
+""",
+    'put dec': """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl d fixed dec(9,2);
+d = 0;
+do i = 1 to {count};
+  d = d + 0.25;
+  put skip list(d);
+end;
+end prog;
+""",
+}
+
+# the runtime names bound at the start of the program function
+BOUND = re.compile(r"^    (\w+) = (plithon_runtime\.\w+)\.\1\n", re.M)
+
+GET_ITEM = re.compile(r"^( *)(\w+) = get_item\('\w+'\)$", re.M)
+SELECT_INTO = re.compile(r"^( *)(\w+) = select_into\((.*)\)$", re.M)
+
+def global_code(code):
+    """The generated code with the runtime names imported into the module."""
+    modules = {}
+    for name, module in BOUND.findall(code):
+        modules.setdefault(module, []).append(name)
+    code = BOUND.sub("", code)
+    for module, names in modules.items():
+        code = code.replace(f"import {module}\n", f"from {module} import {', '.join(names)}\n")
+    return "import plithon_runtime\n" + code
+
+def inline_code(code):
+    """The global code with GET LIST and EXEC SQL expanded where they stand (as 1.09 did)."""
+    code = GET_ITEM.sub(lambda m: "\n".join(line.format(m[1], m[2]) for line in (
+        "{0}try:",
+        "{0}    {1}_input = input(\"Enter {1}: \")",
+        "{0}    {1} = int({1}_input)",
+        "{0}except ValueError:",
+        "{0}    {1} = {1}_input  # Fall back to string if not an integer")), code)
+    return SELECT_INTO.sub(lambda m: "\n".join(line.format(m[1], m[2], m[3]) for line in (
+        "{0}import sqlite3",
+        "{0}def execute_sql_query(db, query, values):",
+        "{0}    return select_into(db, query, values)",
+        "{0}{1} = execute_sql_query({2})")), global_code(code))
+
+def program_function(code):
+    namespace = {'print': lambda *values: None}
+    exec(compile(code, '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(funcs):
+    """Seconds of one call of each function, the best of five (taking turns)."""
+    best = [None] * len(funcs)
+    for round in range(5):
+        for n, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best[n] = elapsed if best[n] is None else min(best[n], elapsed)
+    return best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    builtins.input = lambda prompt='': '42'
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'bench.db')
+        with sqlite3.connect(database) as db:
+            db.execute("create table t (id integer primary key, name text)")
+            db.execute("insert into t values (1, 'plithon')")
+        config = SqlConfig({'driver': 'sqlite', 'database': database})
+        print(f"{count} statements, ns per statement (and loop)")
+        print(f"{'kernel':9} {'inline':>8} {'global':>8} {'local':>8}")
+        for label, source in KERNELS.items():
+            result = plithon.transpile(source.format(count=count), sql_config=config)
+            assert result.ok, result.errors
+            funcs = [program_function(code) for code in
+                     (inline_code(result.code), global_code(result.code), result.code)]
+            times = timed(funcs)
+            print(f"{label:9} " + " ".join(f"{elapsed / count * 1e9:8.0f}" for elapsed in times) +
+                  f"  {times[0] / times[2]:5.2f}x {times[1] / times[2]:5.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# SELECT with many constant WHEN values: if/elif chain against the dict
+# dispatch, the pattern of pl1code/select.pli scaled to many cases
+#
+#   chain: the subject is compared with one WHEN value after the other
+#          (CodeGenerator.select_table = None), a string without its
+#          trailing blanks stripped once
+#   dict : the subject is looked up in a dict of the WHEN values, a binary
+#          tree of ifs runs the WHEN found
+#
+# The subject cycles through all WHEN values and one value of the OTHER
+# part; "fixed" selects on a FIXED BIN(31), "char" on a CHAR(8). The time
+# includes that of the loop. The code generator uses the dict from
+# CodeGenerator.select_table (16) WHEN values on, where it starts to win.
+#
+# Usage: python bench/bench_select.py [iterations]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_codegen import CodeGenerator
+from plithon_optimize import optimize
+
+PROGRAM = """
+prog: proc options(main);
+dcl i fixed bin(31);
+dcl t fixed bin(31);
+dcl x fixed bin(31);
+dcl y fixed bin(63);
+dcl s char(8);
+y = 0;
+i = 0;
+do while(i < {count});
+  t = mod(i, {modulus});
+  x = t * 10;
+  s = decimal(x);
+  select({subject});
+{whens}
+    other do;
+      y = y - 1;
+    end;
+  end;
+  i = i + 1;
+end;
+put skip list(y);
+end prog;
+"""
+
+def source(cases, subject, count):
+    if subject == 'x':
+        whens = [f"    when({n * 10}) y = y + {n};" for n in range(cases)]
+    else:
+        whens = [f"    when('{n * 10}') y = y + {n};" for n in range(cases)]
+    return PROGRAM.format(count=count, modulus=cases + 1, subject=subject, whens="\n".join(whens))
+
+def program_function(text, select_table):
+    """Translates the program; returns its function (returning y instead of printing)."""
+    result = plithon.transpile(text)
+    assert result.ok, result.errors
+    generator = CodeGenerator()
+    generator.select_table = select_table
+    code = generator.generate(optimize(result.program))
+    namespace = {}
+    exec(compile(code.replace("print(y)", "return y"), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(funcs):
+    """Seconds of one call of each function, the best of three (taking turns)."""
+    best = [None] * len(funcs)
+    values = set()
+    for round in range(3):
+        for n, func in enumerate(funcs):
+            start = time.perf_counter()
+            values.add(func())
+            elapsed = time.perf_counter() - start
+            best[n] = elapsed if best[n] is None else min(best[n], elapsed)
+    assert len(values) == 1, values
+    return best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{count} SELECTs, ns per SELECT (and loop)")
+    print(f"{'cases':>5} {'subject':>7} {'chain':>8} {'dict':>8}")
+    for cases in (2, 4, 6, 8, 16, 64, 200):
+        for label, subject in (('fixed', 'x'), ('char', 's')):
+            text = source(cases, subject, count)
+            chain, table = timed([program_function(text, None), program_function(text, 2)])
+            print(f"{cases:5} {label:>7} {chain / count * 1e9:8.0f} {table / count * 1e9:8.0f}"
+                  f"  {chain / table:5.2f}x")
+
+if __name__ == '__main__':
+    main()
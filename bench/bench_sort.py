@@ -0,0 +1,105 @@
+# External merge sort against sorting the whole file in memory
+#
+#   memory : the file read into a list, list.sort() with the same key and
+#            written back (what a program does without PLISRTA)
+#   merge  : sort_file() with a memory budget a fraction of the file: runs
+#            sorted in memory, then a heapq.merge() of the run files
+#   jobs   : the same with the runs sorted by several processes
+#
+# Every variant runs in a process of its own: the peak RSS is that of the
+# process (os.wait4()), the output is compared with that of memory.
+#
+# With 1M records of 100 bytes (95 MiB) and a budget of 16 MiB, the merge
+# writes 21 runs and peaks at about 44 MiB of RSS (the interpreter takes 11,
+# the allocator keeps some memory from run to run) against 550 MiB for the
+# in-memory sort - a list of bytes objects and their keys costs 5 to 6 times
+# the file - at about 1.5 times its time: every record is read and written
+# twice. The jobs share the budget (4 times the runs) and pay off only with a
+# core per process; on one core they add the start of the workers.
+#
+# Usage: python bench/bench_sort.py [records] [memory MiB] [jobs]
+import filecmp
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RECSIZE = 100
+FIELDS = '(11,10,CH,A,1,10,ZD,D)'
+
+MEMORY_SORT = """
+import sys
+from plithon_runtime.sort import key_function, parse_fields
+with open(sys.argv[1], 'rb') as file:
+    data = file.read()
+records = [data[n:n + {recsize}] for n in range(0, len(data), {recsize})]
+del data
+records.sort(key=key_function(parse_fields({fields!r})))
+with open(sys.argv[2], 'wb') as file:
+    file.write(b''.join(records))
+print(1)
+"""
+
+MERGE_SORT = """
+import sys
+from plithon_runtime.sort import sort_file
+print(sort_file(sys.argv[1], sys.argv[2], {fields!r}, recsize={recsize}, memory={memory}, jobs={jobs}))
+"""
+
+CITIES = [b'Berlin', b'Hamburg', b'Munich', b'Cologne', b'Frankfurt', b'Stuttgart']
+
+def write_records(path, count):
+    generator = random.Random(1)
+    with open(path, 'wb') as file:
+        for n in range(count):
+            amount = b'%010d' % generator.randrange(10 ** 9)
+            city = generator.choice(CITIES).ljust(10)
+            file.write(amount + city + (b'customer %d' % n).ljust(RECSIZE - 20))
+
+def run(script, input, output):
+    """Seconds, peak RSS in MiB and the printed number of runs of a script run in a process."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', script, input, output], stdout=subprocess.PIPE, env=env)
+    out = process.stdout.read()
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    assert process.returncode == 0, process.returncode
+    return elapsed, usage.ru_maxrss / 1024, int(out)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    memory = (int(sys.argv[2]) if len(sys.argv) > 2 else 16) << 20
+    jobs = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    with tempfile.TemporaryDirectory() as directory:
+        input = os.path.join(directory, 'input.txt')
+        write_records(input, count)
+        size = os.path.getsize(input)
+        print(f"{count} records of {RECSIZE} bytes ({size / 2**20:.0f} MiB), budget {memory / 2**20:.0f} MiB, "
+              f"{os.cpu_count()} cores")
+        variants = [('memory', MEMORY_SORT.format(recsize=RECSIZE, fields=FIELDS)),
+                    ('merge', MERGE_SORT.format(recsize=RECSIZE, fields=FIELDS, memory=memory, jobs=1)),
+                    (f'jobs={jobs}', MERGE_SORT.format(recsize=RECSIZE, fields=FIELDS, memory=memory, jobs=jobs))]
+        best = {}
+        # taking turns, the best of three
+        for round in range(3):
+            for name, script in variants:
+                output = os.path.join(directory, name + '.txt')
+                elapsed, rss, runs = run(script, input, output)
+                if name not in best or elapsed < best[name][0]:
+                    best[name] = (elapsed, rss, runs)
+        reference = os.path.join(directory, 'memory.txt')
+        for name, script in variants:
+            elapsed, rss, runs = best[name]
+            assert filecmp.cmp(reference, os.path.join(directory, name + '.txt'), shallow=False), name
+            print(f"  {name:8}: {elapsed:6.2f} s {count / elapsed:12,.0f} records/s  peak RSS {rss:6.0f} MiB"
+                  f"  {runs:3} runs")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# EXEC SQL inside a DO WHILE loop, against a local SQLite database
+#
+#   reconnect: the former generated code - connect, cursor, execute, close
+#              for every execution, the value pasted into the SQL text
+#   pooled   : plithon_runtime.sql - one connection, one cursor per statement
+#              text, the host variable bound as a parameter
+#
+# Usage: python bench/bench_sql.py [executions]
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_runtime import sql
+
+PROGRAM = """
+prog: proc options(main);
+dcl k fixed bin(31);
+dcl x fixed bin(31);
+dcl s fixed bin(31);
+k = 1;
+s = 0;
+do while(k <= {count});
+  EXEC SQL "SELECT actor_id * 2 FROM actor WHERE actor_id = :k" INTO x;
+  s = s + x;
+  k = k + 1;
+end;
+put skip list(s);
+end prog;
+"""
+
+def create_database(path, rows=1000):
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE actor (actor_id INTEGER PRIMARY KEY, last_name TEXT)")
+    db.executemany("INSERT INTO actor VALUES (?, ?)", [(n, f"NAME{n}") for n in range(1, rows + 1)])
+    db.commit()
+    db.close()
+
+def reconnect(path, count):
+    """The loop as the former code generator translated it."""
+    s = 0
+    for k in range(1, count + 1):
+        connection = sqlite3.connect(path)
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT actor_id * 2 FROM actor WHERE actor_id = {k}")
+        result = cursor.fetchone()
+        cursor.close()
+        connection.close()
+        s += result[0]
+    return s
+
+def pooled(path, count):
+    """Returns the function of the generated program (put skip list replaced by return)."""
+    result = plithon.transpile(PROGRAM.format(count=count),
+                               sql_config={'driver': 'sqlite', 'database': path})
+    assert result.ok, result.errors
+    namespace = {}
+    exec(compile(result.code.replace("print(s)", "return s"), '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(func, *args):
+    start = time.perf_counter()
+    value = func(*args)
+    return time.perf_counter() - start, value
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'actor.db')
+        create_database(path, max(count, 1000))
+        old, expected = timed(reconnect, path, count)
+        new, value = timed(pooled(path, count))
+        sql.close_all()
+        assert value == expected, (value, expected)
+        print(f"{count} executions of one EXEC SQL statement")
+        print(f"reconnect: {old * 1000:8.1f} ms")
+        print(f"pooled   : {new * 1000:8.1f} ms ({old / new:.0f}x faster)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# Startup benchmark: time from interpreter start to the first translated member
+#
+#   cold: LALR tables generated from the grammar (no shipped tables)
+#   warm: tables loaded from the plithon_tables package
+#
+# Every run is a fresh interpreter, as on a short-lived CI worker.
+# Usage: python bench/bench_startup.py [runs]
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE = os.path.join(ROOT, 'pl1code', 'simple.pli')
+
+SCRIPTS = {
+    'cold': "import plithon\n"
+            "plithon._parser_tables = plithon.generate_parser_tables()\n"
+            "assert plithon.transpile(open(%r).read()).ok\n" % SAMPLE,
+    'warm': "import plithon\n"
+            "assert plithon.load_parser_tables() is not None\n"
+            "assert plithon.transpile(open(%r).read()).ok\n" % SAMPLE,
+}
+
+def run(script):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', script], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = [run("pass") for _ in range(runs)]
+    print(f"interpreter only: median {statistics.median(baseline) * 1000:7.1f} ms")
+    results = {}
+    for mode, script in SCRIPTS.items():
+        times = [run(script) for _ in range(runs)]
+        results[mode] = statistics.median(times)
+        print(f"{mode:16s}: median {results[mode] * 1000:7.1f} ms, "
+              f"min {min(times) * 1000:7.1f} ms ({runs} runs)")
+    print(f"speedup warm vs cold: {results['cold'] / results['warm']:.1f}x")
+
+if __name__ == '__main__':
+    main()
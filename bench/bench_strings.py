@@ -0,0 +1,123 @@
+# CHAR(n) VARYING concatenation in a loop and SUBSTR, microbenchmarks
+#
+#   generated: the code plithon emits - v += x; and a length check, SUBSTR
+#              is a str slice
+#   rebuild  : v = (v + x)[:n]; - correct, but copies v on every append
+#   bytearray: a preallocated bytearray per variable, appended in place and
+#              decoded when the value is used
+#
+# Usage: python bench/bench_strings.py [appends]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+
+CONCAT = """
+prog: proc options(main);
+dcl v char({size}) varying;
+dcl i fixed bin(31);
+v = '';
+i = 0;
+do while(i < {count});
+  v = v || 'ab';
+  i = i + 1;
+end;
+put skip list(v);
+end prog;
+"""
+
+SUBSTR = """
+prog: proc options(main);
+dcl v char({size});
+dcl s char(8) varying;
+dcl i fixed bin(31);
+dcl n fixed bin(31);
+v = 'RECORD 0123456789 ABCDEFGHIJ';
+n = 0;
+i = 0;
+do while(i < {count});
+  s = substr(v, 8, 4);
+  if s = '0123' then n = n + 1; else n = n;
+  i = i + 1;
+end;
+put skip list(n);
+end prog;
+"""
+
+class Varying(bytearray):
+    """CHAR(n) VARYING in a preallocated bytearray."""
+    __slots__ = ('size',)
+
+    def __init__(self, size):
+        super().__init__()
+        self.size = size
+
+    def append(self, value):
+        self += value.encode('latin-1')
+        if len(self) > self.size:
+            del self[self.size:]
+
+    def substr(self, start, length):
+        return self[start - 1:start - 1 + length].decode('latin-1')
+
+def rebuild_concat(size, count):
+    v = ''
+    for i in range(count):
+        v = (v + 'ab')[:size]
+    return v
+
+def bytearray_concat(size, count):
+    v = Varying(size)
+    for i in range(count):
+        v.append('ab')
+    return v.decode('latin-1')
+
+def bytearray_substr(size, count):
+    v = Varying(size)
+    v.append('RECORD 0123456789 ABCDEFGHIJ')
+    n = 0
+    for i in range(count):
+        if v.substr(8, 4) == '0123':
+            n = n + 1
+    return n
+
+def program_function(source, result):
+    """Translates the program; returns its function (returning result instead of printing)."""
+    translation = plithon.transpile(source)
+    assert translation.ok, translation.errors
+    namespace = {}
+    exec(compile(translation.code.replace(f"print({result})", f"return {result}"), '<bench>', 'exec'),
+         namespace)
+    return namespace['prog']
+
+def timed(func, *args):
+    best, value = None, None
+    for run in range(3):
+        start = time.perf_counter()
+        value = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    size = 2 * count
+    print(f"{count} appends of 2 characters to a CHAR({size}) VARYING")
+    generated, expected = timed(program_function(CONCAT.format(size=size, count=count), 'v'))
+    print(f"generated: {generated * 1000:9.1f} ms")
+    for label, func in (('rebuild  ', rebuild_concat), ('bytearray', bytearray_concat)):
+        elapsed, value = timed(func, size, count)
+        assert value == expected
+        print(f"{label}: {elapsed * 1000:9.1f} ms ({elapsed / generated:.1f}x the time)")
+    print(f"{count} SUBSTR(v, 8, 4) of a CHAR(100) and compare")
+    generated, expected = timed(program_function(SUBSTR.format(size=100, count=count), 'n'))
+    print(f"generated: {generated * 1000:9.1f} ms")
+    elapsed, value = timed(bytearray_substr, 100, count)
+    assert value == expected
+    print(f"bytearray: {elapsed * 1000:9.1f} ms ({elapsed / generated:.1f}x the time)")
+
+if __name__ == '__main__':
+    main()
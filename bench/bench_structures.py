@@ -0,0 +1,224 @@
+# Structures against SUBSTR slicing of a CHAR record
+#
+#   substr   : READ INTO(line) of a CHAR variable as long as the record, the
+#              fields cut out with SUBSTR into CHAR / FIXED variables
+#   structure: READ INTO(rec) of a structure with the same layout, the fields
+#              unpacked by its struct layout straight from the read buffer
+#   mmap     : both with OPEN ... RECSIZE(n) MMAP (SUBSTR decodes only the
+#              substring, the structure unpacks from the mapped bytes)
+#
+# Kernels:
+#   names  : 80-byte records of five CHAR fields, two of them compared
+#   amounts: a name and an amount - in the structure a FIXED DEC(9,2) as
+#            binary int, in the CHAR record as 10 digits converted by the
+#            assignment to a FIXED DEC variable
+#   access : no I/O - a field of a structure, a CHAR scalar and a SUBSTR of a
+#            CHAR scalar compared in a loop
+#
+# The structure pays where a record holds numbers: unpacking a binary int
+# is far cheaper than converting digits (amounts, about 2.9x). A READ of a
+# CHAR record is a step of a C iterator over the decoded buffer, a READ INTO
+# a structure calls read_into() and the generated _unpack_from(), which
+# slices every field: for all-CHAR records of which only some fields are
+# used, SUBSTR of the CHAR record stays faster (names). A field is an
+# attribute of the structure, its access a little slower than a local.
+#
+# Usage: python bench/bench_structures.py [records]
+import os
+import sys
+import tempfile
+import time
+from struct import Struct
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+
+NAMES_SUBSTR = """
+prog: proc options(main);
+dcl line char(80);
+dcl family_name char(20);
+dcl city char(20);
+dcl eof fixed bin(15);
+dcl n fixed bin(31);
+eof = 0;
+n = 0;
+on endfile({file}) eof = 1;
+open file('{file}') input recsize(80) {options};
+read file('{file}') into(line);
+do while(eof = 0);
+  family_name = substr(line, 21, 20);
+  city = substr(line, 41, 20);
+  if city = 'Berlin' then n = n + 1; else n = n;
+  if family_name = 'Miller' then n = n + 1; else n = n;
+  read file('{file}') into(line);
+end;
+close file('{file}');
+put skip list(n);
+end prog;
+"""
+
+NAMES_STRUCTURE = """
+prog: proc options(main);
+dcl 1 rec,
+      2 first_name char(20),
+      2 family_name char(20),
+      2 city char(20),
+      2 zip char(10),
+      2 dummy char(10);
+dcl eof fixed bin(15);
+dcl n fixed bin(31);
+eof = 0;
+n = 0;
+on endfile({file}) eof = 1;
+open file('{file}') input recsize(80) {options};
+read file('{file}') into(rec);
+do while(eof = 0);
+  if rec.city = 'Berlin' then n = n + 1; else n = n;
+  if rec.family_name = 'Miller' then n = n + 1; else n = n;
+  read file('{file}') into(rec);
+end;
+close file('{file}');
+put skip list(n);
+end prog;
+"""
+
+AMOUNTS_SUBSTR = """
+prog: proc options(main);
+dcl line char(30);
+dcl amount fixed dec(9,2);
+dcl total fixed dec(15,2);
+dcl eof fixed bin(15);
+eof = 0;
+total = 0;
+on endfile({file}) eof = 1;
+open file('{file}') input recsize(30) {options};
+read file('{file}') into(line);
+do while(eof = 0);
+  amount = substr(line, 21, 10);
+  total = total + amount;
+  read file('{file}') into(line);
+end;
+close file('{file}');
+put skip list(total);
+end prog;
+"""
+
+AMOUNTS_STRUCTURE = """
+prog: proc options(main);
+dcl 1 rec,
+      2 name char(20),
+      2 amount fixed dec(9,2);
+dcl total fixed dec(15,2);
+dcl eof fixed bin(15);
+eof = 0;
+total = 0;
+on endfile({file}) eof = 1;
+open file('{file}') input recsize(24) {options};
+read file('{file}') into(rec);
+do while(eof = 0);
+  total = total + rec.amount;
+  read file('{file}') into(rec);
+end;
+close file('{file}');
+put skip list(total);
+end prog;
+"""
+
+ACCESS = """
+prog: proc options(main);
+dcl 1 rec,
+      2 first_name char(20),
+      2 city char(20);
+dcl city char(20);
+dcl line char(40);
+dcl i fixed bin(31);
+dcl n fixed bin(31);
+n = 0;
+rec.city = 'Berlin';
+city = 'Berlin';
+line = 'John                Berlin';
+do i = 1 to {count};
+  if {operand} = 'Berlin' then n = n + 1; else n = n;
+end;
+put skip list(n);
+end prog;
+"""
+
+CITIES = ['Berlin', 'Hamburg', 'Munich', 'Cologne']
+FAMILY_NAMES = ['Miller', 'Smith', 'Jones', 'Brown', 'Taylor']
+
+def write_names(count):
+    with open('names.txt', 'w', encoding='latin-1') as file:
+        for n in range(count):
+            file.write(f"{'John':20}{FAMILY_NAMES[n % 5]:20}{CITIES[n % 4]:20}{n % 100000:<10}{'':10}")
+
+def write_amounts(count):
+    """amounts.txt with the amounts as text, binary.txt with the records of the structure."""
+    layout = Struct('>20si')
+    with open('amounts.txt', 'w', encoding='latin-1') as text, open('binary.txt', 'wb') as binary:
+        for n in range(count):
+            cents = n % 100000
+            text.write(f"{'customer':20}{cents / 100:10.2f}")
+            binary.write(layout.pack(b'customer'.ljust(20), cents))
+
+def program_function(source, result):
+    """Translates the program; returns its function (returning the result instead of printing)."""
+    translated = plithon.transpile(source)
+    assert translated.ok, translated.errors
+    namespace = {}
+    code = translated.code.replace(f"print({result})", f"return {result}").replace(
+        f"print(decimal_text({result}, 2))", f"return {result}")
+    exec(compile(code, '<bench>', 'exec'), namespace)
+    return namespace['prog']
+
+def timed(funcs):
+    """Seconds of one call of each function, the best of five (taking turns)."""
+    best = [None] * len(funcs)
+    values = set()
+    for round in range(5):
+        for n, func in enumerate(funcs):
+            start = time.perf_counter()
+            values.add(func())
+            elapsed = time.perf_counter() - start
+            best[n] = elapsed if best[n] is None else min(best[n], elapsed)
+    assert len(values) == 1, values
+    return best
+
+def compare(label, count, variants):
+    """variants: (name, source, result name)."""
+    print(f"{label}: {count} records")
+    times = timed([program_function(source, result) for name, source, result in variants])
+    for (name, source, result), elapsed in zip(variants, times):
+        print(f"  {name:16}: {count / elapsed:12,.0f} records/s {elapsed / count * 1e9:8.0f} ns"
+              f"  {times[0] / elapsed:5.2f}x")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            write_names(count)
+            write_amounts(count)
+            compare('names', count, [
+                (name, source.format(file='names', options=options), 'n')
+                for name, source, options in (('substr', NAMES_SUBSTR, ''),
+                                              ('structure', NAMES_STRUCTURE, ''),
+                                              ('substr mmap', NAMES_SUBSTR, 'mmap'),
+                                              ('structure mmap', NAMES_STRUCTURE, 'mmap'))])
+            compare('amounts', count, [
+                (name, source.format(file=file, options=options), 'total')
+                for name, source, file, options in (('substr', AMOUNTS_SUBSTR, 'amounts', ''),
+                                                    ('structure', AMOUNTS_STRUCTURE, 'binary', ''),
+                                                    ('substr mmap', AMOUNTS_SUBSTR, 'amounts', 'mmap'),
+                                                    ('structure mmap', AMOUNTS_STRUCTURE, 'binary', 'mmap'))])
+            compare('access', count * 4, [
+                (name, ACCESS.format(count=count * 4, operand=operand), 'n')
+                for name, operand in (('substr', 'substr(line, 21, 20)'), ('scalar', 'city'),
+                                      ('field', 'rec.city'))])
+        finally:
+            os.chdir(cwd)
+
+if __name__ == '__main__':
+    main()
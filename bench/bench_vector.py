@@ -0,0 +1,84 @@
+# Whole-array assignment and arithmetic versus the DO WHILE loop form
+#
+#   loops      : t(i,j) = 1; u(i,j) = t(i,j) * 3 + 1; s = s + u(i,j); for all i, j
+#   array numpy: t = 1; u = t * 3 + 1; s = sum(u);   (NumPy installed)
+#   array loop : the same without NumPy (generated element loops)
+#
+# Usage: python bench/bench_vector.py [n]
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_runtime import vector
+
+DECLARE = """
+prog: proc options(main);
+dcl t({n},{n}) fixed bin(31);
+dcl u({n},{n}) fixed bin(31);
+dcl i fixed bin(31);
+dcl j fixed bin(31);
+dcl s fixed bin(31);
+"""
+
+LOOPS = """
+s = 0;
+i = 1;
+do while(i <= {n});
+  j = 1;
+  do while(j <= {n});
+    t(i,j) = 1;
+    u(i,j) = t(i,j) * 3 + 1;
+    s = s + u(i,j);
+    j = j + 1;
+  end;
+  i = i + 1;
+end;
+put skip list(s);
+end prog;
+"""
+
+ARRAYS = """
+t = 1;
+u = t * 3 + 1;
+s = sum(u);
+put skip list(s);
+end prog;
+"""
+
+def program_function(source, numpy=True):
+    """Translates the PL/I program; returns its function (returning s instead of printing)."""
+    result = plithon.transpile(source)
+    assert result.ok, result.errors
+    namespace = {}
+    exec(compile(result.code.replace("print(s)", "return s"), '<bench>', 'exec'), namespace)
+    namespace['NUMPY'] = numpy and vector.NUMPY
+    return namespace['prog']
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return time.perf_counter() - start, value
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    loops = program_function((DECLARE + LOOPS).format(n=n))
+    arrays = program_function((DECLARE + ARRAYS).format(n=n))
+    arrays_fallback = program_function((DECLARE + ARRAYS).format(n=n), numpy=False)
+    print(f"{n}x{n} fill, arithmetic and sum")
+    loop_time, expected = timed(loops)
+    print(f"loops      : {loop_time:8.3f} s")
+    if vector.NUMPY:
+        elapsed, value = timed(arrays)
+        assert value == expected
+        print(f"array numpy: {elapsed:8.3f} s ({loop_time / elapsed:.0f}x faster)")
+    else:
+        print("array numpy: NumPy not installed")
+    elapsed, value = timed(arrays_fallback)
+    assert value == expected
+    print(f"array loop : {elapsed:8.3f} s ({loop_time / elapsed:.1f}x faster)")
+
+if __name__ == '__main__':
+    main()
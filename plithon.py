@@ -24,35 +24,94 @@
 #   - mySql parameters (host,user,password,DB-name) are read from a local file 
 #   - several minor error corrections
 # =============================================================================
+# New features in 1.10:
+#   - batch mode: python plithon.py <files|globs|dirs> -o <outdir> -j <workers>
+#   - library interface: transpile(source), Transpiler (no import side effects)
+#   - pre-generated parse tables in plithon_tables (--build-tables)
+#   - optional trace of the grammar rules (Tracer, --trace)
+#   - the grammar rules build an AST (plithon_ast.py), the Python code is
+#     generated in one pass by plithon_codegen.py
+#   - cache of translated and compiled programs (plithon_cache.py, --cache-dir)
+#   - watch mode: re-translates only the edited statements of saved files
+#     (plithon_incremental.py, --watch)
+#   - declared arrays are flat typed buffers (plithon_runtime/arrays.py):
+#     array('h'/'i') for FIXED BIN, a bytearray for CHAR(n)
+#   - whole-array assignment and arithmetic (a = 0; a = b + c;) and SUM(a),
+#     with NumPy if it is installed (plithon_runtime/vector.py)
+#   - EXEC SQL uses one shared connection and a prepared cursor per statement
+#     (plithon_runtime/sql.py); host variables (:name) are bound as parameters
+#   - the SQL connection parameters are read from --sql-config, the
+#     environment or c:/temp/creds.txt (plithon_config.py) when the program
+#     connects; the generated module refers to them (SQL_CONNECTION)
+#   - SQL cursors: exec sql declare c cursor for "select ..."; open, fetch,
+#     close; FETCH INTO arrays fetches many rows at once
+#   - DECLARE is accepted for DCL
+#   - record I/O through plithon_runtime/records.py: large buffers, fixed-length
+#     records (OPEN ... RECSIZE(n)) and ON ENDFILE(file) instead of a blank
+#     record as end-of-file sentinel
+#   - OPEN ... RECSIZE(n) MMAP reads fixed-length records from a memory-mapped
+#     file, decoded only when they are used
+#   - OPEN ... BACKGROUND reads ahead / writes behind on a background thread
+#   - CHAR(n) is padded / truncated to n characters, CHAR(n) VARYING added;
+#     v = v || x; appends in place
+#   - FIXED BIN assignments raise FIXEDOVERFLOW and truncate quotients, the
+#     checks are left out where the value provably fits; FIXED DEC(p,q) as
+#     scaled ints and fixed-point constants like 1.05 (plithon_runtime/fixed.py)
+#   - optimization passes between parsing and code generation: constant
+#     folding, SELECT subject evaluated once, loop invariants hoisted out of
+#     DO WHILE, constant IF branches removed (plithon_optimize.py, --optimize)
+#   - SELECT with many constant WHEN values dispatches through a dict
+#   - counted DO (do i = a to b [by c];) as a for loop over range() where
+#     possible, DO UNTIL(cond)
+#   - the generated modules import the versioned plithon_runtime package once
+#     and bind the runtime names to locals; GET LIST through
+#     plithon_runtime/stream.py
+#   - structures (dcl 1 s, 2 field type, ...;) as generated classes with
+#     __slots__ and a struct layout; READ INTO / WRITE FROM map records to
+#     the fields (plithon_runtime/structures.py)
+#   - KEYED files (OPEN ... INPUT|OUTPUT|UPDATE KEYED; READ ... KEY(k);
+#     WRITE ... KEYFROM(k); REWRITE; DELETE; ON KEY) indexed by an SQLite
+#     B-tree (plithon_runtime/keyed.py)
+#   - CALL PLISRTA(sort, record, storage, rc); an external merge sort of
+#     SORTIN into SORTOUT within a memory budget, also on the command line
+#     (python -m plithon_runtime.sort, plithon_runtime/sort.py)
+#   - the generated modules map their lines back to the PL/I lines
+#     (SOURCE_MAP); -r --profile reports the time and count of every PL/I
+#     statement and DO loop (plithon_profile.py)
 # ============================================================================= 
-# Open:
-#   define and read simple structures like this (long-term implementation):
-#   dcl 1 struc,
-#         2 first_name    char(30),
-#         2 family_name   char(30),
-#         2 salary        char(10),
-#         2 dummy         char(10);      
-# =============================================================================
 # Development environment is the Python Spyder IDE
 # ============================================================================= 
 
+__version__ = '1.10'
+
 # Now you can set up your PLY parser
 import ply.lex as lex
 import ply.yacc as yacc
 
+import plithon_ast as ast
+import plithon_codegen
+from plithon_codegen import CodeGenerator, CodeGenError
+from plithon_cache import ArtifactCache
+from plithon_config import SqlConfig
+import plithon_optimize
+from plithon_optimize import Optimizer, PASSES
+
 import sys, os
+import types
+import argparse
+import collections
+import concurrent.futures
+import copy
+import decimal
+import functools
+import glob
+import hashlib
+import importlib.util
+import linecache
+import time
 
 from datetime import datetime
 
-level=1
-
-# Getting the current date and time
-dt = datetime.now()
-
-# getting the timestamp
-ts = datetime.timestamp(dt)
-
-print('start at:', dt)
 # List of token names
 tokens = (
     'ID', 'NUMBER', 'CHAR_CONST', 'ASSIGN',
@@ -63,7 +122,10 @@ tokens = (
     'PROC', 'OPTIONS', 'MAIN', 'DCL', 'FIXED', 'BIN', 'CHAR',  
     'IF', 'THEN', 'ELSE', 'BLOCK_COMMENT', 'SUBSTR', 'CONCAT','DECIMAL','MOD',
     'EXEC', 'SQL', 'INTO', 'STRING', 'INDEX', 'GET',
-    'OPEN','CLOSE','READ','WRITE','FILE','FROM','MODE','INPUT','OUTPUT'
+    'OPEN','CLOSE','READ','WRITE','FILE','FROM','MODE','INPUT','OUTPUT',
+    'CURSOR','FOR','FETCH','ON','ENDFILE','VARYING','DEC_CONST',
+    'TO','BY','UNTIL',
+    'KEY','KEYFROM','REWRITE','DELETE','UPDATE','CALL'
 )
 
 # Regular expression rules for tokens
@@ -95,6 +157,7 @@ reserved = {
     'options': 'OPTIONS',
     'main': 'MAIN',
     'dcl': 'DCL',
+    'declare': 'DCL',
     'fixed': 'FIXED',
     'bin': 'BIN',
     'char': 'CHAR',
@@ -112,6 +175,9 @@ reserved = {
     'select': 'SELECT',
     'do': 'DO',
     'while': 'WHILE',  
+    'until': 'UNTIL',
+    'to': 'TO',
+    'by': 'BY',
     'substr': 'SUBSTR',  
     'index': 'INDEX',
     'mod': 'MOD',
@@ -127,25 +193,104 @@ reserved = {
     'output': 'OUTPUT',
     'from': 'FROM',
     'decimal': 'DECIMAL',
+    'dec': 'DECIMAL',
+    'cursor': 'CURSOR',
+    'for': 'FOR',
+    'fetch': 'FETCH',
+    'on': 'ON',
+    'endfile': 'ENDFILE',
+    'key': 'KEY',
+    'keyfrom': 'KEYFROM',
+    'rewrite': 'REWRITE',
+    'delete': 'DELETE',
+    'update': 'UPDATE',
+    'call': 'CALL',
 }
 
-# Disable print  
-def blockPrint():
-    sys.stdout = open(os.devnull, 'w')
+# =============================================================================
+# Trace of the grammar rules. Tracing is off unless a Tracer is given to the
+# Transpiler: the Tracer then wraps the rule functions of that one parser, so
+# the rules themselves contain no trace code and cost nothing when it is off.
+# =============================================================================
+TRACE_RULES = 1     # name of every reduced rule and its production
+TRACE_VALUES = 2    # additionally the values p[1:] and the result p[0]
+
+class Tracer:
+    """
+    Collects the trace of the grammar rules reduced while parsing.
+
+    Args:
+        level: TRACE_RULES or TRACE_VALUES.
+        rules: Optional names of the rules to trace, either the non-terminal
+            ('expression') or the function name ('p_expression').
+        file: File name or open file to write to (default: sys.stdout).
+        ring: Keep only the last `ring` lines in memory (see lines) instead
+            of writing them to a file.
+    """
 
-# Restore print 
-def enablePrint():
-    sys.stdout = sys.__stdout__
+    def __init__(self, level=TRACE_RULES, rules=None, file=None, ring=None):
+        self.level = level
+        self.rules = frozenset(rules) if rules else None
+        self.lines = collections.deque(maxlen=ring) if ring else None
+        self._owns_file = isinstance(file, str)
+        self._file = open(file, 'w') if self._owns_file else file
+
+    def wants(self, production):
+        """True if the rule of the production is traced."""
+        return (self.rules is None or production.name in self.rules
+                or production.func in self.rules)
+
+    def write(self, line):
+        """Writes one trace line to the ring buffer or the file."""
+        if self.lines is not None:
+            self.lines.append(line)
+        else:
+            print(line, file=self._file or sys.stdout)
+
+    def instrument(self, productions):
+        """Returns a copy of the productions with the traced rules wrapped."""
+        traced = []
+        for production in productions:
+            if production.callable is not None and self.wants(production):
+                production = copy.copy(production)
+                production.callable = self._wrap(production)
+            traced.append(production)
+        return traced
+
+    def _wrap(self, production):
+        rule = production.callable
+        name = production.func
+        text = production.str
+        write = self.write
+        if self.level >= TRACE_VALUES:
+            def traced_rule(p):
+                write(f"in {name}: {text}  values: {p[1:]}")
+                rule(p)
+                write(f"end {name}: {p[0]!r}")
+        else:
+            def traced_rule(p):
+                write(f"in {name}: {text}")
+                rule(p)
+        return traced_rule
 
-# Disable print for production version
-# blockPrint()
+    def close(self):
+        """Closes the trace file if the Tracer opened it."""
+        if self._owns_file:
+            self._file.close()
 
 # Identifiers (variables)
 def t_ID(t):
-    r'[a-zA-Z_][a-zA-Z_0-9]*'
+    r'[a-zA-Z_][a-zA-Z_0-9]*(\.[a-zA-Z_][a-zA-Z_0-9]*)?'
+    # a qualified name (structure.field) is one ID
     t.type = reserved.get(t.value.lower(), 'ID')  # Check for reserved words
     return t
 
+# Fixed-point decimal constants (1.05), kept exact
+def t_DEC_CONST(t):
+    r'\d+\.\d+'
+    t.value = decimal.Decimal(t.value)
+    return t
+
 # Numbers
 def t_NUMBER(t):
     r'\d+'
@@ -168,7 +313,8 @@ t_ignore = ' \t'
 # Block comment
 def t_BLOCK_COMMENT(t):
     r'/\*([^*]|\*+[^*/])*\*+/'
-    pass  # Block comments are ignored
+    # Block comments are ignored, but count their lines
+    t.lexer.lineno += t.value.count('\n')
 
 # Newline rule
 def t_newline(t):
@@ -177,89 +323,58 @@ def t_newline(t):
 
 # Error handling rule
 def t_error(t):
-    print(f"Illegal character '{t.value[0]}'")
+    t.lexer.errors.append(f"Illegal character '{t.value[0]}' in line {t.lexer.lineno}")
     t.lexer.skip(1)
     
 # Recognize string literals with single or double quotes
 #t_CHAR_CONST = r"\'([^\\']|\\.)*\'"   # Single-quoted strings
 t_STRING = r'\"([^\\"]|\\.)*\"'       # Double-quoted strings for SQL    
     
-# Build the lexer
-lexer = lex.lex()
-
+# The lexer is built on first use and cloned for every Transpiler
+_lexer = None
 
-def indent_block(code, level=1, is_function=False):
-    """
-    Creates a block of code with indentation based on the level and whether it's within a function.
-
-    Args:
-        code: The code string to be indented.
-        level: The indentation level (defaults to 1).
-        is_function: Whether the code is within a function definition (defaults to False).
+def lexer_template():
+    """Returns the lexer of this module, building it once per process."""
+    global _lexer
+    if _lexer is None:
+        _lexer = lex.lex(module=sys.modules[__name__], errorlog=lex.NullLogger())
+        _lexer.errors = []
+    return _lexer
 
-    Returns:
-        The indented code string.
-    """
-    indent = "  " * level    
-    lines = code.splitlines()
-    indented_lines = [] 
-    for line in lines:
-        indented_lines.append(indent + line)
-    return "\n".join(indented_lines)
 
 # Print parsing rules for trace
 def print_tokens(input_text):
+    lexer = lexer_template().clone()
     lexer.input(input_text)
     while True:
         token = lexer.token()
         if not token:
             break
         print(token)
-    
+
+# =============================================================================
+# Grammar rules: every rule builds AST nodes (see plithon_ast.py), the Python
+# code is generated afterwards from the complete Program (plithon_codegen.py)
+# =============================================================================
+def as_body(stmt):
+    """Returns the statement list of a DO-group, or the single statement as list."""
+    if isinstance(stmt, ast.Block):
+        return stmt.body
+    if isinstance(stmt, list):
+        return stmt
+    return [stmt] if stmt is not None else []
+
 # PL/I program: progname:proc options(main);<declares> <execs> end progname;
 def p_program(p):
     '''program : procedure_header declaration_list statement_list END ID SEMICOLON'''
-    print('in program:', f"p[:] values: {p[:]}", flush=True)
-    # Extract the procedure name from the ID token (which is the fifth element in p)
-    procedure_name = p[5]
-    
-    # Combine the procedure header, declarations, and the list of statements
-    # Declaration list and statement list are both lists, so they should be joined properly
-    declarations = "\n".join(p[2]) if p[2] else ""
-    declarations = indent_block(declarations, 2)
-    statements = "\n".join(p[3]) if p[3] else ""
-    statements = indent_block(statements, 2)
-    
-    # The main function code, including the call to the procedure itself in the if __name__ block
-    p[0] = f"{p[1]}\n{declarations}\n{statements}\nif __name__ == '__main__':\n    {procedure_name}()"
-    p[0] = indent_block(p[0], level=0, is_function=True) 
-    
-    print('end program:\n', p[0], flush=True)    
+    p[0] = ast.Program(p[1], p[2], p[3])
+    p[0].lineno = p.lineno(1)
 
 # Procedure header and its syntax
 def p_procedure_header(p):
     '''procedure_header : ID COLON PROC OPTIONS LPAREN MAIN RPAREN SEMICOLON'''
-    print('in procedure_header', f"p[:] values: {p[:]}", flush=True)
-    p[0] = f"def {p[1]}():"
-    print('in procedure_header result:', f"p[:] values: {p[:]}", flush=True)
-    
-# def p_variable_access(p):
-#     '''variable_access : ID LPAREN NUMBER COMMA NUMBER RPAREN
-#                        | ID LPAREN ID COMMA ID RPAREN
-#                        | ID LPAREN NUMBER RPAREN
-#                        | ID LPAREN ID RPAREN
-#                        | ID'''
-#     print('in variable_access', f"p[:] values: {p[:]}", flush=True)                    
-#     if len(p) == 7:  # Two-dimensional array access
-#         p[0] = f"{p[1]}[{p[3] - 1}][{p[5] - 1}]"  # Adjust indices for 0-based indexing
-#     elif len(p) == 5:  # One-dimensional array access or variable access
-#         if isinstance(p[3], int):
-#             p[0] = f"{p[1]}[{p[3] - 1}]"
-#         else:
-#             p[0] = f"{p[1]}[{p[3]}]"  # Assume variable index without adjustment
-#     else:
-#         p[0] = p[1]
-#     print('end variable_access:', p[0], flush=True)  
+    p[0] = p[1]
+    p.set_lineno(0, p.lineno(1))
 
 def p_variable_access(p):
     """
@@ -270,56 +385,22 @@ def p_variable_access(p):
                    | ID LPAREN ID RPAREN
                    | ID                          
     """   
-     
-    #| ID LPAREN NUMBER COMMA NUMBER RPAREN ASSIGN expression  
-    print('in variable_access', f"p[:] values: {p[:]}", flush=True) 
-    print('len(p)', len(p), flush=True) 
-    if len(p) == 7:  # Two-dimensional array access or assignment
-        print('p[1]:', p[1], flush=True) 
-        print('p[2]:', p[2], flush=True) 
-        print('p[3]:', p[3], flush=True) 
-        print('p[4]:', p[4], flush=True) 
-        print('p[5]:', p[5], flush=True) 
-        print('p[6]:', p[6], flush=True) 
-        # print('p[7]:', p[7], flush=True)
-        
-        if len(p) == 7:  # Assignment
-            # Handle integer indices with adjustment
-            if isinstance(p[3], int) and isinstance(p[5], int):
-                print('case(1)', flush=True) 
-                #p[0] = f"{p[1]}[{p[3] - 1}][{p[5] - 1}] = {p[7]}"
-                p[0] = f"{p[1]}[{p[3]}][{p[5]}]"
-            # Check if ID with NUMBER pattern
-            elif isinstance(p[3], str) and isinstance(p[5], int):
-                print('case(1) - ID with NUMBER', flush=True)
-                p[0] = f"{p[1]}[{p[3]}][{p[5]}]"  # Handle variable and integer index    
-            else:
-                # Handle variable indices (no adjustment)
-                print('case(2)', flush=True) 
-                # p[0] = f"{p[1]}[{p[3]}][{p[5]}] = {p[7]}"
-                p[0] = f"{p[1]}[{p[3]}][{p[5]}]"
-                
-        else:  # Access
-            # Handle integer indices with adjustment
-            if isinstance(p[3], int) and isinstance(p[5], int):
-                print('case(3)', flush=True) 
-                p[0] = f"{p[1]}[{p[3]}][{p[5]}]"
-            else:
-                # Handle variable indices (no adjustment)
-                print('case(4)', flush=True) 
-                p[0] = f"{p[1]}[{p[3]}][{p[5]}]"
-                
-                
-    elif len(p) == 5:  # One-dimensional array access or variable access or assignment
-        p[0] = f"{p[1]}[{p[3]}]"                             
+    if len(p) == 7:  # Two-dimensional array element
+        p[0] = ast.Subscript(p[1], [index_node(p[3]), index_node(p[5])])
+    elif len(p) == 5:  # One-dimensional array element
+        p[0] = ast.Subscript(p[1], [index_node(p[3])])
     else:
-        p[0] = p[1]
-    print('end variable_access:', p[0], flush=True)      
+        p[0] = ast.Var(p[1])
+    # the line of an assignment is that of its target
+    p.set_lineno(0, p.lineno(1))
+
+def index_node(index):
+    """Array indexes are NUMBER or ID tokens."""
+    return ast.Num(index) if isinstance(index, int) else ast.Var(index)
     
 def p_declaration_list(p):
     '''declaration_list : declaration_list declaration SEMICOLON
                         | declaration SEMICOLON'''
-    print('in declaration_list:', f"p[:] values: {p[:]}", flush=True)
     if len(p) == 4:
         p[0] = p[1] + [p[2]]
     else:
@@ -329,68 +410,45 @@ def p_declaration_list(p):
 def p_declaration(p):
     '''declaration : DCL id_list type_declaration
                    | DCL id_list array_spec type_declaration'''
-    print('in declaration:', f"p[:] values: {p[:]}", flush=True)
-    decls = []
     if len(p) == 4:  # Scalar declaration
-        typ = p[3].upper()
-        for var in p[2]:
-            if "FIXED BIN" in typ:
-                decls.append(f"{var} = 0")
-            elif "CHAR" in typ:
-                decls.append(f"{var} = ''")  # Initialize CHAR variables as empty strings
-    elif len(p) == 5:  # Array declaration
-        typ = p[4].upper()
-        print('typ:', typ, flush=True)
-        if isinstance(p[3], int):  # Check if size is an integer (one-dimensional)
-            array_dims = (p[3],)  # Convert size to a tuple
-        else:  # Assuming p[3] is a tuple for two-dimensional arrays
-            array_dims = p[3]
-        print('array_dims:', array_dims, flush=True)
-
-        for var in p[2]:
-            if "FIXED BIN" in typ:
-                if len(array_dims) == 1:
-                    decls.append(f"{var} = [0] * {array_dims[0] + 2}")
-                    # Initialize the first element of the array
-                    decls.append(f"{var}[0] = 0 #pseudo-init")
-                elif len(array_dims) == 2:
-                    decls.append(f"{var} = [[0] * {array_dims[1] + 2} for _ in range({array_dims[0] + 2})]")
-                    # Initialize the first element of the 2D array
-                    decls.append(f"{var}[0][0] = 0 #pseudo-init")
-            elif "CHAR" in typ:
-                if len(array_dims) == 1:
-                    decls.append(f"{var} = [''] * {array_dims[0] + 2}")
-                    # Initialize the first element of the array
-                    decls.append(f"{var}[0] = '' #pseudo-init")
-                elif len(array_dims) == 2:
-                    decls.append(f"{var} = [[''] * {array_dims[1] + 2} for _ in range({array_dims[0] + 2})]")
-                    # Initialize the first element of the 2D array
-                    decls.append(f"{var}[0][0] = '' #pseudo-init")
-                    
-    p[0] = "\n".join(decls)
-    print('end declaration:', p[0], flush=True)
-
+        dims = None
+        typ = p[3]
+    else:  # Array declaration
+        dims = p[3] if isinstance(p[3], tuple) else (p[3],)
+        typ = p[4]
+    items = [item if isinstance(item, tuple) else (item, dims) for item in p[2]]
+    p[0] = ast.Declare(items, typ)
+    p[0].lineno = p.lineno(1)
+
+def p_structure_declaration(p):
+    '''declaration : DCL NUMBER ID COMMA field_list'''
+    # dcl 1 name, 2 field type, ...; - the levels are checked by the code generator
+    p[0] = ast.Structure(p[2], p[3], p[5])
+    p[0].lineno = p.lineno(1)
+
+def p_field_list(p):
+    '''field_list : NUMBER ID type_declaration
+                  | field_list COMMA NUMBER ID type_declaration'''
+    if len(p) == 4:
+        p[0] = [(p[1], p[2], p[3])]
+    else:
+        p[0] = p[1] + [(p[3], p[4], p[5])]
 
 def p_id_list(p):
     '''id_list : ID
                | id_list COMMA ID
                | id_list COMMA ID array_spec'''
-    print('in id_list:', f"p[:] values: {p[:]}", flush=True)             
     if len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 4:  # ID or array spec list (comma separated)
         p[0] = p[1] + [p[3]]
-    elif len(p) == 5:  # Handle array spec as part of id_list
-        p[0] = p[1] + [f"{p[3]}({p[4]})"]
-
-# def p_array_spec(p):
-#     '''array_spec : LPAREN NUMBER RPAREN'''
-#     p[0] = p[2]  # The array size
+    elif len(p) == 5:  # Array spec of this name only
+        dims = p[4] if isinstance(p[4], tuple) else (p[4],)
+        p[0] = p[1] + [(p[3], dims)]
     
 def p_array_spec(p):
     '''array_spec : LPAREN NUMBER RPAREN
                  | LPAREN NUMBER COMMA NUMBER RPAREN'''
-    print('in array_spec:', f"p[:] values: {p[:]}", flush=True)               
     if len(p) == 4:
         p[0] = (p[2])  # One-dimensional array
     elif len(p) == 6:
@@ -398,37 +456,27 @@ def p_array_spec(p):
     
 def p_type_declaration(p):
     '''type_declaration : FIXED BIN LPAREN NUMBER RPAREN
-                        | CHAR LPAREN NUMBER RPAREN'''
-    print('in type_declaration:', f"p[:] values: {p[:]}", flush=True)                    
-    if len(p) == 6:  # FIXED BIN(n)
-        p[0] = f"{p[1]} {p[2]}({p[4] + 2})" #additional dummy first entry!
-    elif p[1].lower() == 'char':  # CHAR(n)
-        p[0] = f"{p[1]}({p[3]})"
-
-
-# def p_id_list(p):
-#     '''id_list : ID
-#                | id_list ',' ID'''
-#     if len(p) == 2:
-#         p[0] = [p[1]]
-#     else:
-#         p[0] = p[1] + [p[3]]
+                        | FIXED DECIMAL LPAREN NUMBER RPAREN
+                        | FIXED DECIMAL LPAREN NUMBER COMMA NUMBER RPAREN
+                        | CHAR LPAREN NUMBER RPAREN
+                        | CHAR LPAREN NUMBER RPAREN VARYING'''
+    if p[1].lower() == 'fixed' and p.slice[2].type == 'BIN':  # FIXED BIN(n)
+        p[0] = ast.Type('bin', p[4], False)
+    elif p[1].lower() == 'fixed':  # FIXED DEC(p[,q])
+        p[0] = ast.Type('dec', (p[4], p[6] if len(p) == 8 else 0), False)
+    else:  # CHAR(n) [VARYING]
+        p[0] = ast.Type('char', p[3], len(p) == 6)
 
 def p_statement_list(p):
     '''statement_list : statement_list statement  
                       | statement     
                       | empty'''
-    print('in statement_list:', f"p[:] values: {p[:]} (len: {len(p)})", flush=True)
-    
     if len(p) == 3:  # Recursive case: multiple statements
-        if isinstance(p[1], list):
-            p[0] = p[1] + ([p[2]] if p[2] else [])
-        else:
-            p[0] = [p[1]] + ([p[2]] if p[2] else [])
+        p[0] = p[1]
+        if p[2] is not None:
+            p[0].append(p[2])
     else:
-        p[0] = [p[1]] if p[1] else []
-    
-    print('end statement_list:', p[0], flush=True)
+        p[0] = [p[1]] if p[1] is not None else []
 
 def p_empty(p):
     'empty :'
@@ -437,11 +485,23 @@ def p_empty(p):
        
 # Define the rule to handle 'write file from' statements
 def p_write_file(p):
-    '''write_file : WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON'''
-    print('in write:', f"p[:] values: {p[:]}", flush=True)
-    fname = p[4].replace("'", "")                
-    p[0] = f"{fname}.write({p[8]} + '\\n')"
-    print('end write:', p[0])      
+    '''write_file : WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON
+                  | WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN KEYFROM LPAREN expression RPAREN SEMICOLON'''
+    p[0] = ast.Write(file_name(p[4]), ast.Var(p[8]), p[12] if len(p) == 15 else None)
+    p[0].lineno = p.lineno(1)
+
+# Define the rules to handle the statements of KEYED files
+def p_rewrite_file(p):
+    '''rewrite_file : REWRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON
+                    | REWRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN KEY LPAREN expression RPAREN SEMICOLON'''
+    p[0] = ast.Rewrite(file_name(p[4]), ast.Var(p[8]), p[12] if len(p) == 15 else None)
+    p[0].lineno = p.lineno(1)
+
+def p_delete_file(p):
+    '''delete_file : DELETE FILE LPAREN CHAR_CONST RPAREN SEMICOLON
+                   | DELETE FILE LPAREN CHAR_CONST RPAREN KEY LPAREN expression RPAREN SEMICOLON'''
+    p[0] = ast.Delete(file_name(p[4]), p[8] if len(p) == 11 else None)
+    p[0].lineno = p.lineno(1)
 
 def p_statement(p):    
     '''statement : assignment_statement  
@@ -449,6 +509,8 @@ def p_statement(p):
                  | if_statement
                  | select_statement
                  | do_while_statement
+                 | do_until_statement
+                 | do_loop_statement
                  | do_end_block
                  | put_statement
                  | get_list_statement
@@ -456,24 +518,23 @@ def p_statement(p):
                  | open_file
                  | read_file
                  | write_file
+                 | rewrite_file
+                 | delete_file
                  | close_file                
+                 | on_endfile
+                 | on_key
+                 | call_statement
                  | sql_statement'''             
-                  
-    print('in statement:', f"p[:] values: {p[:]}", flush=True)             
     p[0] = p[1]
-    print('end statement:', p[0], flush=True) 
     
 def p_block_comment_statement(p):
     '''block_comment_statement : BLOCK_COMMENT'''
-    print('in block_comment_statement:', f"p[:] values: {p[:]}", flush=True)
-    p[0] = "#" + p[0]
+    p[0] = ast.Comment(p[1][2:-2].strip())
 
 def p_assignment_statement(p):
     '''assignment_statement : variable_access ASSIGN expression SEMICOLON'''
-    print('in assignment:', f"p[:] values: {p[:]}", flush=True)
-    print('in assignment,length:', len(p), flush=True)
-    p[0] = f"{p[1]} = {p[3]}"
-    print('end assignment:', p[0], flush=True)
+    p[0] = ast.Assign(p[1], p[3])
+    p[0].lineno = p.lineno(1)
 
 def p_expression(p):
     '''expression : expression PLUS expression
@@ -482,88 +543,71 @@ def p_expression(p):
                   | expression DIVIDE expression
                   | LPAREN expression RPAREN
                   | NUMBER
+                  | DEC_CONST
                   | CHAR_CONST
                   | SUBSTR
                   | MOD
                   | INDEX
                   | DECIMAL
                   | variable_access'''
-    print('in expression:', f"p[:] values: {p[:]}", flush=True)
-    print('in expression,length:', len(p), flush=True)   
-          
     if len(p) == 2:
-        # This handles single ID or NUMBER tokens
-        p[0] = p[1]
+        # single NUMBER, CHAR_CONST or variable
+        token = p.slice[1].type
+        if token in ('NUMBER', 'DEC_CONST'):
+            p[0] = ast.Num(p[1])
+        elif token == 'CHAR_CONST':
+            p[0] = ast.Str(char_const(p[1]))
+        elif token == 'variable_access':
+            p[0] = p[1]
+        else:  # builtin name used as a variable
+            p[0] = ast.Var(p[1])
     elif len(p) == 4 and p[1] == '(':
         # This handles expressions in parentheses
-        p[0] = f"({p[2]})"
+        p[0] = p[2]
     else:
         # This handles binary operations like PLUS, MINUS, etc.
-        p[0] = f"({p[1]} {p[2]} {p[3]})"
-    print('end expression:', p[0], flush=True)    
+        p[0] = ast.BinOp(p[2], p[1], p[3])
+
+def char_const(token):
+    """Value of a CHAR_CONST token: without the quotes, '' stands for one quote."""
+    return token[1:-1].replace("''", "'")
+
+def file_name(token):
+    """File name of a FILE('name') clause."""
+    return token.replace("'", "")
         
 def p_expression_substr(p):
     '''expression : SUBSTR LPAREN ID COMMA NUMBER COMMA NUMBER RPAREN
                   | SUBSTR LPAREN ID COMMA NUMBER RPAREN'''
-    print('in substr:', f"p[:] values: {p[:]}", flush=True)              
     if len(p) == 9:  # SUBSTR with start and length
-        start = p[5] - 1  # PL/I starts at 1, Python starts at 0
-        length = p[7]
-        p[0] = f"{p[3]}[{start}:{start + length}]"
-    elif len(p) == 7:  # SUBSTR with only start
-        start = p[5] - 1
-        p[0] = f"{p[3]}[{start}:]"
-    print('end substr:', p[0], flush=True)    
+        p[0] = ast.Builtin('substr', [ast.Var(p[3]), ast.Num(p[5]), ast.Num(p[7])])
+    else:  # SUBSTR with only start
+        p[0] = ast.Builtin('substr', [ast.Var(p[3]), ast.Num(p[5])])
     
 def p_expression_mod(p):
     '''expression : MOD LPAREN ID COMMA NUMBER RPAREN'''
-    print('in mod:', f"p[:] values: {p[:]}", flush=True)              
-    p[0] = f"{p[3]}%{p[5]}"
-    print('end substr:', p[0], flush=True)        
+    p[0] = ast.Builtin('mod', [ast.Var(p[3]), ast.Num(p[5])])
         
 def p_expression_index(p):
     '''expression : INDEX LPAREN ID COMMA CHAR_CONST RPAREN'''    
-    print('in index:', f"p[:] values: {p[:]}", flush=True)              
-    p[0] = f"{p[3]}.find({p[5]}) + 1"   
-    print('end index:', p[0], flush=True)  
+    p[0] = ast.Builtin('index', [ast.Var(p[3]), ast.Str(char_const(p[5]))])
     
 def p_expression_decimal(p):
     '''expression : DECIMAL LPAREN ID RPAREN''' 
-    print('in decimal:', f"p[:] values: {p[:]}", flush=True)              
-    
-    # Convert the ID to a string using Python's str() function
-    p[0] = f"str({p[3]})"
-    
-    print('end decimal:', p[0], flush=True)
- 
+    p[0] = ast.Builtin('decimal', [ast.Var(p[3])])
         
 def p_if_statement(p):
     '''if_statement : IF relational_expression THEN statement ELSE statement   
                     | IF relational_expression THEN statement ELSE do_end_block
                     | IF relational_expression THEN do_end_block ELSE statement  
                     | IF relational_expression THEN do_end_block ELSE do_end_block'''
-    
-    print('in if_statement:', f"p[:] values: {p[:]}", flush=True)  
-    print('len:', len(p), flush=True)                
-    
-    # Check if p[4] (then block) is a list, otherwise wrap it in a list
-    then_block = p[4] if isinstance(p[4], list) else [p[4]]
-    
-    # Check if p[6] (else block) is a list, otherwise wrap it in a list
-    else_block = p[6] if isinstance(p[6], list) else [p[6]]
-    
-    then_code = "\n".join(then_block)
-    else_code = "\n".join(else_block)
-      
-    p[0] = f"if {p[2]}:\n{indent_block(then_code, level=1)}\nelse:\n{indent_block(else_code, level=1)}"
-    # p[0] = f"if {p[2]}:\n{then_code}\nelse:\n{else_code}"
-        
+    p[0] = ast.If(p[2], as_body(p[4]), as_body(p[6]))
+    p[0].lineno = p.lineno(1)
 
 def p_do_end_block(p):
     '''do_end_block : DO SEMICOLON statement_list END SEMICOLON'''
-    print('in do_end:', f"p[:] values: {p[:]}", flush=True) 
-    p[0] = p[3]
-    print('end do_end:', p[0], flush=True)
+    p[0] = ast.Block(p[3])
+    p[0].lineno = p.lineno(1)
 
 # Relational expressions to handle comparisons
 def p_relational_expression(p):
@@ -574,59 +618,31 @@ def p_relational_expression(p):
                              | expression GT expression
                              | expression GE expression
                              | expression ASSIGN expression'''
-    print('in relational_expression:', f"p[:] values: {p[:]}", flush=True)                           
-    if p[2] == '=':
-        p[0] = f"({p[1]} == {p[3]})"
-    else:
-        p[0] = f"({p[1]} {p[2]} {p[3]})"
-    print('end relational_expression:', p[0], flush=True) 
+    p[0] = ast.Compare(p[2], p[1], p[3])
 
 def p_expression_concat(p):
     '''expression : expression CONCAT expression'''
-    p[0] = f"{p[1]} + {p[3]}"
+    p[0] = ast.BinOp('||', p[1], p[3])
 
 # PUT statement rule: translates 'put skip list' to Python's print function
 def p_put_statement(p): 
     '''put_statement : PUT SKIP LIST LPAREN element_list RPAREN SEMICOLON'''
-    print('in put_statement:', f"p[:] values: {p[:]}", flush=True)
-    elements = ", ".join(map(str, p[5]))
-    p[0] = f"print({elements})"
+    p[0] = ast.Put(p[5])
+    p[0].lineno = p.lineno(1)
     
 def p_get_list_statement(p):
     '''get_list_statement : GET LIST LPAREN id_list RPAREN SEMICOLON'''
-    print('in get_list:', f"p[:] values: {p[:]}", flush=True)
-    vars_to_get = p[4]  # List of variable names
-    
-    # Generate input statements with dynamic type checking
-    python_input_statements = []
-    for var in vars_to_get:
-        python_input_statements.append(f'''
-try:
-    {var}_input = input("Enter {var}: ")
-    {var} = int({var}_input)
-except ValueError:
-    {var} = {var}_input  # Fall back to string if not an integer
-''')
-    
-    # Join statements to form the complete block of code
-    p[0] = '\n'.join(python_input_statements)
-    print('end get_list:', p[0], flush=True)
-
+    p[0] = ast.GetList(p[4])  # List of variable names
+    p[0].lineno = p.lineno(1)
     
 # List of variable names (e.g., var1, var2, var3)
 def p_id_list_multiple(p):
     '''id_list : ID COMMA id_list'''
     p[0] = [p[1]] + p[3]  # Combine current ID with rest of the list
 
-# def p_id_list_single(p):
-#     '''id_list : ID'''
-#     p[0] = [p[1]]  # Single ID
-   
-
 def p_element_list(p):
     '''element_list : element
                     | element_list COMMA element'''
-    print('in element_list:', f"p[:] values: {p[:]}", flush=True)                
     if len(p) == 2:
         p[0] = [p[1]]
     else:
@@ -636,44 +652,23 @@ def p_element(p):
     '''element : ID
                | NUMBER
                | CHAR_CONST'''
-    p[0] = p[1]
-
+    token = p.slice[1].type
+    if token == 'NUMBER':
+        p[0] = ast.Num(p[1])
+    elif token == 'CHAR_CONST':
+        p[0] = ast.Str(char_const(p[1]))
+    else:
+        p[0] = ast.Var(p[1])
 
 def p_select_statement(p):
     '''select_statement : SELECT LPAREN expression RPAREN SEMICOLON when_list other_statement END SEMICOLON'''
-    print('in select_statement:', f"p[:] values: {p[:]}")
-
-    # Start building the if-elif-else structure
-    select_var = p[3]
-    when_cases = p[6]  # when_list provides a list of tuples (condition, code block)
-
-    print('when_cases:', when_cases)
-
-    # Create the initial if statement
-    python_code = f"if {select_var} == ({when_cases[0][0]}):\n{indent_block(when_cases[0][1], level=1)}"
-    #python_code = f"if {select_var} == ({when_cases[0][0]}):\n{when_cases[0][1]}"
-
-    # Add elif statements for the rest of the cases
-    for condition, code in when_cases[1:]:
-        python_code += f"\nelif {select_var} == {condition}:\n{indent_block(code, level=1)}"
-        #python_code += f"\nelif {select_var} == {condition}:\n{code}"
-
-    # Handle the 'other' block if present
-    if p[7]:  # Use p[7] for the other block
-        other_block = indent_block(p[7], level=1)       
-        python_code += f"\nelse:\n{other_block}"
-
-    # Add the 'end' statement
-    python_code += "\n #end-select"
-
-    p[0] = "#select-start \n" + python_code
-    print('end select_statement:', p[0])
-
+    # when_list provides a list of tuples (value, statement list)
+    p[0] = ast.Select(p[3], p[6] or [], p[7])
+    p[0].lineno = p.lineno(1)
 
 def p_select_end(p):
     '''select_end : END SEMICOLON'''
-    print('in select_end:', f"p[:] values: {p[:]}", flush=True)
-    p[0] = "end select"
+    p[0] = None
 
 def p_when_list(p):
     '''when_list : when_list WHEN LPAREN expression RPAREN statement  
@@ -681,210 +676,401 @@ def p_when_list(p):
                  | WHEN LPAREN expression RPAREN statement  
                  | WHEN LPAREN expression RPAREN do_end_block
                  | empty'''    
-    print('in when_list:', f"p[:] values: {p[:]}", flush=True)
-    print('len(p):', len(p), flush=True)
-
-    # Add 'when' clauses as tuples of (condition, flattened statement)
     if len(p) == 7:  # This is for "when_list WHEN ( expression ) statement" format
-        # Flatten the statement if necessary
-        statement_block = "\n".join(p[6]) if isinstance(p[6], list) else p[6]
-        if isinstance(p[1], list):  # Continuing the existing list
-            p[0] = p[1] + [(p[4], statement_block)]
-        else:  # First entry in the list
-            p[0] = [(p[4], statement_block)]
-    else:  # This is for "WHEN ( expression ) statement" format (without preceding when_list)
-        statement_block = "\n".join(p[5]) if isinstance(p[5], list) else p[5]
-        p[0] = [(p[3], statement_block)]
-
-    print('end when_list:', p[0], flush=True)
+        p[0] = (p[1] or []) + [(p[4], as_body(p[6]))]
+    elif len(p) == 6:  # This is for "WHEN ( expression ) statement" format
+        p[0] = [(p[3], as_body(p[5]))]
+    else:
+        p[0] = []
 
 def p_other_statement(p):
     '''other_statement : OTHER statement  
                        | OTHER do_end_block
                        | empty'''
-    print('in other_statement:', f"p[:] values: {p[:]}")
-
-    if len(p) > 1 and p[2]:  # If there is an 'other' clause
-        if isinstance(p[2], list):  # Flatten if it's a list
-            p[0] = "\n".join(p[2])
-        else:
-            p[0] = p[2]
+    if len(p) > 2:  # If there is an 'other' clause
+        p[0] = as_body(p[2])
     else:
-        p[0] = ""
-
-    print('end other_statement:', p[0])
-
+        p[0] = None
 
 def p_do_while_statement(p):
     '''do_while_statement : DO WHILE LPAREN relational_expression RPAREN SEMICOLON statement do_end
                           | DO WHILE LPAREN relational_expression RPAREN SEMICOLON statement_list do_end'''                       
-    print('in do_while_statement:', f"p[:] values: {p[:]}", flush=True) 
-
-    # Get the relational expression (condition) and the loop body
-    loop_condition = p[4]  # This holds the relational expression
-    stmt = ''
-    if isinstance(p[7], list):        
-        loop_body = "\n".join([stmt for stmt in p[7]])        
-        print('stmt in do_while_statement:', loop_body, flush=True)
-    else:
-        loop_body = p[7]
-        print('p[7] is no list:', p[7], flush=True)
-    loop_body = indent_block(loop_body, level + 1)    
-    
     # Translate to Python's 'while' construct    
-    loop_body = loop_body + "\n" + "#end simulated" 
-    p[0] = f"while {loop_condition}:\n{loop_body}"
-        
-    print('end do_while_statement:', p[0], flush=True)
+    p[0] = ast.DoWhile(p[4], as_body(p[7]))
+    p[0].lineno = p.lineno(1)
     
+def p_do_until_statement(p):
+    '''do_until_statement : DO UNTIL LPAREN relational_expression RPAREN SEMICOLON statement_list do_end'''
+    p[0] = ast.DoUntil(p[4], as_body(p[7]))
+    p[0].lineno = p.lineno(1)
+
+def p_do_loop_statement(p):
+    '''do_loop_statement : DO ID ASSIGN do_value TO do_value SEMICOLON statement_list do_end
+                         | DO ID ASSIGN do_value TO do_value BY do_value SEMICOLON statement_list do_end'''
+    # DO i = start TO stop [BY step]; - TO and BY are evaluated once
+    if len(p) == 10:
+        p[0] = ast.DoLoop(ast.Var(p[2]), p[4], p[6], None, as_body(p[8]))
+    else:
+        p[0] = ast.DoLoop(ast.Var(p[2]), p[4], p[6], p[8], as_body(p[10]))
+    p[0].lineno = p.lineno(1)
+
+def p_do_value(p):
+    '''do_value : expression
+                | MINUS expression'''
+    # a negative bound or step: BY -1
+    if len(p) == 2:
+        p[0] = p[1]
+    elif isinstance(p[2], ast.Num):
+        p[0] = ast.Num(-p[2].value)
+    else:
+        p[0] = ast.BinOp('-', ast.Num(0), p[2])
+
 def p_do_end(p):
     '''do_end : END SEMICOLON'''
-    print('in do_end_statement:', f"p[:] values: {p[:]}", flush=True) 
-    p[0] = "#end simulated"
-    print('end do_end_statement:', p[0], flush=True)
-    # p[0] = None
+    p[0] = None
     
 # Define the rule to handle 'open file' statements
 def p_open_file(p):
-    '''open_file : OPEN FILE LPAREN CHAR_CONST RPAREN INPUT SEMICOLON
-                 | OPEN FILE LPAREN CHAR_CONST RPAREN OUTPUT SEMICOLON'''   
-    print('in open_file:', f"p[:] values: {p[:]} (len: {len(p)})", flush=True)             
-    mode = "r" if p[6].lower() == "input" else "w"
-    fname = p[4].replace("'", "")
-    p[0] = f"{fname} = open('{fname}.txt', '{mode}')"
-    print('end open:', p[0])
+    '''open_file : OPEN FILE LPAREN CHAR_CONST RPAREN INPUT file_options SEMICOLON
+                 | OPEN FILE LPAREN CHAR_CONST RPAREN OUTPUT file_options SEMICOLON
+                 | OPEN FILE LPAREN CHAR_CONST RPAREN UPDATE file_options SEMICOLON'''   
+    p[0] = ast.Open(file_name(p[4]), p[6].lower(), p[7])
+    p[0].lineno = p.lineno(1)
+
+def p_file_options(p):
+    '''file_options : file_options ID
+                    | file_options ID LPAREN NUMBER RPAREN
+                    | empty'''
+    # options of OPEN, e.g. RECSIZE(80): a dict name -> number (or None)
+    if len(p) == 2:
+        p[0] = {}
+    else:
+        p[0] = dict(p[1])
+        p[0][p[2].lower()] = p[4] if len(p) == 6 else None
+
+def p_on_endfile(p):
+    '''on_endfile : ON ENDFILE LPAREN CHAR_CONST RPAREN statement
+                  | ON ENDFILE LPAREN ID RPAREN statement
+                  | ON ENDFILE LPAREN CHAR_CONST RPAREN do_end_block
+                  | ON ENDFILE LPAREN ID RPAREN do_end_block'''
+    p[0] = ast.OnEndfile(file_name(p[4]), as_body(p[6]))
+    p[0].lineno = p.lineno(1)
+
+def p_on_key(p):
+    '''on_key : ON KEY LPAREN CHAR_CONST RPAREN statement
+              | ON KEY LPAREN ID RPAREN statement
+              | ON KEY LPAREN CHAR_CONST RPAREN do_end_block
+              | ON KEY LPAREN ID RPAREN do_end_block'''
+    p[0] = ast.OnKey(file_name(p[4]), as_body(p[6]))
+    p[0].lineno = p.lineno(1)
 
 # Define the rule to handle 'read file into' statements
 def p_read_file(p):
-    '''read_file : READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN SEMICOLON'''
-    print('in read:', f"p[:] values: {p[:]}", flush=True)  
-    fname = p[4].replace("'", "")            
-    p[0] = f"{p[8]} = {fname}.readline().strip()"
-    print('end read:', p[0])
-
-# Global dictionary to store EOF flags for each file
-eof_flags = {}
-
+    '''read_file : READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN SEMICOLON
+                 | READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN KEY LPAREN expression RPAREN SEMICOLON'''
+    p[0] = ast.Read(file_name(p[4]), ast.Var(p[8]), p[12] if len(p) == 15 else None)
+    p[0].lineno = p.lineno(1)
 
 # Define the rule to handle 'close file' statements
 def p_close_file(p):
     '''close_file : CLOSE FILE LPAREN CHAR_CONST RPAREN SEMICOLON'''
-    print('in close:', f"p[:] values: {p[:]}", flush=True)  
-    fname = p[4].replace("'", "")              
-    p[0] = f"{fname}.close()"
-    print('end close:', p[0])    
+    p[0] = ast.Close(file_name(p[4]))
+    p[0].lineno = p.lineno(1)
     
-import mysql.connector
-import os
-
-host = '' 
-user = ''
-password = '' 
-db_name = '' 
-
-def read_parameters_from_file(filename):
-    if os.path.exists(filename):
-        with open(filename, 'r') as file:
-            parameter_list = file.read().strip()
-        return parameter_list
-    else:
-        print(f"***Error: File '{filename}' not found. SQL error!")
-        return None
+def p_call_statement(p):
+    '''call_statement : CALL ID LPAREN argument_list RPAREN SEMICOLON'''
+    # CALL of a built-in routine (PLISRTA); the code generator checks the name
+    p[0] = ast.Call(p[2].lower(), p[4])
+    p[0].lineno = p.lineno(1)
+
+def p_argument_list(p):
+    '''argument_list : expression
+                     | argument_list COMMA expression'''
+    p[0] = [p[1]] if len(p) == 2 else p[1] + [p[3]]
 
 def p_sql_statement(p):
     'sql_statement : EXEC SQL STRING INTO ID SEMICOLON'
-    print('in sql_statement:', f"p[:] values: {p[:]}", flush=True)
-    
-    global host, user, password, db_name
+    # The SQL query and the PL/I variable receiving the result; the connection
+    # parameters are added by the code generator (see plithon_config.py)
+    p[0] = ast.ExecSql(p[3].strip('"'), p[5])
+    p[0].lineno = p.lineno(1)
+
+def p_sql_cursor_statement(p):
+    '''sql_statement : EXEC SQL DCL ID CURSOR FOR STRING SEMICOLON
+                     | EXEC SQL OPEN ID SEMICOLON
+                     | EXEC SQL FETCH ID INTO id_list SEMICOLON
+                     | EXEC SQL CLOSE ID SEMICOLON'''
+    keyword = p.slice[3].type
+    if keyword == 'DCL':
+        p[0] = ast.DeclareCursor(p[4], p[7].strip('"'))
+    elif keyword == 'OPEN':
+        p[0] = ast.OpenCursor(p[4])
+    elif keyword == 'FETCH':
+        p[0] = ast.FetchCursor(p[4], p[6])
+    else:
+        p[0] = ast.CloseCursor(p[4])
+    p[0].lineno = p.lineno(1)
 
-    # Load parameters from the file and strip any surrounding quotes
-    filename = "c:/temp/creds.txt"
-    parameter_list = read_parameters_from_file(filename)
-    
-    # Split into key-value pairs and strip unwanted quotes
-    params = {}
-    pairs = parameter_list.split(', ')
-    for pair in pairs:
-        key, value = pair.split('=')
-        params[key.strip()] = value.strip().strip('"').strip("'")
-
-    # Assign parameters
-    host = params['host']
-    user = params['user']
-    password = params['password']
-    db_name = params['database']
-    
-    print('Parameters:', host, user, password, db_name)
-    
-    # Extract the SQL query and PL/I variable
-    sql_query = p[3].strip('"')
-    pl1_var = p[5]
-    
-    # Generate Python code for SQL execution with parameters
-    p[0] = f'''
-import mysql.connector
+def p_pl1_var(p):
+    '''pl1_var : ID'''
+    p[0] = p[1]  # PL/I variable is an identifier (ID)
 
-def execute_sql_query(host, db_name, user, password):
-    try:
-        print("*** Executing SQL Query: {sql_query}")
-        
-        # Establish MySQL connection with parameters
-        connection = mysql.connector.connect(
-            host=host,
-            user=user,
-            password=password,
-            database=db_name
-        )
-        cursor = connection.cursor()
+def p_sql_query(p):
+    '''sql_query : STRING'''
+    p[0] = p[1]  # The SQL query is a string
 
-        # Execute the SQL query
-        sql_query = "{sql_query}"
-        cursor.execute(sql_query)
+# =============================================================================
+# Parse tables: pre-generated tables are shipped in the plithon_tables package
+# directory, one module per grammar version (parsetab_<signature>.py). They are
+# only read at run time; "python plithon.py --build-tables" regenerates them
+# after a grammar change. Without a matching table module the tables are
+# generated in memory (slow, but nothing is written anywhere).
+# =============================================================================
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plithon_tables')
 
-        # Fetch the result and assign it to the PL/I variable (Python variable)
-        result = cursor.fetchone()
-        {pl1_var} = result[0] if result else None
+_parser_tables = None
 
-        # Close the connection
-        cursor.close()
-        connection.close()
+def grammar_signature():
+    """
+    Returns a hash identifying the grammar: tokens and the docstrings of all
+    grammar rules in source order. Editing rule actions doesn't change it.
+    """
+    module = sys.modules[__name__]
+    rules = [f for name, f in vars(module).items()
+             if name.startswith('p_') and isinstance(f, types.FunctionType)]
+    rules.sort(key=lambda f: f.__code__.co_firstlineno)
+    digest = hashlib.sha256(repr(tokens).encode())
+    for f in rules:
+        digest.update(f"{f.__name__}:{' '.join((f.__doc__ or '').split())}\n".encode())
+    return digest.hexdigest()[:16]
+
+def table_module_name(signature=None):
+    """Returns the name of the table module for the (current) grammar signature."""
+    return f"parsetab_{signature or grammar_signature()}"
+
+def load_parser_tables():
+    """Loads the shipped tables of the current grammar, None if there are none."""
+    name = table_module_name()
+    path = os.path.join(TABLES_DIR, name + '.py')
+    if not os.path.exists(path):
+        return None
+    spec = importlib.util.spec_from_file_location(f"plithon_tables.{name}", path)
+    parsetab = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(parsetab)
+    tables = yacc.LRTable()
+    tables.read_table(parsetab)
+    tables.bind_callables(vars(sys.modules[__name__]))
+    return tables
+
+def generate_parser_tables(write=False):
+    """
+    Generates the LALR tables from the grammar.
 
-        print(f'*** SQL Result: {{result}}')
-        return {pl1_var}
+    Args:
+        write: Store the tables in the plithon_tables directory (and remove
+            the tables of older grammar versions).
 
-    except mysql.connector.Error as err:
-        sqlcode = err.errno
-        sqlstate = err.sqlstate
-        error_message = err.msg
-        print(f"SQL Error: SQLCODE={{sqlcode}}, SQLSTATE={{sqlstate}}, Message={{error_message}}")
-        return None
+    Returns:
+        The generated tables.
+    """
+    name = table_module_name()
+    if write:
+        for old in glob.glob(os.path.join(TABLES_DIR, 'parsetab_*.py')):
+            os.remove(old)
+    parser = yacc.yacc(module=sys.modules[__name__], debug=False, tabmodule=name,
+                       write_tables=write, outputdir=TABLES_DIR,
+                       errorlog=yacc.NullLogger())
+    return types.SimpleNamespace(lr_productions=parser.productions,
+                                 lr_action=parser.action,
+                                 lr_goto=parser.goto)
+
+def parser_tables():
+    """Returns the LALR tables of the grammar, loading them once per process."""
+    global _parser_tables
+    if _parser_tables is None:
+        _parser_tables = load_parser_tables() or generate_parser_tables()
+    return _parser_tables
 
-print('Parameters:', host, user, password, db_name)
-{pl1_var} = execute_sql_query(host, db_name, user, password)
-print('Final result stored in:', {pl1_var})
-'''
+# =============================================================================
+# Library interface: Transpiler objects share the LALR tables, which are loaded
+# lazily once per process; importing this module does not build anything
+# =============================================================================
 
+class TranspileResult:
+    """
+    Outcome of one translation.
 
+    Attributes:
+        code: The generated Python code, None if nothing could be generated.
+        errors: List of error messages (illegal characters, syntax errors).
+        program: The AST of the program (plithon_ast.Program) or None.
+        code_object: The compiled code (set by Transpiler.compile only).
+    """
+    __slots__ = ('code', 'errors', 'program', 'code_object')
 
+    def __init__(self, code, errors, program=None, code_object=None):
+        self.code = code
+        self.errors = errors
+        self.program = program
+        self.code_object = code_object
 
-def p_pl1_var(p):
-    '''pl1_var : ID'''
-    print('in pl1_var:', f"p[:] values: {p[:]}", flush=True)
-    p[0] = p[1]  # PL/I variable is an identifier (ID)
+    @property
+    def ok(self):
+        """True if code was generated without any error."""
+        return self.code is not None and not self.errors
 
-def p_sql_query(p):
-    '''sql_query : STRING'''
-    print('in sql_query:', f"p[:] values: {p[:]}", flush=True)
-    p[0] = p[1]  # The SQL query is a string
+    def __repr__(self):
+        return f"TranspileResult(ok={self.ok}, errors={self.errors!r})"
 
-# Error handling
-def p_error(p):
-    if p:
-        print(f"Syntax error at token '{p.value}'", flush=True)
-    else:
-        print("Syntax error at EOF", flush=True)
-        
-parser = yacc.yacc(debug=True, write_tables=True, outputdir='.')
+class Transpiler:
+    """
+    Owns one lexer/parser pair and can be reused for any number of sources.
+
+    Instances don't share any mutable state, so several of them can be used
+    side by side (one per thread, for example).
+
+    Args:
+        trace: Optional Tracer receiving the trace of the grammar rules.
+        sql_config: Connection configuration of the EXEC SQL statements: a
+            SqlConfig, the path of a configuration file or a dict of
+            parameters (default: environment, see plithon_config.py). The
+            generated code refers to it (to a dict by a name registered in
+            this process), the program reads it when it connects.
+        passes: Names of the optimization passes (plithon_optimize.py),
+            default: all; () translates the statements as they are.
+    """
+
+    def __init__(self, trace=None, sql_config=None, passes=PASSES):
+        if not isinstance(sql_config, SqlConfig):
+            sql_config = SqlConfig(sql_config)
+        self.sql_config = sql_config
+        self.passes = tuple(passes)
+        self._lexer = lexer_template().clone()
+        self._parser = yacc.LRParser(parser_tables(), self._syntax_error)
+        if trace is not None:
+            self._parser.productions = trace.instrument(self._parser.productions)
+        self._errors = []
+
+    def _syntax_error(self, tok):
+        if tok:
+            self._errors.append(f"Syntax error at token '{tok.value}' in line {tok.lineno}")
+        else:
+            self._errors.append("Syntax error at EOF")
+
+    def transpile(self, source):
+        """
+        Translates PL/I source text into Python source text.
+
+        Args:
+            source: The PL/I program as a string.
+
+        Returns:
+            A TranspileResult with the generated code and the errors found.
+        """
+        self._errors = errors = []
+        self._lexer.errors = errors
+        self._lexer.lineno = 1
+        program = self._parser.parse(source, lexer=self._lexer)
+        return self.generate(program, errors)
+
+    def generate(self, program, errors=()):
+        """Returns the TranspileResult of a parsed program (program stays unoptimized)."""
+        errors = list(errors)
+        if errors or program is None:
+            return TranspileResult(None, errors, program)
+        try:
+            optimized = Optimizer(program.decls, self.passes).program(program)
+            code = CodeGenerator(self.sql_config).generate(optimized)
+        except RecursionError:
+            errors.append("Program is nested too deeply")
+            code = None
+        except CodeGenError as e:
+            errors.append(str(e))
+            code = None
+        return TranspileResult(code, errors, program)
+
+    def tokenize(self, source, lineno=1):
+        """
+        Splits source text into tokens.
+
+        Args:
+            source: PL/I source text (a whole program or a part of it).
+            lineno: Line number of the first line.
+
+        Returns:
+            A tuple (list of tokens, list of lexer errors).
+        """
+        self._lexer.errors = errors = []
+        self._lexer.lineno = lineno
+        self._lexer.input(source)
+        return list(iter(self._lexer.token, None)), errors
+
+    def parse_tokens(self, tokens):
+        """Parses a list of tokens (see tokenize); returns (program, errors)."""
+        self._errors = errors = []
+        feed = types.SimpleNamespace(token=functools.partial(next, iter(tokens), None))
+        program = self._parser.parse(lexer=feed)
+        return program, errors
+
+    def compile(self, source, cache=None, filename='<plithon>'):
+        """
+        Translates PL/I source text and compiles the generated code.
+
+        Args:
+            source: The PL/I program as a string.
+            cache: Optional ArtifactCache; on a hit neither the PL/I source
+                is parsed nor the Python code compiled.
+            filename: File name of the code object if no cache is used.
+
+        Returns:
+            A TranspileResult, code_object is set if the translation was ok.
+        """
+        key = None
+        if cache is not None:
+            # the generated code refers to the SQL configuration (path or registered name)
+            key = cache.key(source, f"{self.sql_config.fingerprint()}\0{','.join(self.passes)}")
+            cached = cache.load(key)
+            if cached is not None:
+                return TranspileResult(cached[0], [], None, cached[1])
+        result = self.transpile(source)
+        if not result.ok:
+            return result
+        if cache is not None:
+            result.code_object = cache.store(key, result.code)
+        else:
+            # make the generated lines available for tracebacks
+            linecache.cache[filename] = (len(result.code), None,
+                                         result.code.splitlines(True), filename)
+            result.code_object = compile(result.code, filename, 'exec')
+        return result
+
+_transpiler_version = None
+
+def transpiler_version():
+    """
+    Returns the version used for cache keys: the release plus a hash of the
+    translator sources, so a changed code generator never hits old entries.
+    """
+    global _transpiler_version
+    if _transpiler_version is None:
+        digest = hashlib.sha256(__version__.encode())
+        for module_file in (__file__, ast.__file__, plithon_codegen.__file__, plithon_optimize.__file__):
+            with open(module_file, 'rb') as file:
+                digest.update(file.read())
+        _transpiler_version = f"{__version__}-{digest.hexdigest()[:16]}"
+    return _transpiler_version
+
+def open_cache(directory):
+    """Returns the ArtifactCache of this transpiler version in the directory."""
+    return ArtifactCache(directory, transpiler_version())
+
+def run_program(code_object):
+    """Executes a compiled program as if it were run as script."""
+    exec(code_object, {'__name__': '__main__'})
+
+def transpile(source: str, trace=None, sql_config=None, passes=PASSES) -> TranspileResult:
+    """Translates PL/I source text with a fresh Transpiler, see Transpiler.transpile."""
+    return Transpiler(trace, sql_config, passes).transpile(source)
 
 # =============================================================================
 # After building the parser, print the state tables (option)
@@ -913,22 +1099,23 @@ def print_lr_state_table(parser):
             print(f"  On non-terminal {nonterminal}: Go to state {next_state}")
 
 # Example call after parser is created
-# print_lr_state_table(parser)
+# print_lr_state_table(yacc.LRParser(parser_tables(), None))
 
 # =============================================================================
 # Call the TK interface to select the input PL/1 code
 # =============================================================================
 pl1_code = ""
 
-import tkinter as tk
-from tkinter import filedialog
-
 # Global variable to store the selected file path
 selected_file_path = None
 
 def select_file():
     """Opens a file dialog for the user to select a PL/I file if not already selected."""
     global selected_file_path
+    # tkinter is only needed for the interactive mode, a headless build machine
+    # may not have it at all
+    import tkinter as tk
+    from tkinter import filedialog
 
     # Check if file has already been selected, avoid re-opening the file dialog
     if selected_file_path is None:
@@ -955,10 +1142,8 @@ def read_pli_from_file(file_path):
     return pl1_input
 
 def pli_to_python(pl1_input):
-    """Placeholder for the PL/I to Python transpiler logic."""
-    # Your transpiler code logic goes here
-    # Return some dummy Python code for this example
-    return "# Transpiled Python code goes here"
+    """Returns the Python code for the PL/I input, or None if parsing failed."""
+    return transpile(pl1_input).code
 
 def execute_transpiler():
     """Executes the PL/I transpiler by selecting the file via file dialog."""
@@ -974,29 +1159,273 @@ def execute_transpiler():
     print(pl1_code)
     return pl1_code
 
-pl1_code = execute_transpiler() 
+def run_interactive(trace=None, cache=None, sql_config=None, passes=PASSES):
+    """Selects a PL/I file per dialog, translates it and executes the result."""
+    print('start at:', datetime.now())
+    pl1_code = execute_transpiler() 
+    if pl1_code is None:
+        return
+    
+    # =========================================================================
+    # Call the (yacc) parser
+    # =========================================================================
+    translation = Transpiler(trace, sql_config, passes).compile(pl1_code, cache, f"<{selected_file_path}>")
+    result = translation.code
+    if trace is not None:
+        trace.close()
+    
+    # print("Tokens:")
+    # print_tokens(pl1_code)
+    
+    # =========================================================================
+    # Print the input PL/I, the generated Python code, as well the execution
+    # result if possible
+    # =========================================================================
+    if result:
+        print("===PL/I input:================================")
+        print(pl1_code)
+        print("===Python version:============================")
+        print(result)
+        print("===Execution result:==========================")
+        run_program(translation.code_object)
+        print("==============================================")
+    else:
+        for error in translation.errors:
+            print(error)
+        print("Parsing failed.")
 
-# =============================================================================
-# Call the (yacc) parser
-# =============================================================================
-result = parser.parse(pl1_code)
-#result = parser.parse(pl1_code, debug=True)
+def run_files(inputs, cache=None, sql_config=None, passes=PASSES, profile=False):
+    """
+    Translates and executes PL/I files one after the other (--run).
 
-# print("Tokens:")
-# print_tokens(pl1_code)
+    Args:
+        profile: Writes the time and count of every PL/I statement of a run
+            to stderr (plithon_profile.py).
+
+    Returns:
+        The process exit status: 0 if all files were translated, else 1.
+    """
+    files = collect_inputs(inputs)
+    if not files:
+        print("***Error: no PL/I input files found", file=sys.stderr)
+        return 1
+    transpiler = Transpiler(sql_config=sql_config, passes=passes)
+    status = 0
+    for path, name in files:
+        source = read_pli_from_file(path)
+        result = transpiler.compile(source, cache, f"<{path}>")
+        if not result.ok:
+            print(f"***Error: {path}: {'; '.join(result.errors)}", file=sys.stderr)
+            status = 1
+            continue
+        if profile:
+            import plithon_profile
+            plithon_profile.profile(result.code_object, result.code, source, path)
+        else:
+            run_program(result.code_object)
+    return status
 
 # =============================================================================
-# Print the input PL/I, the generated Python code, as well the execution result
-# if possible
+# Batch mode: translate whole directories of PL/I members without any dialog
 # =============================================================================
-enablePrint()
-if result:
-    print("===PL/I input:================================")
-    print(pl1_code)
-    print("===Python version:============================")
-    print(result)
-    print("===Execution result:==========================")
-    exec(result)
-    print("==============================================")
-else:
-    print("Parsing failed.")
\ No newline at end of file
+PLI_SUFFIXES = ('.pli', '.pl1')
+
+def collect_inputs(specs):
+    """
+    Expands the command line inputs to a list of PL/I files.
+
+    Args:
+        specs: File names, glob patterns or directories.
+
+    Returns:
+        A list of (input path, output name) tuples. Files found below a
+        directory keep their path relative to that directory, so members
+        with the same name in different subdirectories don't collide.
+    """
+    jobs = []
+    seen = set()
+    for spec in specs:
+        if os.path.isdir(spec):
+            for dirpath, dirnames, filenames in os.walk(spec):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    if name.lower().endswith(PLI_SUFFIXES):
+                        path = os.path.join(dirpath, name)
+                        jobs.append((path, os.path.relpath(path, spec)))
+        else:
+            matches = sorted(glob.glob(spec)) if glob.has_magic(spec) else [spec]
+            for path in matches:
+                jobs.append((path, os.path.basename(path)))
+    unique = []
+    for path, name in jobs:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append((path, name))
+    return unique
+
+def transpile_file(job):
+    """
+    Translates one PL/I file and writes the generated module (worker function).
+
+    Args:
+        job: A tuple (input path, output name, output directory, trace,
+            SqlConfig, optimization passes), where trace is None or a tuple
+            (level, rules); the trace of a member is written next to its
+            generated module (<name>.py.trace).
+
+    Returns:
+        A tuple (input path, output path, ok, seconds, message).
+    """
+    path, name, output_dir, trace, sql_config, passes = job
+    out_path = os.path.join(output_dir, os.path.splitext(name)[0] + '.py')
+    start = time.perf_counter()
+    tracer = None
+    try:
+        pl1_input = read_pli_from_file(path)
+        if trace is not None:
+            os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+            tracer = Tracer(trace[0], trace[1], file=out_path + '.trace')
+        result = transpile(pl1_input, tracer, sql_config, passes)
+        if not result.ok:
+            errors = "; ".join(result.errors) or "no output produced"
+            return path, out_path, False, time.perf_counter() - start, errors
+        os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+        with open(out_path, 'w') as file:
+            file.write(result.code + "\n")
+    except Exception as e:
+        return path, out_path, False, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    finally:
+        if tracer is not None:
+            tracer.close()
+    return path, out_path, True, time.perf_counter() - start, ""
+
+def run_batch(inputs, output_dir, jobs=None, trace=None, sql_config=None, passes=PASSES):
+    """
+    Translates all given PL/I files, fanned out over a process pool.
+
+    Args:
+        inputs: File names, glob patterns or directories.
+        output_dir: Directory receiving the generated Python modules.
+        jobs: Number of worker processes (defaults to the CPU count).
+        trace: None or a tuple (level, rules) to trace every member.
+        sql_config: SQL connection configuration, see Transpiler.
+        passes: Optimization passes, see Transpiler.
+
+    Returns:
+        The process exit status: 0 if all files were translated, else 1.
+    """
+    files = collect_inputs(inputs)
+    if not files:
+        print("***Error: no PL/I input files found", file=sys.stderr)
+        return 1
+    config = sql_config if isinstance(sql_config, SqlConfig) else SqlConfig(sql_config)
+    work = [(path, name, output_dir, trace, config, passes) for path, name in files]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(work)))
+    # build the tables before forking, so the workers inherit them
+    parser_tables()
+
+    start = time.perf_counter()
+    failed = 0
+    if jobs == 1:
+        results = map(transpile_file, work)
+        failed = report_batch(results)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            failed = report_batch(pool.map(transpile_file, work, chunksize=4))
+    elapsed = time.perf_counter() - start
+    print(f"{len(work) - failed} of {len(work)} files translated, "
+          f"{failed} failed, {elapsed:.3f}s with {jobs} worker(s)")
+    return 1 if failed else 0
+
+def report_batch(results):
+    """Prints one line per translated file and returns the number of failures."""
+    failed = 0
+    for path, out_path, ok, seconds, message in results:
+        if ok:
+            print(f"ok     {seconds:8.3f}s  {path} -> {out_path}", flush=True)
+        else:
+            failed += 1
+            print(f"FAILED {seconds:8.3f}s  {path}: {message}", flush=True)
+    return failed
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Without arguments the interactive mode is started (file dialog, execution
+    of the result). With input files, globs or directories the files are
+    translated headless into the output directory.
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog='plithon',
+        description='PL/I to Python transpiler')
+    arg_parser.add_argument('inputs', nargs='*',
+                            help='PL/I files, glob patterns or directories')
+    arg_parser.add_argument('-o', '--output-dir', default='.',
+                            help='directory for the generated Python modules (default: .)')
+    arg_parser.add_argument('-j', '--jobs', type=int, default=None,
+                            help='number of worker processes (default: CPU count)')
+    arg_parser.add_argument('-r', '--run', action='store_true',
+                            help='execute the translated inputs instead of writing modules')
+    arg_parser.add_argument('--profile', action='store_true',
+                            help='with --run: time and count every PL/I statement and DO loop, '
+                                 'report to stderr')
+    arg_parser.add_argument('--cache-dir', default=None,
+                            help='cache translated and compiled programs in this directory '
+                                 '(interactive mode and --run)')
+    arg_parser.add_argument('-w', '--watch', action='store_true',
+                            help='translate the input files again whenever they are saved')
+    arg_parser.add_argument('--sql-config', default=None,
+                            help='file with the connection parameters of EXEC SQL '
+                                 '(default: $PLITHON_SQL_CONFIG, $PLITHON_SQL_*, c:/temp/creds.txt)')
+    arg_parser.add_argument('-O', '--optimize', default='all',
+                            help='comma separated optimization passes: '
+                                 f"{','.join(PASSES)}, all or none (default: all)")
+    arg_parser.add_argument('--build-tables', action='store_true',
+                            help='regenerate the parse tables in plithon_tables and exit')
+    arg_parser.add_argument('--trace', type=int, choices=(TRACE_RULES, TRACE_VALUES),
+                            help='trace the grammar rules: 1 = rules, 2 = rules and values')
+    arg_parser.add_argument('--trace-rules', default=None,
+                            help='comma separated rule names to trace (default: all)')
+    arg_parser.add_argument('--trace-file', default=None,
+                            help='trace file of the interactive mode (default: stdout); '
+                                 'the batch mode writes <module>.py.trace files')
+    args = arg_parser.parse_args(argv)
+    trace_rules = args.trace_rules.split(',') if args.trace_rules else None
+    try:
+        passes = plithon_optimize.passes_from(args.optimize)
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    if args.build_tables:
+        generate_parser_tables(write=True)
+        print(f"parse tables written to {os.path.join(TABLES_DIR, table_module_name())}.py")
+        return 0
+    if args.watch:
+        import plithon_incremental
+        plithon_incremental.watch(collect_inputs(args.inputs), args.output_dir,
+                                  sql_config=args.sql_config, passes=passes)
+        return 0
+    if args.profile and not (args.run and args.inputs):
+        arg_parser.error('--profile needs --run and input files')
+    cache = open_cache(args.cache_dir) if args.cache_dir else None
+    if not args.inputs or args.run:
+        if args.inputs:
+            status = run_files(args.inputs, cache, args.sql_config, passes, args.profile)
+        else:
+            tracer = None
+            if args.trace:
+                tracer = Tracer(args.trace, trace_rules, file=args.trace_file)
+            run_interactive(tracer, cache, args.sql_config, passes)
+            status = 0
+        if cache is not None:
+            print(cache.stats(), file=sys.stderr)
+        return status
+    trace = (args.trace, trace_rules) if args.trace else None
+    return run_batch(args.inputs, args.output_dir, args.jobs, trace, args.sql_config, passes)
+
+if __name__ == '__main__':
+    # modules importing plithon (watch mode) share this instance
+    sys.modules.setdefault('plithon', sys.modules[__name__])
+    sys.exit(main())
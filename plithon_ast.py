@@ -0,0 +1,230 @@
+# =============================================================================
+# AST of the PL/I subset understood by plithon.
+#
+# The grammar rules in plithon.py build these nodes, plithon_codegen.py emits
+# the Python code for a Program in one pass. The nodes are plain containers
+# with __slots__; lists of statements ("bodies") are Python lists. The
+# parser sets the lineno of the declarations and statements to the line of
+# their first token (the code generator maps the generated code back to it);
+# it isn't one of the fields compared by ==.
+# =============================================================================
+
+class Node:
+    """
+    Base class of all nodes: positional constructor over __slots__.
+
+    Attributes:
+        lineno: Line of a declaration or statement in the PL/I source, 0 if
+            unknown (expressions, nodes of the optimizer).
+    """
+    __slots__ = ('lineno',)
+
+    def __init__(self, *args):
+        self.lineno = 0
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        fields = ", ".join(repr(getattr(self, name)) for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+
+# =============================================================================
+# Declarations
+# =============================================================================
+class Program(Node):
+    """name: PROC OPTIONS(MAIN); decls body END name;"""
+    __slots__ = ('name', 'decls', 'body')
+
+class Type(Node):
+    """
+    Data attributes of a declaration: kind is 'bin', 'dec' or 'char', varying
+    is True for CHAR(n) VARYING; size is (p, q) for FIXED DEC(p,q).
+    """
+    __slots__ = ('kind', 'size', 'varying')
+
+class Declare(Node):
+    """DCL names(dims) type; - items is a list of (name, dims or None)."""
+    __slots__ = ('items', 'type')
+
+class Structure(Node):
+    """
+    DCL level name, level field type, ...; - fields is a list of (level,
+    name, Type); a field is referenced as name.field.
+    """
+    __slots__ = ('level', 'name', 'fields')
+
+
+# =============================================================================
+# Statements
+# =============================================================================
+class Assign(Node):
+    """target = expr;"""
+    __slots__ = ('target', 'expr')
+
+class If(Node):
+    """IF cond THEN then ELSE orelse; - then and orelse are bodies."""
+    __slots__ = ('cond', 'then', 'orelse')
+
+class Select(Node):
+    """SELECT(subject); WHEN(value) ...; OTHER ...; END; - whens: [(value, body)]."""
+    __slots__ = ('subject', 'whens', 'other')
+
+class DoWhile(Node):
+    """DO WHILE(cond); body END;"""
+    __slots__ = ('cond', 'body')
+
+class DoUntil(Node):
+    """DO UNTIL(cond); body END; - cond is tested after every iteration."""
+    __slots__ = ('cond', 'body')
+
+class DoLoop(Node):
+    """DO var = start TO stop BY step; body END; - step is None without BY."""
+    __slots__ = ('var', 'start', 'stop', 'step', 'body')
+
+class Block(Node):
+    """DO; body END;"""
+    __slots__ = ('body',)
+
+class Put(Node):
+    """PUT SKIP LIST(items);"""
+    __slots__ = ('items',)
+
+class GetList(Node):
+    """GET LIST(names);"""
+    __slots__ = ('names',)
+
+class Open(Node):
+    """
+    OPEN FILE('file') INPUT|OUTPUT|UPDATE options; - mode is 'input',
+    'output' or 'update', options a dict like {'recsize': 80}.
+    """
+    __slots__ = ('file', 'mode', 'options')
+
+class Read(Node):
+    """READ FILE('file') INTO(target) KEY(key); - key is None for the next record."""
+    __slots__ = ('file', 'target', 'key')
+
+class Write(Node):
+    """WRITE FILE('file') FROM(source) KEYFROM(keyfrom); - keyfrom is None if not keyed."""
+    __slots__ = ('file', 'source', 'keyfrom')
+
+class Rewrite(Node):
+    """REWRITE FILE('file') FROM(source) KEY(key); - key None: the record read last."""
+    __slots__ = ('file', 'source', 'key')
+
+class Delete(Node):
+    """DELETE FILE('file') KEY(key); - key None: the record read last."""
+    __slots__ = ('file', 'key')
+
+class Close(Node):
+    """CLOSE FILE('file');"""
+    __slots__ = ('file',)
+
+class OnEndfile(Node):
+    """ON ENDFILE(file) statement; - body runs when a READ reaches the end."""
+    __slots__ = ('file', 'body')
+
+class OnKey(Node):
+    """ON KEY(file) statement; - body runs when a key isn't found or exists already."""
+    __slots__ = ('file', 'body')
+
+class Call(Node):
+    """CALL name(args); - a built-in routine like PLISRTA."""
+    __slots__ = ('name', 'args')
+
+class ExecSql(Node):
+    """EXEC SQL "query" INTO target;"""
+    __slots__ = ('query', 'target')
+
+class DeclareCursor(Node):
+    """EXEC SQL DECLARE cursor CURSOR FOR "query";"""
+    __slots__ = ('cursor', 'query')
+
+class OpenCursor(Node):
+    """EXEC SQL OPEN cursor;"""
+    __slots__ = ('cursor',)
+
+class FetchCursor(Node):
+    """EXEC SQL FETCH cursor INTO targets; - arrays as targets fetch many rows."""
+    __slots__ = ('cursor', 'targets')
+
+class CloseCursor(Node):
+    """EXEC SQL CLOSE cursor;"""
+    __slots__ = ('cursor',)
+
+class Comment(Node):
+    """Block comment kept in the generated code."""
+    __slots__ = ('text',)
+
+class Let(Node):
+    """name = expr; into a temporary of the optimizer (plithon_optimize.py)."""
+    __slots__ = ('name', 'expr')
+
+
+# =============================================================================
+# Expressions
+# =============================================================================
+class Num(Node):
+    """Numeric constant, value is an int or a decimal.Decimal (1.05)."""
+    __slots__ = ('value',)
+
+class Str(Node):
+    """Character constant, value is the text without the quotes."""
+    __slots__ = ('value',)
+
+class Var(Node):
+    __slots__ = ('name',)
+
+class Subscript(Node):
+    """name(index, ...) - array element."""
+    __slots__ = ('name', 'indexes')
+
+class BinOp(Node):
+    """Arithmetic (+ - * /) or concatenation (||)."""
+    __slots__ = ('op', 'left', 'right')
+
+class Compare(Node):
+    """Relational expression, op is one of = <> < <= > >= (and ==)."""
+    __slots__ = ('op', 'left', 'right')
+
+class Builtin(Node):
+    """Builtin function call: SUBSTR, MOD, INDEX, DECIMAL."""
+    __slots__ = ('name', 'args')
+
+class Temp(Node):
+    """The value of expr, computed before by Let(name, expr)."""
+    __slots__ = ('name', 'expr')
+
+
+def walk(node):
+    """Yields the node and all nodes below it (statements and expressions)."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Node):
+            yield node
+            stack.extend(getattr(node, name) for name in reversed(node.__slots__))
+        elif isinstance(node, (list, tuple)):
+            stack.extend(reversed(node))
+
+
+def declared(decls):
+    """
+    Yields (name, type, dims) of the declared variables: a structure as
+    (name, None, None), followed by its fields as (name.field, type, None).
+    """
+    for decl in decls:
+        if isinstance(decl, Structure):
+            yield decl.name, None, None
+            for level, field, type in decl.fields:
+                yield f"{decl.name}.{field}", type, None
+        else:
+            for name, dims in decl.items:
+                yield name, decl.type, dims
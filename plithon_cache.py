@@ -0,0 +1,95 @@
+# =============================================================================
+# On-disk cache of translated programs.
+#
+# For every PL/I source the cache keeps the generated Python module (<key>.py)
+# and its marshalled code object (<key>.code). The key hashes the PL/I source,
+# the transpiler version and the Python bytecode version, so a hit skips both
+# the PL/I parse and the Python compile. The code objects are compiled with
+# the path of the cached .py file, tracebacks therefore show the generated
+# lines.
+# =============================================================================
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+
+class ArtifactCache:
+    """
+    Cache directory for translated programs.
+
+    Args:
+        directory: Cache directory, created if needed.
+        version: Transpiler version string, part of every key.
+
+    Attributes:
+        hits, misses: Number of lookups found / not found in the cache.
+    """
+
+    def __init__(self, directory, version):
+        self.directory = directory
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, source, context=''):
+        """
+        Returns the cache key of a PL/I source.
+
+        Args:
+            source: The PL/I program.
+            context: Text of anything else the generated code depends on.
+        """
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(importlib.util.MAGIC_NUMBER)
+        digest.update(context.encode() + b'\0')
+        digest.update(source.encode())
+        return digest.hexdigest()
+
+    def paths(self, key):
+        """Returns the paths of the generated module and of the code object."""
+        base = os.path.join(self.directory, key)
+        return base + '.py', base + '.code'
+
+    def load(self, key):
+        """
+        Looks up a translated program.
+
+        Returns:
+            A tuple (python source, code object), or None if not cached.
+        """
+        py_path, code_path = self.paths(key)
+        try:
+            with open(code_path, 'rb') as file:
+                code = marshal.load(file)
+            with open(py_path, 'r') as file:
+                python_source = file.read()
+        except (OSError, EOFError, ValueError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return python_source, code
+
+    def store(self, key, python_source):
+        """Stores a generated module and returns its compiled code object."""
+        py_path, code_path = self.paths(key)
+        write_atomic(py_path, python_source.encode())
+        code = compile(python_source, py_path, 'exec')
+        write_atomic(code_path, marshal.dumps(code))
+        return code
+
+    def stats(self):
+        """Returns the counters as a short text."""
+        return f"cache {self.directory}: {self.hits} hits, {self.misses} misses"
+
+def write_atomic(path, data):
+    """Writes a file under a temporary name and renames it (safe for parallel workers)."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,1606 @@
+# =============================================================================
+# Python code generation for the plithon AST.
+#
+# The generator walks the Program once and appends every line with the
+# indentation of its nesting depth, so no code is re-indented or re-joined
+# when blocks are nested.
+#
+# Declared arrays are flat typed buffers of plithon_runtime.arrays; element
+# accesses are emitted with the 0-based offset computed inline, constant
+# subscripts are folded into a constant offset. An assignment to a whole
+# array (a = 0; a = b; a = b + c;) becomes a fill, a copy or an element
+# loop, FIXED BIN arithmetic additionally a NumPy version of the loop
+# (plithon_runtime.vector) that is used if NumPy is installed.
+#
+# CHAR(n) variables are str values of exactly n characters: assignments pad
+# with blanks or truncate, comparisons of strings ignore trailing blanks (the
+# shorter operand is padded). CHAR(n) VARYING values are only truncated;
+# x = x || y; appends in place (x += y, which CPython does without copying
+# x while no other reference to it exists).
+#
+# FIXED BIN values are ints limited to 16, 32 or 64 bits, FIXED DEC(p,q)
+# values ints scaled by 10**q (plithon_runtime.fixed); the code of a numeric
+# expression is that of its scaled value (scale()), operands of different
+# scales are aligned. An assignment to a FIXED variable truncates (a quotient
+# towards zero) and checks the range, unless the interval of the value
+# (interval()) fits. The intervals of FIXED scalars are narrowed from
+# statement to statement by the assignments, the IF and DO WHILE/UNTIL
+# conditions and the TO values (self.facts); READ, GET LIST and SQL statements reset them.
+#
+# A SELECT with many WHEN values, all constants of the type of the subject,
+# looks the subject up in a dict of the values (built once, before the
+# top-level statement) and branches on the number of the WHEN found with a
+# binary tree of ifs, instead of comparing it with every value: the lookup
+# is O(1), the branch O(log n). The WHEN bodies stay inline in the function
+# (a dict of functions would make their variables nonlocal, as in the ON
+# units, and cost a call per SELECT).
+#
+# A counted DO (DO i = a TO b BY c;) becomes a for loop over a range() if
+# the body doesn't assign i, the step is a constant and every value of i
+# fits its declaration; i is assigned its final value after the loop. Any
+# other counted DO is a while loop that steps i itself. TO and BY are
+# evaluated once, before the first iteration.
+#
+# The temporaries of the optimizer (plithon_optimize.py) are plain locals:
+# a Temp has the type, scale and interval of the expression it holds.
+#
+# The runtime modules are imported once, when the generated module is
+# imported; the runtime names a program uses are bound to locals at the
+# start of the program function (plithon_runtime).
+#
+# An ON ENDFILE or ON KEY unit becomes a nested function, assigned when the
+# ON statement is executed; the READ statements of the file pass it to the
+# record I/O runtime (plithon_runtime.records), the statements of a KEYED
+# file that return False for the KEY condition pass the ON KEY unit to key()
+# (plithon_runtime.keyed).
+#
+# A structure (DCL 1 s, 2 field type, ...) becomes a class with a slot per
+# field and the struct layout of its record (plithon_runtime.structures);
+# its fields are referenced qualified (s.field) and typed like scalars (the
+# facts of a FIXED field are kept under 's.field'). READ INTO and WRITE FROM
+# a structure call read_into() and write_from() of the file.
+#
+# CALL PLISRTA(sort, record, storage, rc); assigns rc the return code of
+# plisrta() (plithon_runtime.sort); constant control statements are checked
+# when the program is translated.
+#
+# The module ends with its SOURCE_MAP: per statement with a lineno its PL/I
+# line, the first and last line of its code and the name of its AST class,
+# ordered by the first line with the enclosing statements first. The
+# profiler (plithon_profile.py) adds the time of the lines up per statement.
+# =============================================================================
+import ast as python_ast
+import textwrap
+from struct import calcsize
+
+from plithon_ast import (Program, Declare, Structure, Assign, If, Select, DoWhile, DoUntil, DoLoop, Block,
+                         Put, GetList, Open, Read, Write, Rewrite, Delete, Close, OnEndfile, OnKey, Call, ExecSql,
+                         DeclareCursor, OpenCursor, FetchCursor, CloseCursor, Comment, Let,
+                         Num, Str, Var, Subscript, BinOp, Compare, Builtin, Temp, walk, declared)
+from plithon_config import SqlConfig
+from plithon_runtime import INTERFACE
+from plithon_runtime.arrays import CHARSET
+from plithon_runtime.fixed import binary_range, decimal_range
+from plithon_runtime.sql import host_variables
+from plithon_runtime.structures import field_format
+
+# Runtime modules of the generated code
+ARRAYS = 'plithon_runtime.arrays'
+VECTOR = 'plithon_runtime.vector'
+SQL = 'plithon_runtime.sql'
+RECORDS = 'plithon_runtime.records'
+FIXED = 'plithon_runtime.fixed'
+STREAM = 'plithon_runtime.stream'
+STRUCTURES = 'plithon_runtime.structures'
+SORT = 'plithon_runtime.sort'
+
+# Kinds of the numeric symbols: FIXED BIN and FIXED DEC
+FIXED_KINDS = ('bin', 'dec')
+
+# Kind of the symbol of a structure (its fields are symbols name.field)
+STRUCT = 'struct'
+
+# Statements that can assign any variable (READ runs the ON units, the
+# statements of KEYED files the ON KEY unit, CALL assigns its arguments),
+# nothing is known about the values of the FIXED scalars after them
+OPAQUE = (GetList, Read, Rewrite, Delete, Call, ExecSql, OpenCursor, FetchCursor, CloseCursor)
+
+def opaque(node):
+    """True if the node is a statement that can assign any variable (OPAQUE or WRITE ... KEYFROM)."""
+    return isinstance(node, OPAQUE) or isinstance(node, Write) and node.keyfrom is not None
+
+# Pseudo module of the imports: its names are locals of the program function,
+# set to None at its start (e.g. the ON ENDFILE unit of a file)
+LOCAL = ''
+
+# Module constant of the generated code referring to the SQL connection
+# configuration (SqlConfig.reference(), loaded by plithon_runtime.sql)
+SQL_CONNECTION = 'SQL_CONNECTION'
+
+# Module constant mapping the generated code back to the PL/I lines
+# (plithon_profile.py)
+SOURCE_MAP = 'SOURCE_MAP'
+
+# Variables set after the SQL cursor statements if the program declares them:
+# the SQLCODE (0, 100 = not found, < 0 = error) and the number of rows fetched
+SQLCA = ('sqlcode', 'sqlrows')
+
+# Loop variable of the element loops (offset of the current element)
+ELEMENT = '_k'
+
+# Temporary of a column value of SELECT INTO / FETCH INTO, stored if not None
+COLUMN = '_column'
+
+# Options of OPEN FILE and whether they take a number
+FILE_OPTIONS = {'recsize': True, 'bufsize': True, 'mmap': False, 'background': False, 'keyed': False}
+
+# Locals holding the ON ENDFILE and the ON KEY unit of a file
+ENDFILE = '_endfile_'
+KEY = '_key_'
+
+# Prefix of the class of a structure
+STRUCTURE = '_structure_'
+
+# Locals of a SELECT dispatched through a dict: the dict and the WHEN found
+CASES = '_cases'
+CASE = '_case'
+
+# Locals of a counted DO: the range() of its values, its TO and BY values
+RANGE = '_range'
+STOP = '_stop'
+STEP = '_step'
+
+class CodeGenError(Exception):
+    """A statement that parses but can't be translated (e.g. mismatched arrays)."""
+
+# PL/I relational operators and their Python counterparts
+COMPARE_OPS = {'=': '==', '==': '==', '<>': '!=', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+
+# The operator of a false comparison, and of a comparison with its operands swapped
+NEGATED = {'=': '<>', '==': '<>', '<>': '=', '<': '>=', '<=': '>', '>': '<=', '>=': '<'}
+MIRRORED = {'=': '=', '==': '=', '<>': '<>', '<': '>', '<=': '>=', '>': '<', '>=': '<='}
+
+class CodeGenerator:
+    """
+    Emits the Python code of a Program.
+
+    Every Program becomes a function with the name of the procedure, which is
+    called when the generated module is run as a script.
+
+    Args:
+        sql_config: SqlConfig of the EXEC SQL statements; the generated code
+            refers to it, it is loaded when the program runs (default: the
+            environment of the program).
+
+    Set range_analysis to False to check every assignment to a FIXED variable,
+    select_table to the number of WHEN values from which a SELECT of
+    constants dispatches through a dict (None: never), range_loops to False
+    to emit every counted DO as a while loop.
+    """
+    indent = '    '
+    range_analysis = True
+    select_table = 16
+    range_loops = True
+
+    def __init__(self, sql_config=None):
+        self.sql_config = sql_config if sql_config is not None else SqlConfig()
+        self._lines = []
+        self._positions = []
+        self._depth = 0
+        self.symbols = {}
+        self.sqlca = {}
+        self.imports = set()
+        self._mode = None   # None, 'element' or 'numpy' inside whole-array expressions
+        self.facts = {}     # name: (min, max) of FIXED scalars (and TO, BY values) known at the current line
+        self._tables = []   # lines of the SELECT dicts, emitted before the statement
+        self._table_depth = 0
+        self._cases = 0
+        self._loops = 0
+
+    def generate(self, program):
+        """Returns the Python source of the program as one string."""
+        self.declare(program.decls)
+        body = []
+        imports = set()
+        positions = []
+        self.facts = {}
+        for node in program.decls + program.body:
+            lines = self.statement_lines(node, facts=self.facts)
+            imports |= self.imports
+            positions += [(lineno, first + len(body), last + len(body), kind)
+                          for lineno, first, last, kind in self.positions]
+            body += lines
+        return "\n".join(self.program_lines(program.name, body, imports, positions, program.lineno))
+
+    def declare(self, decls):
+        """
+        Sets the symbol table from the declarations of the program; the code
+        of array element accesses depends on it.
+
+        Returns:
+            A hashable summary of the symbol table: the code of a statement
+            only needs to be generated again if it changes.
+        """
+        self.symbols = {name: (STRUCT, None, None) if type is None else
+                        ('varying' if type.varying else type.kind, type.size, dims)
+                        for name, type, dims in declared(decls)}
+        self.sqlca = {name.lower(): name for name in self.symbols if name.lower() in SQLCA}
+        return tuple(sorted(self.symbols.items()))
+
+    def statement_lines(self, node, depth=1, facts=None):
+        """
+        Returns the lines of one top-level declaration or statement; the
+        runtime names they use are left in self.imports, the intervals known
+        after it in self.facts, the positions of the statements (see
+        program_lines) with their first and last line counted from 0 in
+        self.positions.
+
+        Args:
+            facts: The intervals known before the statement (self.facts
+                after the previous one), default: none.
+        """
+        self._lines = []
+        self._positions = []
+        self._depth = depth
+        self._mode = None
+        self.facts = dict(facts or {})
+        self.imports = set()
+        self._tables = []
+        self._table_depth = depth
+        self._cases = 0
+        self._loops = 0
+        self.statement(node)
+        shift = len(self._tables)
+        # in the order of their code, a statement before those it contains
+        self.positions = sorted(((lineno, first + shift, last + shift, kind)
+                                 for lineno, first, last, kind in self._positions),
+                                key=lambda position: (position[1], -position[2]))
+        return self._tables + self._lines
+
+    def program_lines(self, name, body, imports=(), positions=(), lineno=0):
+        """
+        Wraps the lines of the top-level statements into the program function.
+
+        Args:
+            name: Name of the procedure.
+            body: Lines of the top-level statements.
+            imports: (module, name) pairs of the runtime names used.
+            positions: (PL/I line, first, last, kind) of the statements: the
+                lines of their code in body (counted from 0) and the name of
+                their AST class; they become the SOURCE_MAP of the module.
+            lineno: Line of the PROC statement.
+        """
+        modules = {}
+        for module, symbol in sorted(imports):
+            modules.setdefault(module, []).append(symbol)
+        local = [f"{self.indent}{symbol} = None" for symbol in modules.pop(LOCAL, ())]
+        # the runtime names are locals of the program function, bound once
+        bound = [f"{self.indent}{symbol} = {module}.{symbol}"
+                 for module, symbols in modules.items() for symbol in symbols]
+        lines = [f"import {module}" for module in modules]
+        if modules:
+            lines.append(f"plithon_runtime.require({INTERFACE})")
+        if SQL in modules:
+            lines.append(f"{SQL_CONNECTION} = {self.sql_config.reference()!r}")
+        function = [f"def {name}():"] + (bound + local + body or [self.indent + "pass"])
+        # line numbers of the module count from 1
+        start = len(lines) + 1 + len(bound) + len(local) + 1
+        entries = [(lineno, len(lines) + 1, len(lines) + len(function), 'Program')] if lineno else []
+        entries += [(line, first + start, last + start, kind) for line, first, last, kind in positions]
+        return (lines + function + self.source_map(entries) +
+                ["if __name__ == '__main__':", f"{self.indent}{name}()"])
+
+    def source_map(self, entries):
+        """The SOURCE_MAP constant: a tuple of (PL/I line, first line, last line, kind)."""
+        rows = []
+        row = self.indent
+        for entry in entries:
+            text = f"{entry!r}, "
+            if len(row) + len(text) > 100 and row.strip():
+                rows.append(row.rstrip())
+                row = self.indent
+            row += text
+        if row.strip():
+            rows.append(row.rstrip())
+        return ["# PL/I line, first and last line of the code and kind of the statements",
+                f"{SOURCE_MAP} = ("] + rows + [")"]
+
+    def runtime(self, module, name):
+        """Returns a runtime name and records its import."""
+        self.imports.add((module, name))
+        return name
+
+    def emit(self, line):
+        self._lines.append(self.indent * self._depth + line)
+
+    def block(self, body):
+        """Emits a statement list one level deeper than the current line."""
+        self._depth += 1
+        if body:
+            for stmt in body:
+                self.statement(stmt)
+        else:
+            self.emit("pass")
+        self._depth -= 1
+
+    # =========================================================================
+    # Statements
+    # =========================================================================
+    def statement(self, node):
+        first = len(self._lines)
+        getattr(self, 'visit_' + type(node).__name__)(node)
+        # a Block is only its statements
+        if node.lineno and len(self._lines) > first and not isinstance(node, Block):
+            self._positions.append((node.lineno, first, len(self._lines) - 1, type(node).__name__))
+        if opaque(node):
+            self.facts = {}
+
+    def visit_Declare(self, node):
+        kind, size = node.type.kind, node.type.size
+        if kind in FIXED_KINDS:
+            initial = "0"
+        else:
+            initial = "''" if node.type.varying else f"' ' * {size}"
+        for name, dims in node.items:
+            self.facts.pop(name, None)
+            if dims is None:
+                self.emit(f"{name} = {initial}")
+                if kind in FIXED_KINDS:
+                    self.facts[name] = (0, 0)
+                continue
+            count = 1
+            for dim in dims:
+                count *= dim
+            if kind == 'dec':
+                # an array element holds p digits in 16, 32 or 64 bits
+                bits = (10 ** size[0] - 1).bit_length()
+                if bits > 63:
+                    raise CodeGenError(f"FIXED DEC array {name}: at most 18 digits")
+                self.emit(f"{name} = {self.runtime(ARRAYS, 'fixed_array')}({bits}, {count})")
+            elif kind == 'bin':
+                self.emit(f"{name} = {self.runtime(ARRAYS, 'fixed_array')}({size}, {count})")
+            else:
+                self.emit(f"{name} = {self.runtime(ARRAYS, 'CharArray')}({size}, {count})")
+
+    def visit_Structure(self, node):
+        levels = {level for level, field, type in node.fields}
+        if node.level != 1 or len(levels) != 1 or levels.pop() <= 1:
+            raise CodeGenError(f"DCL {node.level} {node.name}: a structure has level 1 "
+                               f"and fields of one level greater than 1")
+        fields = [field for level, field, type in node.fields]
+        if len(set(fields)) != len(fields) or any(field.startswith('_') or '.' in field for field in fields):
+            raise CodeGenError(f"DCL 1 {node.name}: field names must be unique, without . and _ at the start")
+        formats = []
+        for level, field, type in node.fields:
+            if type.varying:
+                raise CodeGenError(f"{node.name}.{field}: VARYING fields are not supported")
+            if type.kind == 'dec' and type.size[0] > 18:
+                raise CodeGenError(f"{node.name}.{field}: FIXED DEC fields have at most 18 digits")
+            formats.append(field_format(type.kind, type.size))
+        # a class with a slot per field and methods unpacking and packing
+        # the record: the CHAR fields are sliced from the record decoded
+        # once, the numbers unpacked by a layout skipping the CHAR bytes
+        kinds = {type.kind for level, field, type in node.fields}
+        layout = '>' + ''.join(formats)
+        numbers = '>' + ''.join(f"{type.size}x" if type.kind == 'char' else format
+                                for (level, field, type), format in zip(node.fields, formats))
+        self.emit(f"class {STRUCTURE}{node.name}({self.runtime(STRUCTURES, 'Structure')}):")
+        self._depth += 1
+        self.emit(f"__slots__ = {tuple(fields)!r}")
+        self.emit(f"_layout = {self.runtime(STRUCTURES, 'Struct')}({layout!r})")
+        if 'char' in kinds and kinds != {'char'}:
+            self.emit(f"_numbers = {self.runtime(STRUCTURES, 'Struct')}({numbers!r})")
+        self.emit("_buffer = bytearray(_layout.size)")
+        self.emit("def __init__(self):")
+        for level, field, type in node.fields:
+            initial = "0" if type.kind in FIXED_KINDS else f"' ' * {type.size}"
+            self.emit(f"{self.indent}self.{field} = {initial}")
+        self.emit("def _unpack_from(self, _data, _offset=0):")
+        if 'char' in kinds:
+            self.emit(f"{self.indent}_record = _data[_offset:_offset + {calcsize(layout)}].decode({CHARSET!r})")
+            offset = 0
+            for (level, field, type), format in zip(node.fields, formats):
+                if type.kind == 'char':
+                    self.emit(f"{self.indent}self.{field} = _record[{offset}:{offset + type.size}]")
+                offset += calcsize('>' + format)
+        targets = [f"self.{field}" for level, field, type in node.fields if type.kind != 'char']
+        if targets:
+            self.emit(f"{self.indent}{', '.join(targets)}{',' if len(targets) == 1 else ''} = "
+                      f"self.{'_numbers' if 'char' in kinds else '_layout'}.unpack_from(_data, _offset)")
+        self.emit("def _pack_into(self, _data, _offset=0):")
+        values = [f"self.{field}.encode({CHARSET!r}, 'replace')" if type.kind == 'char' else f"self.{field}"
+                  for level, field, type in node.fields]
+        self.emit(f"{self.indent}self._layout.pack_into(_data, _offset, {', '.join(values)})")
+        self._depth -= 1
+        self.emit(f"{node.name} = {STRUCTURE}{node.name}()")
+        for level, field, type in node.fields:
+            if type.kind in FIXED_KINDS:
+                self.facts[f"{node.name}.{field}"] = (0, 0)
+
+    def visit_Assign(self, node):
+        target = node.target
+        if isinstance(target, Var) and self.dims_of(target.name) is not None:
+            self.array_assign(target.name, node.expr)
+        elif isinstance(target, Var) and self.char_kind(target.name):
+            self.char_assign(target.name, node.expr)
+        elif self.fixed_symbol(target) is not None:
+            symbol = self.fixed_symbol(target)
+            self.fixed_store(target, *self.fixed_value(node.expr, self.symbol_scale(symbol)))
+        else:
+            self.store(target, self.value(node.expr), self.is_integer(node.expr))
+
+    def fixed_value(self, node, scale):
+        """
+        Code and interval of the value of an expression as an int scaled by
+        10**scale: more decimal places are truncated, a quotient of scaled
+        ints is computed exactly.
+
+        Returns:
+            A tuple (code, (min, max) or None if the range is unknown).
+        """
+        if isinstance(node, BinOp) and node.op == '/':
+            left, right = self.scale(node.left), self.scale(node.right)
+            if left is not None and right is not None:
+                dividend, divisor = self.expr(node.left), self.expr(node.right)
+                first, second = self.interval(node.left), self.interval(node.right)
+                shift = scale + right - left
+                if shift > 0:
+                    dividend = f"{dividend} * {10 ** shift}"
+                    first = first and interval_product(first, (10 ** shift, 10 ** shift))
+                elif shift < 0:
+                    divisor = f"({divisor} * {10 ** -shift})"
+                    second = second and interval_product(second, (10 ** -shift, 10 ** -shift))
+                return self.quotient(dividend, divisor, first, second)
+        code = self.expr(node)
+        own = self.scale(node)
+        if own is None:
+            if scale == 0:
+                return f"int({code})", None
+            return f"{self.runtime(FIXED, 'scaled')}({code}, {scale})", None
+        interval = self.interval(node)
+        if own < scale:
+            factor = 10 ** (scale - own)
+            return self.rescaled(node, code, factor), interval and interval_product(interval, (factor, factor))
+        if own > scale:
+            factor = 10 ** (own - scale)
+            return self.quotient(code, str(factor), interval, (factor, factor))
+        return code, interval
+
+    def quotient(self, dividend, divisor, first, second):
+        """Code and interval of the int quotient truncated towards zero."""
+        interval = interval_quotient(first, second) if first and second else None
+        if first and second and first[0] >= 0 and second[0] > 0:
+            return f"{dividend} // {divisor}", interval
+        return f"{self.runtime(FIXED, 'divide')}({dividend}, {divisor})", interval
+
+    def fixed_store(self, target, code, interval):
+        """
+        Emits the assignment of a scaled int to a FIXED variable or element
+        and the range check, if the interval of the value doesn't fit.
+        """
+        symbol = self.fixed_symbol(target)
+        low, high = self.fixed_range(symbol)
+        if isinstance(target, Subscript):
+            code = self.checked(target.name, symbol, code, interval)
+            self.emit(f"{target.name}[{self.offset(target, symbol[2])}] = {code}")
+            return
+        self.emit(f"{target.name} = {code}")
+        if not self.fits(symbol, interval):
+            self.overflow_check(target.name, target.name, symbol)
+            interval = interval and (max(low, interval[0]), min(high, interval[1]))
+        if interval is None or interval[0] > interval[1]:
+            interval = (low, high)
+        self.facts[target.name] = interval
+
+    def checked(self, name, symbol, code, interval):
+        """
+        Code of a value for an element of a FIXED array, checked like the
+        value of a scalar (the typed array of FIXED BIN elements would raise
+        a plain OverflowError without the name of the array).
+        """
+        if self.fits(symbol, interval):
+            return code
+        self.emit(f"_v = {code}")
+        self.overflow_check(name, "_v", symbol)
+        return "_v"
+
+    def overflow_check(self, name, code, symbol):
+        low, high = self.fixed_range(symbol)
+        scale = self.symbol_scale(symbol)
+        args = f"{name!r}, {code}" + (f", {scale}" if scale else "")
+        self.emit(f"if not {low} <= {code} <= {high}:")
+        self.emit(f"{self.indent}raise {self.runtime(FIXED, 'FixedOverflow')}({args})")
+
+    def fits(self, symbol, interval):
+        """True if all values of the interval are in the range of the symbol."""
+        low, high = self.fixed_range(symbol)
+        return interval is not None and low <= interval[0] and interval[1] <= high
+
+    def fixed_symbol(self, node):
+        """Symbol of a FIXED scalar (Var) or FIXED array element (Subscript), else None."""
+        symbol = self.symbols.get(node.name)
+        if symbol is None or symbol[0] not in FIXED_KINDS:
+            return None
+        if isinstance(node, Var):
+            return symbol if symbol[2] is None else None
+        return symbol if self.array_of(node) is not None else None
+
+    def fixed_range(self, symbol):
+        """(min, max) of the scaled values of a FIXED symbol."""
+        kind, size, dims = symbol
+        return binary_range(size) if kind == 'bin' else decimal_range(size[0])
+
+    def symbol_scale(self, symbol):
+        """Decimal places of a FIXED symbol."""
+        return symbol[1][1] if symbol[0] == 'dec' else 0
+
+    def char_assign(self, name, expr):
+        """Emits the assignment of an expression to a CHAR scalar."""
+        kind, size, dims = self.symbols[name]
+        if isinstance(expr, Str):
+            value = expr.value[:size]
+            self.emit(f"{name} = {(value if kind == 'varying' else value.ljust(size))!r}")
+        elif kind == 'varying' and isinstance(expr, BinOp) and expr.op == '||' and \
+                isinstance(expr.left, Var) and expr.left.name == name:
+            self.emit(f"{name} += {self.char_expr(expr.right)}")
+            self.emit(f"if len({name}) > {size}:")
+            self.emit(f"{self.indent}{name} = {name}[:{size}]")
+        elif self.char_length(expr) == size or (
+                kind == 'varying' and (self.char_length(expr) or size + 1) <= size):
+            # the value already has the length of the variable
+            self.emit(f"{name} = {self.expr(expr)}")
+        else:
+            self.store(Var(name), self.value(expr), False, self.is_char(expr) or bool(self.scale(expr)))
+
+    def char_length(self, node):
+        """Length of a string expression if it is known, else None."""
+        if isinstance(node, Temp):
+            return self.char_length(node.expr)
+        if isinstance(node, Str):
+            return len(node.value)
+        if isinstance(node, Var) and self.char_kind(node.name) == 'char':
+            return self.symbols[node.name][1]
+        if isinstance(node, BinOp) and node.op == '||':
+            left, right = self.char_length(node.left), self.char_length(node.right)
+            return None if left is None or right is None else left + right
+        if isinstance(node, Builtin) and node.name == 'substr' and len(node.args) == 3 and \
+                isinstance(node.args[2], Num) and self.char_length(node.args[0]) is not None:
+            # the string can be shorter than start + length - 1
+            start, length = node.args[1], node.args[2].value
+            if isinstance(start, Num) and start.value - 1 + length <= self.char_length(node.args[0]):
+                return length
+        return None
+
+    def char_kind(self, name):
+        """'char' or 'varying' for a declared CHAR scalar, else None."""
+        symbol = self.symbols.get(name)
+        if symbol is None or symbol[0] not in ('char', 'varying') or symbol[2] is not None:
+            return None
+        return symbol[0]
+
+    def array_assign(self, name, expr):
+        """Emits the assignment of an expression to all elements of an array."""
+        kind, size, dims = self.symbols[name]
+        operands = self.array_operands(expr)
+        for operand in operands:
+            if self.dims_of(operand) != dims:
+                raise CodeGenError(f"Array {operand} doesn't have the dimensions of {name}")
+        if not operands:
+            if kind in FIXED_KINDS:
+                value = self.checked(name, self.symbols[name],
+                                     *self.fixed_value(expr, self.symbol_scale(self.symbols[name])))
+            else:
+                value = self.value(expr)
+            self.emit(f"{self.runtime(ARRAYS, 'fill')}({name}, {value})")
+        elif isinstance(expr, Var) and (self.symbols[expr.name][0] != 'dec' and kind != 'dec' or
+                                        self.symbols[expr.name][:2] == (kind, size)):
+            self.emit(f"{self.runtime(ARRAYS, 'copy')}({name}, {expr.name}, {name!r})")
+        elif kind == 'bin' and size <= 31 and self.vector_bound(expr) is not None:
+            self.emit(f"if {self.runtime(VECTOR, 'NUMPY')}:")
+            self._depth += 1
+            self.emit(f"{self.runtime(VECTOR, 'assign')}({name}, {self.mode_expr('numpy', self.vector_expr, expr)}, "
+                      f"{name!r})")
+            self._depth -= 1
+            self.emit("else:")
+            self._depth += 1
+            self.element_loop(name, kind, dims, expr)
+            self._depth -= 1
+        else:
+            self.element_loop(name, kind, dims, expr)
+
+    def element_loop(self, name, kind, dims, expr):
+        count = 1
+        for dim in dims:
+            count *= dim
+        self.emit(f"for {ELEMENT} in range({count}):")
+        self._depth += 1
+        if kind in FIXED_KINDS:
+            symbol = self.symbols[name]
+            value = self.checked(name, symbol, *self.mode_expr('element', self.fixed_value, expr,
+                                                               self.symbol_scale(symbol)))
+            self.emit(f"{name}[{ELEMENT}] = {value}")
+        else:
+            self.emit(f"{name}.store({ELEMENT}, {self.mode_expr('element', self.value, expr)})")
+        self._depth -= 1
+
+    def mode_expr(self, mode, convert, *args):
+        """
+        Calls convert (self.expr, self.value, ...) for the NumPy or the element
+        version of a whole-array expression and returns its result.
+        """
+        self._mode = mode
+        try:
+            return convert(*args)
+        finally:
+            self._mode = None
+
+    def array_operands(self, node):
+        """Names of the whole arrays used in an expression."""
+        if isinstance(node, Var):
+            return [node.name] if self.dims_of(node.name) is not None else []
+        if isinstance(node, BinOp):
+            return self.array_operands(node.left) + self.array_operands(node.right)
+        if isinstance(node, Builtin):
+            return [name for arg in node.args for name in self.array_operands(arg)]
+        return []
+
+    def vector_bound(self, node):
+        """
+        Bound of the magnitude of the values of a whole-array expression and
+        of its intermediate results if NumPy can evaluate it in int64 without
+        wrapping around, else None (FIXED BIN(>31) arrays, unknown ranges).
+        """
+        if isinstance(node, Var) and self.dims_of(node.name) is not None:
+            kind, size, dims = self.symbols[node.name]
+            return -binary_range(size)[0] if kind == 'bin' and size <= 31 else None
+        if isinstance(node, BinOp) and node.op in ('+', '-', '*', '/'):
+            left, right = self.vector_bound(node.left), self.vector_bound(node.right)
+            if left is None or right is None:
+                return None
+            # a quotient of ints is at most the dividend
+            bound = {'+': left + right, '-': left + right, '*': left * right, '/': left}[node.op]
+            bound = max(bound, left, right)
+        elif isinstance(node, Builtin):
+            if node.name != 'mod':
+                return None
+            bounds = [self.vector_bound(arg) for arg in node.args]
+            if None in bounds:
+                return None
+            bound = max(bounds)
+        elif not self.is_integer(node):
+            return None
+        elif isinstance(node, Num):
+            bound = abs(node.value)
+        else:
+            symbol = self.fixed_symbol(node) if isinstance(node, (Var, Subscript)) else None
+            interval = self.fixed_range(symbol) if symbol is not None else self.interval(node)
+            if interval is None:
+                return None
+            bound = max(-interval[0], interval[1])
+        return bound if bound < 1 << 63 else None
+
+    def vector_expr(self, node):
+        """
+        NumPy code of a whole-array expression; its quotient is exact like
+        that of the element loop, nested quotients are floats in both.
+        """
+        if isinstance(node, BinOp) and node.op == '/':
+            return f"{self.runtime(VECTOR, 'divide')}({self.expr(node.left)}, {self.expr(node.right)})"
+        return self.expr(node)
+
+    def store(self, target, value, integer, text=False):
+        """
+        Emits the assignment of the code value to a variable or element.
+
+        Args:
+            target: Var or Subscript node.
+            value: Python code of the value.
+            integer: True if the value is known to be an int; other values
+                are converted with int() for FIXED BIN targets, all values
+                are converted to the scaled int of FIXED DEC targets.
+            text: True if the value is known to be a str (padded and cut
+                with str methods for CHAR targets instead of formatted).
+        """
+        array = self.array_of(target)
+        kind = self.char_kind(target.name) if isinstance(target, Var) else None
+        symbol = self.fixed_symbol(target)
+        if symbol is not None:
+            if symbol[0] == 'dec':
+                value = f"{self.runtime(FIXED, 'scaled')}({value}, {self.symbol_scale(symbol)})"
+            elif not integer:
+                value = f"int({value})"
+            self.fixed_store(target, value, None)
+        elif kind == 'char' and text:
+            size = self.symbols[target.name][1]
+            self.emit(f"{target.name} = {value}.ljust({size})[:{size}]")
+        elif kind == 'char':
+            self.emit(f"{target.name} = '%-{self.symbols[target.name][1]}.{self.symbols[target.name][1]}s' % ({value},)")
+        elif kind == 'varying' and text:
+            self.emit(f"{target.name} = {value}[:{self.symbols[target.name][1]}]")
+        elif kind == 'varying':
+            self.emit(f"{target.name} = '%.{self.symbols[target.name][1]}s' % ({value},)")
+        elif array is None:
+            self.emit(f"{self.expr(target)} = {value}")
+        else:
+            self.emit(f"{target.name}.store({self.offset(target, array[2])}, {value})")
+
+    def visit_If(self, node):
+        facts = self.facts
+        self.emit(f"if {self.expr(node.cond)}:")
+        self.narrow(facts, node.cond, True)
+        self.block(node.then)
+        then = self.facts
+        self.emit("else:")
+        self.narrow(facts, node.cond, False)
+        self.block(node.orelse)
+        self.facts = joined([then, self.facts])
+
+    def visit_Select(self, node):
+        facts = self.facts
+        if self.select_table is not None and len(node.whens) >= self.select_table:
+            table = self.case_table(node)
+            if table is not None:
+                self.select_dispatch(node, *table)
+                return
+        subject = self.expr(node.subject)
+        stripped = None
+        if len(node.whens) > 1 and self.is_char(node.subject):
+            # strip the trailing blanks of the subject once, not for every WHEN
+            self._cases += 1
+            stripped = f"{CASE}{self._cases}"
+            self.emit(f"{stripped} = {self.unpadded(node.subject, subject)}")
+        keyword = "if"
+        branches = []
+        for value, body in node.whens:
+            if stripped is not None and self.is_char(value):
+                test = f"{stripped} == {self.unpadded(value)}"
+            else:
+                test = self.compare('=', node.subject, value, subject)
+            self.emit(f"{keyword} {test}:")
+            self.facts = dict(facts)
+            self.block(body)
+            branches.append(self.facts)
+            keyword = "elif"
+        if node.other:
+            if keyword == "if":
+                # SELECT without any WHEN: only the OTHER part remains
+                for stmt in node.other:
+                    self.statement(stmt)
+                return
+            self.emit("else:")
+            self.facts = dict(facts)
+            self.block(node.other)
+            branches.append(self.facts)
+        else:
+            branches.append(facts)
+        self.facts = joined(branches)
+
+    def case_table(self, node):
+        """
+        Returns (code of the key of the subject, {key: number of the WHEN})
+        if all WHEN values are constants of the type of the subject (the
+        first of equal values is taken), else None.
+        """
+        subject = node.subject
+        values = [value for value, body in node.whens]
+        if self.is_char(subject) and all(isinstance(value, Str) for value in values):
+            # strings are compared without trailing blanks
+            code = self.unpadded(subject)
+            keys = [value.value.rstrip(' ') for value in values]
+        elif self.scale(subject) is not None and all(isinstance(value, Num) for value in values):
+            scale = max([self.scale(subject)] + [self.scale(value) for value in values])
+            code = self.expr(subject)
+            if scale > self.scale(subject):
+                code = self.rescaled(subject, code, 10 ** (scale - self.scale(subject)))
+            keys = [int(self.expr_Num(value)) * 10 ** (scale - self.scale(value)) for value in values]
+        else:
+            return None
+        table = {}
+        for case, key in enumerate(keys):
+            table.setdefault(key, case)
+        return code, table
+
+    def select_dispatch(self, node, code, table):
+        """Emits a SELECT that finds the WHEN of the subject in a dict."""
+        self._cases += 1
+        cases, case = f"{CASES}{self._cases}", f"{CASE}{self._cases}"
+        # the WHENs that can be taken (not those of a repeated value), the
+        # OTHER part (or nothing) last
+        numbers = sorted(table.values())
+        bodies = [node.whens[number][1] for number in numbers] + [node.other or []]
+        entries = ", ".join(f"{key!r}: {numbers.index(number)}" for key, number in table.items())
+        self._tables.append(f"{self.indent * self._table_depth}{cases} = {{{entries}}}")
+        self.emit(f"{case} = {cases}.get({code}, {len(numbers)})")
+        facts = self.facts
+        branches = []
+        self.case_tree(case, bodies, 0, len(bodies) - 1, facts, branches)
+        self.facts = joined(branches)
+
+    def case_tree(self, case, bodies, first, last, facts, branches, keyword="if"):
+        """
+        Emits a binary tree of ifs running bodies[case] (first < last): about
+        log2(n) int comparisons after the dict lookup, not a jump table,
+        because the bodies must run inline in the program function, where
+        their variables are fast locals.
+        """
+        middle = (first + last + 1) // 2
+        self.emit(f"{keyword} {case} < {middle}:")
+        if first == middle - 1:
+            self.case_body(bodies[first], facts, branches)
+        else:
+            self._depth += 1
+            self.case_tree(case, bodies, first, middle - 1, facts, branches)
+            self._depth -= 1
+        if middle == last:
+            self.emit("else:")
+            self.case_body(bodies[last], facts, branches)
+        else:
+            self.case_tree(case, bodies, middle, last, facts, branches, "elif")
+
+    def case_body(self, body, facts, branches):
+        self.facts = dict(facts)
+        self.block(body)
+        branches.append(self.facts)
+
+    def visit_DoWhile(self, node):
+        # not "while cond:" - CPython 3.11 specializes the byte code of a
+        # function called once only at a JUMP_BACKWARD, which this loop has
+        # (x += y; on a str is only done in place by the specialized code)
+        self.emit("while True:")
+        self.emit(f"{self.indent}if not {self.expr(node.cond)}:")
+        self.emit(f"{self.indent * 2}break")
+        entry = self.loop_entry(self.assigned(node.body))
+        self.narrow(entry, node.cond, True)
+        self.block(node.body)
+        self.narrow(entry, node.cond, False)
+
+    def loop_entry(self, assigned):
+        """
+        What is known at the start of every iteration of a loop whose body
+        assigns the variables assigned (see assigned()): the intervals of the
+        variables the body doesn't assign, and a bound of those it only
+        counts up (down) from their value before the loop.
+        """
+        entry = {}
+        for name, (low, high) in ({} if assigned is None else self.facts).items():
+            if name not in assigned:
+                entry[name] = (low, high)
+            elif assigned[name] != 0:
+                limit = self.fixed_range(self.symbols[name])
+                entry[name] = (low, limit[1]) if assigned[name] > 0 else (limit[0], high)
+        return entry
+
+    def visit_DoUntil(self, node):
+        self.emit("while True:")
+        self.facts = self.loop_entry(self.assigned(node.body))
+        self._depth += 1
+        for stmt in node.body:
+            self.statement(stmt)
+        self.emit(f"if {self.expr(node.cond)}:")
+        self.emit(f"{self.indent}break")
+        self._depth -= 1
+        self.narrow(self.facts, node.cond, True)
+
+    def visit_DoLoop(self, node):
+        var = node.var
+        symbol = self.fixed_symbol(var)
+        if symbol is None or symbol[2] is not None:
+            raise CodeGenError(f"DO {var.name} = ...: {var.name} is not a FIXED scalar")
+        step = node.step if node.step is not None else Num(1)
+        sign = None
+        if isinstance(step, Num):
+            sign = (step.value > 0) - (step.value < 0)
+        assigned = self.assigned(node.body)
+        self._loops += 1
+        if self.range_loops and sign and assigned is not None and var.name not in assigned and \
+                self.symbol_scale(symbol) == self.scale(node.start) == self.scale(node.stop) == 0 and \
+                self.scale(step) == 0 and var not in walk(node.stop):
+            values = self.loop_values(node.start, node.stop, sign)
+            if values is not None and self.fits(symbol, values):
+                self.range_loop(node, step.value, values, assigned)
+                return
+        self.while_loop(node, step, sign)
+
+    def loop_values(self, start, stop, sign):
+        """Interval of the values a counted DO assigns in its iterations (None if unknown)."""
+        first, last = self.interval(start), self.interval(stop)
+        if first is None or last is None:
+            return None
+        if sign > 0:
+            return first[0], max(first[0], last[1])
+        return min(first[1], last[0]), first[1]
+
+    def range_loop(self, node, step, values, assigned):
+        """
+        Emits a counted DO as a for loop over a range(): the body doesn't
+        assign the variable, and all its values fit into it.
+        """
+        var = node.var
+        first, last = self.interval(node.start), self.interval(node.stop)
+        start, stop = self.expr(node.start), self.expr(node.stop)
+        # range() excludes the stop value
+        if isinstance(node.stop, Num):
+            stop = str(node.stop.value + (1 if step > 0 else -1))
+        else:
+            stop = f"{stop} {'+' if step > 0 else '-'} 1"
+        args = f"{start}, {stop}" + (f", {step}" if step != 1 else "")
+        # after the loop the variable is the first value beyond TO (start if none)
+        if isinstance(node.start, Num) and isinstance(node.stop, Num):
+            final = node.start.value + len(range(node.start.value, int(stop), step)) * step
+            after = (final, final)
+        elif step > 0:
+            after = (first[0], max(first[1], last[1] + step))
+        else:
+            after = (min(first[0], last[0] + step), first[1])
+        if after[0] == after[1]:
+            values_range = f"range({args})"
+            final = str(after[0])
+        else:
+            values_range = f"{RANGE}{self._loops}"
+            self.emit(f"{values_range} = range({args})")
+            final = f"{values_range}.start + len({values_range})" + (f" * {step}" if step != 1 else "")
+        self.emit(f"for {var.name} in {values_range}:")
+        entry = self.loop_entry(assigned)
+        self.facts = dict(entry)
+        self.facts[var.name] = values
+        self.block(node.body)
+        self.facts = entry
+        self.fixed_store(var, final, after)
+
+    def while_loop(self, node, step, sign):
+        """
+        Emits a counted DO as a while loop: i = start; while i <= stop: ...
+        i = i + step; TO and BY are evaluated once, after start is assigned.
+        """
+        var = node.var
+        self.visit_Assign(Assign(var, node.start))
+        stop = self.loop_bound(node.stop, STOP)
+        step = self.loop_bound(step, STEP)
+        body = node.body + [Assign(var, BinOp('+', var, step))]
+        self.emit("while True:")
+        if sign is None:
+            # the direction is only known at run time
+            first, second = self.aligned(var, stop)
+            self.emit(f"{self.indent}if not ({first} <= {second} if {self.expr(step)} >= 0 else "
+                      f"{first} >= {second}):")
+            cond = None
+        else:
+            cond = Compare('<=' if sign >= 0 else '>=', var, stop)
+            self.emit(f"{self.indent}if not {self.compare(cond.op, var, stop)}:")
+        self.emit(f"{self.indent * 2}break")
+        entry = self.loop_entry(self.assigned(body))
+        self.narrow(entry, cond, True)
+        self.block(body)
+        self.narrow(entry, cond, False)
+
+    def loop_bound(self, node, prefix):
+        """
+        The TO or BY value of a counted DO: a constant, or a Temp evaluated
+        once whose interval is kept in the facts (the body can't change it).
+        """
+        if isinstance(node, Num):
+            return node
+        name = f"{prefix}{self._loops}"
+        self.emit(f"{name} = {self.expr(node)}")
+        interval = self.interval(node)
+        if interval is not None:
+            self.facts[name] = interval
+        return Temp(name, node)
+
+    def assigned(self, body):
+        """
+        Returns the scalars a statement list assigns, None if it can assign
+        any: name -> 1 (-1) if all assignments add (subtract) a constant >= 0
+        to the variable itself (i = i + 1;), else 0.
+        """
+        names = {}
+        for node in walk(body):
+            if opaque(node):
+                return None
+            if isinstance(node, DoLoop):
+                names[node.var.name] = 0
+            if isinstance(node, Assign) and isinstance(node.target, Var):
+                name, expr = node.target.name, node.expr
+                step = 0
+                if isinstance(expr, BinOp) and expr.op in ('+', '-') and isinstance(expr.right, Num) and \
+                        expr.right.value >= 0 and expr.left == node.target:
+                    step = 1 if expr.op == '+' else -1
+                names[name] = step if names.get(name, step) == step else 0
+        return names
+
+    def narrow(self, facts, cond, truth):
+        """
+        Sets self.facts to a copy of facts with the intervals of the FIXED
+        scalars compared in cond narrowed to the values for which cond is truth.
+        """
+        self.facts = dict(facts)
+        if not isinstance(cond, Compare):
+            return
+        op = cond.op if truth else NEGATED[cond.op]
+        for var, other, op in ((cond.left, cond.right, op), (cond.right, cond.left, MIRRORED[op])):
+            symbol = self.fixed_symbol(var) if isinstance(var, Var) else None
+            bound = self.interval(other) if symbol is not None else None
+            if bound is None or self.scale(other) != self.symbol_scale(symbol):
+                continue
+            low, high = self.interval(var)
+            if op in ('=', '=='):
+                low, high = max(low, bound[0]), min(high, bound[1])
+            elif op == '<':
+                high = min(high, bound[1] - 1)
+            elif op == '<=':
+                high = min(high, bound[1])
+            elif op == '>':
+                low = max(low, bound[0] + 1)
+            elif op == '>=':
+                low = max(low, bound[0])
+            if low <= high:
+                self.facts[var.name] = (low, high)
+
+    def visit_Block(self, node):
+        for stmt in node.body:
+            self.statement(stmt)
+
+    def visit_Put(self, node):
+        self.emit(f"print({', '.join(self.value(item) for item in node.items)})")
+
+    def visit_GetList(self, node):
+        for name in node.names:
+            self.input_store(name, f"{self.runtime(STREAM, 'get_item')}({name!r})")
+
+    def input_store(self, name, value):
+        """
+        Emits the assignment of a value read at run time (GET LIST, SELECT
+        INTO, FETCH INTO) to a variable: converted like by an assignment for
+        CHAR and FIXED scalars, FIXED values are checked against their range.
+        """
+        if self.char_kind(name) or self.fixed_symbol(Var(name)) is not None:
+            self.store(Var(name), value, False)
+        else:
+            self.emit(f"{name} = {value}")
+
+    def column_store(self, name, value):
+        """
+        Emits the assignment of a column value (SELECT INTO, FETCH INTO) like
+        input_store(); None (NULL, no row or a failed SELECT INTO, reported
+        by the runtime) leaves a CHAR or FIXED target unchanged.
+        """
+        if not self.char_kind(name) and self.fixed_symbol(Var(name)) is None:
+            self.input_store(name, value)
+            return
+        self.emit(f"{COLUMN} = {value}")
+        self.emit(f"if {COLUMN} is not None:")
+        self._depth += 1
+        self.input_store(name, COLUMN)
+        self._depth -= 1
+
+    def visit_Open(self, node):
+        args = [repr(node.file), repr(node.mode)]
+        for option, value in (node.options or {}).items():
+            if option not in FILE_OPTIONS:
+                raise CodeGenError(f"OPEN FILE('{node.file}'): unknown option {option.upper()}")
+            if FILE_OPTIONS[option] != (value is not None):
+                raise CodeGenError(f"OPEN FILE('{node.file}'): {option.upper()}"
+                                   f"{'(n) needs a number' if FILE_OPTIONS[option] else ' takes no value'}")
+            args.append(f"{option}={value!r}" if value is not None else f"{option}=True")
+        if 'mmap' in (node.options or {}) and (node.mode != 'input' or 'recsize' not in node.options):
+            raise CodeGenError(f"OPEN FILE('{node.file}'): MMAP needs INPUT and RECSIZE(n)")
+        if 'mmap' in (node.options or {}) and 'background' in node.options:
+            raise CodeGenError(f"OPEN FILE('{node.file}'): MMAP and BACKGROUND exclude each other")
+        if 'keyed' in (node.options or {}) and ('mmap' in node.options or 'background' in node.options):
+            raise CodeGenError(f"OPEN FILE('{node.file}'): KEYED excludes MMAP and BACKGROUND")
+        if node.mode == 'update' and 'keyed' not in (node.options or {}):
+            raise CodeGenError(f"OPEN FILE('{node.file}'): UPDATE needs KEYED")
+        self.emit(f"{node.file} = {self.runtime(RECORDS, 'open_file')}({', '.join(args)})")
+
+    def visit_Read(self, node):
+        if node.key is None:
+            read, condition = f"{node.file}.read()", f"{node.file}.endfile"
+            unit = self.runtime(LOCAL, ENDFILE + node.file)
+        else:
+            read, condition = f"{node.file}.read_key({self.value(node.key)})", f"{node.file}.key"
+            unit = self.runtime(LOCAL, KEY + node.file)
+        if self.is_structure(node.target):
+            if node.key is None:
+                self.emit(f"if not {node.file}.read_into({node.target.name}):")
+            else:
+                self.emit(f"if not {node.file}.read_key_into({node.target.name}, {self.value(node.key)}):")
+            self.emit(f"{self.indent}{condition}({unit})")
+            return
+        self.emit(f"_record = {read}")
+        self.emit("if _record is not None:")
+        self._depth += 1
+        kind = self.char_kind(node.target.name) if isinstance(node.target, Var) else None
+        if kind is not None:
+            # a record of the length of the variable is kept as it is (and
+            # an MMAP Record is not decoded)
+            size = self.symbols[node.target.name][1]
+            self.emit(f"{node.target.name} = _record if len(_record) {'==' if kind == 'char' else '<='} {size} "
+                      f"else _record.ljust({size})[:{size}]")
+        else:
+            self.store(node.target, "_record", False)
+        self._depth -= 1
+        self.emit("else:")
+        self.emit(f"{self.indent}{condition}({unit})")
+
+    def visit_Write(self, node):
+        if node.keyfrom is not None:
+            self.keyed(node.file, f"write_key({self.value(node.keyfrom)}, {self.record(node.source)})")
+        elif self.is_structure(node.source):
+            self.emit(f"{node.file}.write_from({node.source.name})")
+        else:
+            self.emit(f"{node.file}.write({self.value(node.source)})")
+
+    def visit_Rewrite(self, node):
+        key = f", {self.value(node.key)}" if node.key is not None else ""
+        self.keyed(node.file, f"rewrite({self.record(node.source)}{key})")
+
+    def visit_Delete(self, node):
+        self.keyed(node.file, f"delete({self.value(node.key) if node.key is not None else ''})")
+
+    def keyed(self, file, call):
+        """Emits a call of a KEYED file returning False for the KEY condition."""
+        self.emit(f"if not {file}.{call}:")
+        self.emit(f"{self.indent}{file}.key({self.runtime(LOCAL, KEY + file)})")
+
+    def record(self, node):
+        """Code of the record written from a variable (the text of the fields of a structure)."""
+        if self.is_structure(node):
+            return f"{node.name}._text()"
+        return self.value(node)
+
+    def is_structure(self, node):
+        """True if the node is the name of a structure."""
+        return isinstance(node, Var) and self.symbols.get(node.name, (None,))[0] == STRUCT
+
+    def visit_Close(self, node):
+        self.emit(f"{node.file}.close()")
+
+    def visit_OnEndfile(self, node):
+        self.on_unit(ENDFILE + node.file, node.body)
+
+    def visit_OnKey(self, node):
+        self.on_unit(KEY + node.file, node.body)
+
+    def on_unit(self, name, body):
+        """Emits an ON unit: the nested function name assigned when the ON statement is executed."""
+        unit = self.runtime(LOCAL, name)
+        start = len(self._lines)
+        positions = len(self._positions)
+        facts, self.facts = self.facts, {}
+        # the unit runs later: it builds its SELECT dicts itself
+        tables, self._tables = self._tables, []
+        depth, self._table_depth = self._table_depth, self._depth + 1
+        self.emit(f"def {unit}():")
+        self.block(body)
+        self.facts = facts
+        self._lines[start + 1:start + 1] = self._tables
+        inserted = len(self._tables)
+        self._tables, self._table_depth = tables, depth
+        # the unit assigns the variables of the program, not locals of its own
+        names = self.assigned_names(self._lines[start + 1:])
+        if names:
+            self._lines.insert(start + 1, self.indent * (self._depth + 1) +
+                               f"nonlocal {', '.join(names)}")
+            inserted += 1
+        self._positions[positions:] = [(lineno, first + inserted, last + inserted, kind)
+                                       for lineno, first, last, kind in self._positions[positions:]]
+
+    def assigned_names(self, lines):
+        """Declared variables and ON units assigned by generated lines, sorted."""
+        tree = python_ast.parse(textwrap.dedent("\n".join(lines)))
+        names = set()
+        for node in python_ast.walk(tree):
+            if isinstance(node, python_ast.Name) and isinstance(node.ctx, python_ast.Store):
+                names.add(node.id)
+            elif isinstance(node, python_ast.FunctionDef):
+                names.add(node.name)
+        return sorted(name for name in names if name in self.symbols or name.startswith((ENDFILE, KEY)))
+
+    def visit_Call(self, node):
+        if node.name != 'plisrta':
+            raise CodeGenError(f"CALL {node.name.upper()}: only PLISRTA is supported")
+        if len(node.args) != 4 or not isinstance(node.args[3], Var) or self.fixed_symbol(node.args[3]) is None:
+            raise CodeGenError("CALL PLISRTA(sort, record, storage, retcode): "
+                               "retcode must be a FIXED variable")
+        sort, record, storage, retcode = node.args
+        # constant control statements are checked now rather than when the program runs
+        # (the sort module is imported only by programs that call it)
+        from plithon_runtime.sort import parse_fields, parse_record
+        try:
+            if isinstance(sort, Str):
+                parse_fields(sort.value)
+            if isinstance(record, Str):
+                parse_record(record.value)
+        except ValueError as error:
+            raise CodeGenError(f"CALL PLISRTA: {error}")
+        scale = self.symbol_scale(self.fixed_symbol(retcode))
+        code = f"{self.runtime(SORT, 'plisrta')}({self.value(sort)}, {self.value(record)}, {self.value(storage)})"
+        self.fixed_store(retcode, f"{code} * {10 ** scale}" if scale else code, (0, 16 * 10 ** scale))
+
+    def visit_ExecSql(self, node):
+        values = ", ".join(f"{name!r}: {self.host_value(name)}" for name in host_variables(node.query))
+        db = f"{self.runtime(SQL, 'connection')}({SQL_CONNECTION})"
+        value = f"{self.runtime(SQL, 'select_into')}({db}, {node.query!r}, {{{values}}})"
+        self.column_store(node.target, value)
+
+    def host_value(self, name):
+        """Code of the value of a host variable: FIXED DEC scalars as their text."""
+        symbol = self.symbols.get(name)
+        if symbol is not None and symbol[0] == 'dec' and symbol[2] is None:
+            return self.value(Var(name))
+        return name
+
+    def visit_DeclareCursor(self, node):
+        names = host_variables(node.query)
+        # host variables are read when the cursor is opened
+        values = (f"lambda: {{{', '.join(f'{name!r}: {self.host_value(name)}' for name in names)}}}"
+                  if names else "None")
+        db = f"{self.runtime(SQL, 'connection')}({SQL_CONNECTION})"
+        self.emit(f"{node.cursor} = {self.runtime(SQL, 'Cursor')}({db}, {node.query!r}, {values})")
+
+    def visit_OpenCursor(self, node):
+        self.emit(f"{node.cursor}.open()")
+        self.sql_status(node.cursor)
+
+    def visit_FetchCursor(self, node):
+        if not all(isinstance(target, str) for target in node.targets):
+            raise CodeGenError(f"FETCH {node.cursor} INTO: only variable names are allowed")
+        arrays = [target for target in node.targets if self.dims_of(target) is not None]
+        if arrays and len(arrays) != len(node.targets):
+            raise CodeGenError(f"FETCH {node.cursor} INTO: either only arrays or only scalars")
+        if arrays:
+            formats = []
+            for target in arrays:
+                symbol = self.symbols[target]
+                if symbol[0] in FIXED_KINDS:
+                    low, high = self.fixed_range(symbol)
+                    formats.append(f"({target!r}, {self.symbol_scale(symbol)}, {low}, {high})")
+                else:
+                    formats.append("None")
+            self.emit(f"{node.cursor}.fetch_into([{', '.join(arrays)}], [{', '.join(formats)}])")
+        else:
+            self.emit(f"_row = {node.cursor}.fetch_row()")
+            self.emit("if _row is not None:")
+            self._depth += 1
+            for column, target in enumerate(node.targets):
+                self.column_store(target, f"_row[{column}]")
+            self._depth -= 1
+        self.sql_status(node.cursor)
+
+    def visit_CloseCursor(self, node):
+        self.emit(f"{node.cursor}.close()")
+        self.sql_status(node.cursor)
+
+    def sql_status(self, cursor):
+        """Copies SQLCODE and the row count of a cursor to the declared SQLCA variables."""
+        if 'sqlcode' in self.sqlca:
+            self.emit(f"{self.sqlca['sqlcode']} = {cursor}.sqlcode")
+        if 'sqlrows' in self.sqlca:
+            self.emit(f"{self.sqlca['sqlrows']} = {cursor}.rows")
+
+    def visit_Comment(self, node):
+        self.emit(f"# {node.text}")
+
+    def visit_Let(self, node):
+        self.emit(f"{node.name} = {self.expr(node.expr)}")
+
+    # =========================================================================
+    # Expressions
+    # =========================================================================
+    def expr(self, node):
+        return getattr(self, 'expr_' + type(node).__name__)(node)
+
+    def expr_Num(self, node):
+        if isinstance(node.value, int):
+            return str(node.value)
+        return str(int(node.value.scaleb(self.scale(node))))
+
+    def expr_Str(self, node):
+        return repr(node.value)
+
+    def expr_Temp(self, node):
+        return node.name
+
+    def expr_Var(self, node):
+        if self.is_structure(node):
+            raise CodeGenError(f"{node.name} is a structure: use its fields ({node.name}.field), "
+                               f"only READ INTO and WRITE FROM take the structure")
+        if '.' in node.name and node.name not in self.symbols:
+            raise CodeGenError(f"{node.name}: no such structure field")
+        if self._mode is not None:
+            symbol = self.symbols.get(node.name)
+            if symbol is not None and symbol[2] is not None:
+                if self._mode == 'numpy':
+                    return f"{self.runtime(VECTOR, 'vec')}({node.name})"
+                if symbol[0] in FIXED_KINDS:
+                    return f"{node.name}[{ELEMENT}]"
+                return f"{node.name}.item({ELEMENT})"
+        return node.name
+
+    def expr_Subscript(self, node):
+        summed = self.sum_of(node)
+        if summed is not None:
+            return f"{self.runtime(VECTOR, 'total')}({summed})"
+        array = self.array_of(node)
+        if array is None:
+            return node.name + "".join(f"[{self.expr(index)}]" for index in node.indexes)
+        if array[0] in FIXED_KINDS:
+            return f"{node.name}[{self.offset(node, array[2])}]"
+        return f"{node.name}.item({self.offset(node, array[2])})"
+
+    def dims_of(self, name):
+        """Dimensions of a declared array, None for scalars and undeclared names."""
+        symbol = self.symbols.get(name)
+        return None if symbol is None else symbol[2]
+
+    def sum_of(self, node):
+        """
+        Returns the array name if the Subscript node is the builtin SUM(array)
+        (SUM is not declared, its argument is a declared array), else None.
+        """
+        if node.name.lower() != 'sum' or node.name in self.symbols or len(node.indexes) != 1:
+            return None
+        arg = node.indexes[0]
+        if not isinstance(arg, Var) or self.dims_of(arg.name) is None:
+            return None
+        if self.symbols[arg.name][0] not in FIXED_KINDS:
+            raise CodeGenError(f"SUM of the CHAR array {arg.name}")
+        return arg.name
+
+    def array_of(self, node):
+        """Returns the symbol of a Subscript of a declared array, else None."""
+        if not isinstance(node, Subscript):
+            return None
+        symbol = self.symbols.get(node.name)
+        if symbol is None or symbol[2] is None or len(symbol[2]) != len(node.indexes):
+            return None
+        return symbol
+
+    def offset(self, node, dims):
+        """Code of the 0-based row major offset of the element node."""
+        terms = []
+        constant = 0
+        stride = 1
+        for index, dim in reversed(list(zip(node.indexes, dims))):
+            if isinstance(index, Num) and isinstance(index.value, int):
+                constant += (index.value - 1) * stride
+            else:
+                code = self.expr(index) if self.scale(index) in (0, None) else self.fixed_value(index, 0)[0]
+                terms.append(code if stride == 1 else f"{code} * {stride}")
+                constant -= stride
+            stride *= dim
+        code = " + ".join(reversed(terms))
+        if not code:
+            return str(constant)
+        if constant > 0:
+            return f"{code} + {constant}"
+        if constant < 0:
+            return f"{code} - {-constant}"
+        return code
+
+    def is_integer(self, node):
+        """True if the value of the expression is known to be an int."""
+        return self.scale(node) == 0
+
+    def scale(self, node):
+        """
+        Decimal places of a numeric expression whose code is a scaled int (0
+        for an int), None if its value is something else (str, float, unknown).
+        """
+        if isinstance(node, Temp):
+            return self.scale(node.expr)
+        if isinstance(node, Num):
+            return 0 if isinstance(node.value, int) else max(0, -node.value.as_tuple().exponent)
+        if isinstance(node, Subscript) and self.sum_of(node) is not None:
+            return self.symbol_scale(self.symbols[node.indexes[0].name])
+        if isinstance(node, (Var, Subscript)):
+            symbol = self.symbols.get(node.name)
+            return self.symbol_scale(symbol) if symbol is not None and symbol[0] in FIXED_KINDS else None
+        if isinstance(node, BinOp) and node.op in ('+', '-', '*'):
+            left, right = self.scale(node.left), self.scale(node.right)
+            if left is None or right is None:
+                return None
+            return left + right if node.op == '*' else max(left, right)
+        if isinstance(node, Builtin):
+            if node.name == 'index':
+                return 0
+            if node.name == 'mod' and self.scale(node.args[1]) == 0:
+                return self.scale(node.args[0])
+        return None
+
+    def interval(self, node):
+        """
+        (min, max) of the scaled value of a numeric expression, None if it
+        is unknown (or range_analysis is off).
+        """
+        if not self.range_analysis:
+            return None
+        if isinstance(node, Temp):
+            # a TO or BY value keeps the interval it had when it was evaluated
+            return self.facts.get(node.name) or self.interval(node.expr)
+        if isinstance(node, Num):
+            value = int(self.expr_Num(node))
+            return value, value
+        if isinstance(node, Subscript) and self.sum_of(node) is not None:
+            symbol = self.symbols[node.indexes[0].name]
+            count = 1
+            for dim in symbol[2]:
+                count *= dim
+            return interval_product(self.fixed_range(symbol), (count, count))
+        if isinstance(node, (Var, Subscript)):
+            symbol = self.symbols.get(node.name)
+            if symbol is None or symbol[0] not in FIXED_KINDS:
+                return None
+            if isinstance(node, Var) and node.name in self.facts:
+                return self.facts[node.name]
+            return self.fixed_range(symbol)
+        if isinstance(node, BinOp) and self.scale(node) is not None:
+            left, right = self.interval(node.left), self.interval(node.right)
+            if left is None or right is None:
+                return None
+            if node.op == '*':
+                return interval_product(left, right)
+            scale = self.scale(node)
+            left = interval_product(left, (10 ** (scale - self.scale(node.left)),) * 2)
+            right = interval_product(right, (10 ** (scale - self.scale(node.right)),) * 2)
+            if node.op == '+':
+                return left[0] + right[0], left[1] + right[1]
+            return left[0] - right[1], left[1] - right[0]
+        if isinstance(node, Builtin) and node.name == 'index':
+            string = node.args[0]
+            length = self.char_length(string)
+            if length is None and isinstance(string, Var) and self.char_kind(string.name) == 'varying':
+                length = self.symbols[string.name][1]
+            return None if length is None else (0, length)
+        if isinstance(node, Builtin) and node.name == 'mod' and self.scale(node) is not None:
+            modulus = node.args[1].value * 10 ** self.scale(node)
+            if modulus > 0:
+                return 0, modulus - 1
+            if modulus < 0:
+                return modulus + 1, 0
+        return None
+
+    def value(self, node):
+        """Code of the value of an expression outside arithmetic: FIXED DEC as its text."""
+        scale = self.scale(node)
+        if scale:
+            return f"{self.runtime(FIXED, 'decimal_text')}({self.expr(node)}, {scale})"
+        return self.expr(node)
+
+    def is_char(self, node):
+        """True if the value of the expression is known to be a str."""
+        if isinstance(node, Temp):
+            return self.is_char(node.expr)
+        if isinstance(node, Str):
+            return True
+        if isinstance(node, (Var, Subscript)):
+            symbol = self.symbols.get(node.name)
+            return symbol is not None and symbol[0] not in FIXED_KINDS and not self.sum_of(node)
+        if isinstance(node, BinOp):
+            return node.op == '||'
+        if isinstance(node, Builtin):
+            return node.name in ('substr', 'decimal')
+        return False
+
+    def char_expr(self, node):
+        """Code of an operand of || (converted with str() unless known to be a str)."""
+        if self.scale(node):
+            return self.value(node)
+        code = self.expr(node)
+        return code if self.is_char(node) else f"str({code})"
+
+    def expr_BinOp(self, node):
+        if node.op == '||':
+            return f"({self.char_expr(node.left)} + {self.char_expr(node.right)})"
+        if node.op == '*':
+            left, right = self.expr(node.left), self.expr(node.right)
+            if self.scale(node) is None:
+                left, right = self.descaled(node.left, left), self.descaled(node.right, right)
+        else:
+            left, right = self.aligned(node.left, node.right)
+        return f"({left} {node.op} {right})"
+
+    def aligned(self, left, right, left_code=None):
+        """
+        Codes of two numeric operands with the same scale: the one with fewer
+        decimal places is multiplied, or both are descaled if a scale is unknown.
+        """
+        first = self.expr(left) if left_code is None else left_code
+        second = self.expr(right)
+        left_scale, right_scale = self.scale(left), self.scale(right)
+        if left_scale is None or right_scale is None:
+            return self.descaled(left, first), self.descaled(right, second)
+        if left_scale < right_scale:
+            first = self.rescaled(left, first, 10 ** (right_scale - left_scale))
+        elif right_scale < left_scale:
+            second = self.rescaled(right, second, 10 ** (left_scale - right_scale))
+        return first, second
+
+    def rescaled(self, node, code, factor):
+        """Code of a scaled operand multiplied by factor, folded for constants."""
+        if isinstance(node, Num):
+            return str(int(code) * factor)
+        return f"{code} * {factor}"
+
+    def descaled(self, node, code):
+        """Code of the true (float) value of a scaled operand."""
+        scale = self.scale(node)
+        return f"({code} / {10 ** scale})" if scale else code
+
+    def expr_Compare(self, node):
+        return f"({self.compare(node.op, node.left, node.right)})"
+
+    def compare(self, op, left, right, left_code=None):
+        """
+        Code of a comparison; strings are compared without trailing blanks,
+        like PL/I pads the shorter one with blanks.
+        """
+        if left_code is None:
+            left_code = self.expr(left)
+        if self.is_char(left) and self.is_char(right):
+            return f"{self.unpadded(left, left_code)} {COMPARE_OPS[op]} {self.unpadded(right)}"
+        first, second = self.aligned(left, right, left_code)
+        return f"{first} {COMPARE_OPS[op]} {second}"
+
+    def unpadded(self, node, code=None):
+        if isinstance(node, Str):
+            return repr(node.value.rstrip(' '))
+        return f"{code if code is not None else self.expr(node)}.rstrip(' ')"
+
+    def expr_Builtin(self, node):
+        name = node.name
+        args = [self.expr(arg) for arg in node.args]
+        if name == 'substr':
+            start = node.args[1]
+            if isinstance(start, Num):
+                first = str(start.value - 1)  # PL/I starts at 1, Python starts at 0
+            else:
+                first = f"{args[1]} - 1"
+            if len(args) == 2:
+                return f"{args[0]}[{first}:]"
+            length = node.args[2]
+            if isinstance(start, Num) and isinstance(length, Num):
+                return f"{args[0]}[{first}:{start.value - 1 + length.value}]"
+            return f"{args[0]}[{first}:{first} + {args[2]}]"
+        if name == 'mod':
+            if self.scale(node):
+                return f"({args[0]} % {node.args[1].value * 10 ** self.scale(node)})"
+            return f"({args[0]} % {args[1]})"
+        if name == 'index':
+            return f"({args[0]}.find({args[1]}) + 1)"
+        if name == 'decimal':
+            return self.value(node.args[0]) if self.scale(node.args[0]) else f"str({args[0]})"
+        raise ValueError(f"unknown builtin {name}")
+
+# =============================================================================
+# Intervals (min, max) of the range analysis
+# =============================================================================
+def interval_product(first, second):
+    """Interval of the products of the values of two intervals."""
+    products = [a * b for a in first for b in second]
+    return min(products), max(products)
+
+def interval_quotient(first, second):
+    """Interval of the int quotients (truncated towards zero) of two intervals."""
+    # a quotient is monotonic in the dividend and, on either side of zero, the divisor
+    divisors = [(low, high) for low, high in ((second[0], min(second[1], -1)),
+                                               (max(second[0], 1), second[1])) if low <= high]
+    if not divisors:
+        return None
+    quotients = [abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1)
+                 for low, high in divisors for a in first for b in (low, high)]
+    return min(quotients), max(quotients)
+
+def joined(branches):
+    """The intervals known after one of the branches ran (their hull)."""
+    first, *others = branches
+    facts = {}
+    for name, (low, high) in first.items():
+        if all(name in other for other in others):
+            facts[name] = (min([low] + [other[name][0] for other in others]),
+                           max([high] + [other[name][1] for other in others]))
+    return facts
+
+def generate(program):
+    """Returns the Python source for a Program node."""
+    return CodeGenerator().generate(program)
@@ -0,0 +1,190 @@
+# =============================================================================
+# Connection configuration of the EXEC SQL statements.
+#
+# The parameters come from the first of these sources:
+#
+#   1. an explicit file (Transpiler(sql_config=path), --sql-config) or dict
+#   2. the file named by the environment variable PLITHON_SQL_CONFIG
+#   3. the environment variables PLITHON_SQL_DRIVER, PLITHON_SQL_HOST,
+#      PLITHON_SQL_PORT, PLITHON_SQL_USER, PLITHON_SQL_PASSWORD,
+#      PLITHON_SQL_DATABASE and PLITHON_SQL_FETCH_SIZE (if any of them is set)
+#   4. the file c:/temp/creds.txt of former versions
+#
+# A file holds key=value pairs separated by commas or line ends, values may
+# be quoted:
+#
+#   host="localhost", user="root", password="admin", database="sakila"
+#
+# A SqlConfig reads and validates its source once, on first use. The
+# translator never reads it: a generated module holds only a reference to the
+# configuration (SqlConfig.reference(): the path of the file, or None for the
+# environment and the default file), which plithon_runtime.sql loads when the
+# program opens its connection. A dict is registered in the process under an
+# opaque name instead (a keyed digest, the key is random per process), so a
+# program translated with a dict runs only in the process that translated it.
+# The parameters - and the password - stay out of the generated code, batch
+# outputs and cache files.
+# =============================================================================
+import hashlib
+import os
+import re
+
+CONFIG_ENV = 'PLITHON_SQL_CONFIG'
+PARAMETER_ENV = 'PLITHON_SQL_'
+DEFAULT_PATH = 'c:/temp/creds.txt'
+
+# connection parameters and the ones a driver can't do without; fetch_size is
+# the number of rows a declared cursor fetches at a time
+KEYS = ('driver', 'host', 'port', 'user', 'password', 'database', 'fetch_size')
+NUMBERS = ('port', 'fetch_size')
+REQUIRED = {'mysql': ('host', 'user', 'database'), 'sqlite': ('database',)}
+
+# name of a dict configuration registered by SqlConfig.reference()
+REGISTERED = '<registered SQL configuration {}>'
+REGISTERED_NAME = re.compile(r'<registered SQL configuration [0-9a-f]+>')
+
+# name -> dict configuration of this process; the digest key of the names
+_registered = {}
+_DIGEST_KEY = os.urandom(16)
+
+PAIR = re.compile(r'''\s*(\w+)\s*=\s*("[^"]*"|'[^']*'|[^,\n]*?)\s*(?:,|\n|$)''')
+
+class ConfigError(ValueError):
+    """The SQL connection configuration is missing or invalid."""
+
+def parse(text, origin):
+    """
+    Parses key=value pairs.
+
+    Args:
+        text: Content of a configuration file.
+        origin: Name of the source, used in error messages.
+
+    Returns:
+        A dict of the parameters.
+    """
+    params = {}
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = PAIR.match(text, position)
+        if match is None or match.end() == position:
+            raise ConfigError(f"{origin}: can't read '{text[position:].splitlines()[0]}'")
+        key, value = match.group(1).lower(), match.group(2)
+        if value[:1] in ('"', "'"):
+            value = value[1:-1]
+        params[key] = value
+        position = match.end()
+    return params
+
+def validate(params, origin):
+    """Checks the parameters; returns them with port and fetch_size as int."""
+    params = dict(params)
+    unknown = sorted(set(params) - set(KEYS))
+    if unknown:
+        raise ConfigError(f"{origin}: unknown parameter(s) {', '.join(unknown)}")
+    driver = params.get('driver', 'mysql')
+    missing = [key for key in REQUIRED.get(driver, ()) if not params.get(key)]
+    if missing:
+        raise ConfigError(f"{origin}: missing parameter(s) {', '.join(missing)}")
+    for key in NUMBERS:
+        if key in params:
+            try:
+                params[key] = int(params[key])
+            except ValueError:
+                raise ConfigError(f"{origin}: {key} must be a number") from None
+    return params
+
+def read_file(path):
+    try:
+        with open(path, 'r') as file:
+            text = file.read()
+    except OSError as e:
+        raise ConfigError(f"{path}: {e.strerror}") from None
+    return validate(parse(text, path), path)
+
+class SqlConfig:
+    """
+    Connection parameters of the EXEC SQL statements, loaded once.
+
+    Args:
+        source: None (look up the environment and the default file), the path
+            of a configuration file or a dict of parameters.
+        environ: The environment to look up (default: os.environ).
+    """
+
+    def __init__(self, source=None, environ=None):
+        self.source = source
+        self._environ = os.environ if environ is None else environ
+        self._params = None
+        self._error = None
+
+    def __getstate__(self):
+        # the environment isn't pickled: a loaded configuration is complete
+        state = self.__dict__.copy()
+        state['_environ'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._environ is None:
+            self._environ = os.environ
+
+    def load(self):
+        """Reads the source if not done yet; errors are kept for params()."""
+        if self._params is None and self._error is None:
+            try:
+                self._params = self._read()
+            except ConfigError as e:
+                self._error = e
+        return self
+
+    def params(self):
+        """Returns the connection parameters; raises ConfigError if there are none."""
+        self.load()
+        if self._error is not None:
+            raise self._error
+        return self._params
+
+    def reference(self):
+        """
+        What a generated module keeps of the configuration to load it when it
+        runs: the absolute path of the file, the registered name of a dict of
+        parameters or None (the environment and the default file of the
+        program).
+        """
+        if isinstance(self.source, dict):
+            text = repr(sorted(self.source.items())).encode()
+            name = REGISTERED.format(hashlib.blake2b(text, key=_DIGEST_KEY, digest_size=12).hexdigest())
+            _registered[name] = dict(self.source)
+            return name
+        if self.source is not None:
+            return os.path.abspath(self.source)
+        return None
+
+    def fingerprint(self):
+        """Text identifying the configuration the generated code refers to (part of cache keys)."""
+        return repr(self.reference())
+
+    def _read(self):
+        source = self.source
+        if isinstance(source, str) and REGISTERED_NAME.fullmatch(source):
+            if source not in _registered:
+                raise ConfigError(f"{source}: a dict configuration is known only to the process that "
+                                  f"translated the program, use a configuration file")
+            source = _registered[source]
+        if isinstance(source, dict):
+            return validate(source, "SQL configuration")
+        if source is not None:
+            return read_file(source)
+        environ = self._environ
+        if environ.get(CONFIG_ENV):
+            return read_file(environ[CONFIG_ENV])
+        params = {key: environ[PARAMETER_ENV + key.upper()] for key in KEYS
+                  if PARAMETER_ENV + key.upper() in environ}
+        if params:
+            return validate(params, f"{PARAMETER_ENV}* environment variables")
+        if os.path.exists(DEFAULT_PATH):
+            return read_file(DEFAULT_PATH)
+        raise ConfigError(f"no SQL connection configuration: use --sql-config, "
+                          f"{CONFIG_ENV}, {PARAMETER_ENV}* variables or {DEFAULT_PATH}")
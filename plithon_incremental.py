@@ -0,0 +1,439 @@
+# =============================================================================
+# Incremental translation of a PL/I member that is edited repeatedly.
+#
+# The source is split into top-level units: the procedure header, every
+# declaration, every top-level statement (a DO-group, IF or SELECT with all
+# its nested statements is one unit) and the END of the procedure. After an
+# edit only the text between the first and the last changed character is
+# lexed again, and only units whose text changed are parsed and generated;
+# the AST and the Python lines of all other units are reused.
+#
+# Whenever the edit can't be confined to whole units (an unbalanced END, an
+# edit in the header, a syntax error, ...) the member is translated from
+# scratch, so the result is always the same as that of Transpiler.transpile.
+# =============================================================================
+import time
+
+import ply.lex as lex
+
+import plithon
+from plithon_codegen import CodeGenerator, CodeGenError
+from plithon_optimize import Optimizer, PASSES
+
+class Segment:
+    """
+    One top-level unit and the text up to the next unit.
+
+    Attributes:
+        text: Source text from the first token of the unit to the first
+            token of the next unit (comments and blanks included).
+        key: The text without trailing blanks, used to look up cached results.
+        kind: 'head', 'decl', 'stmt' or 'tail'.
+        first: Token type of the first token.
+        newlines: Number of line ends in text.
+    """
+    __slots__ = ('text', 'key', 'kind', 'first', 'newlines')
+
+    def __init__(self, text, kind, first):
+        self.text = text
+        self.key = text.rstrip()
+        self.kind = kind
+        self.first = first
+        self.newlines = text.count('\n')
+
+def unit_bounds(tokens):
+    """
+    Splits tokens into top-level statements.
+
+    Returns:
+        A list of (first, last) token indexes, or None if the tokens don't end
+        with a complete statement.
+    """
+    bounds = []
+    depth = 0
+    first = 0
+    count = len(tokens)
+    for i, tok in enumerate(tokens):
+        kind = tok.type
+        if kind == 'DO' or kind == 'SELECT':
+            depth += 1
+        elif kind == 'END':
+            depth -= 1
+            if depth < 0:
+                return None
+        elif kind == 'SEMICOLON' and depth == 0:
+            # IF ... THEN statement; ELSE statement; is one unit
+            if i + 1 < count and tokens[i + 1].type == 'ELSE':
+                continue
+            bounds.append((first, i))
+            first = i + 1
+    if first != count:
+        return None
+    return bounds
+
+def segments_of(text, tokens, bounds, kinds_from):
+    """Builds the segments of the units; the last one extends to the end of text."""
+    segments = []
+    starts = [tokens[first].lexpos for first, last in bounds] + [len(text)]
+    seen_statement = kinds_from == 'stmt'
+    for n, (first, last) in enumerate(bounds):
+        first_type = tokens[first].type
+        if first_type != 'DCL':
+            seen_statement = True
+        kind = 'stmt' if seen_statement else 'decl'
+        segments.append(Segment(text[starts[n]:starts[n + 1]], kind, first_type))
+    return segments
+
+def common_prefix(a, b):
+    """Length of the common prefix of two strings (binary search on slices)."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def common_suffix(a, b, limit):
+    """Length of the common suffix of two strings, at most limit."""
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[-mid:] == b[-mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def make_token(kind, value, lineno=0):
+    tok = lex.LexToken()
+    tok.type = kind
+    tok.value = value
+    tok.lineno = lineno
+    tok.lexpos = 0
+    return tok
+
+# Wrapper around changed units, so that they can be parsed by the program grammar
+HEADER = [('ID', '_unit'), ('COLON', ':'), ('PROC', 'proc'), ('OPTIONS', 'options'),
+          ('LPAREN', '('), ('MAIN', 'main'), ('RPAREN', ')'), ('SEMICOLON', ';')]
+DUMMY_DECL = [('DCL', 'dcl'), ('ID', '_unit'), ('FIXED', 'fixed'), ('BIN', 'bin'),
+              ('LPAREN', '('), ('NUMBER', 15), ('RPAREN', ')'), ('SEMICOLON', ';')]
+TRAILER = [('END', 'end'), ('ID', '_unit'), ('SEMICOLON', ';')]
+
+class IncrementalTranspiler:
+    """
+    Translates successive versions of one PL/I member, reusing the results
+    of unchanged units.
+
+    Attributes:
+        stats: Counters of the last translation: units, parsed, generated,
+            relexed (characters lexed again), full (True if translated from
+            scratch) and seconds.
+    """
+
+    def __init__(self, transpiler=None):
+        self._transpiler = transpiler or plithon.Transpiler()
+        self._source = None
+        self._segments = None
+        self._nodes = {}    # (kind, key) -> AST node
+        self._lines = {}    # (kind, key) -> (generated lines, runtime imports)
+        self._symbols = None
+        self._generator = CodeGenerator(self._transpiler.sql_config)
+        self.stats = {}
+
+    def transpile(self, source):
+        """Translates the source; returns a TranspileResult like Transpiler.transpile."""
+        start = time.perf_counter()
+        segments = None
+        if self._segments is not None:
+            segments = self._update_segments(source)
+        full = segments is None
+        result = None
+        if segments is not None:
+            result = self._translate(segments)
+        if result is None:
+            full = True
+            nodes, lines, symbols = self._nodes, self._lines, self._symbols
+            segments, result = self._translate_all(source)
+            if not result.ok and self._segments is not None:
+                # keep the last good version: the next edit usually fixes the error
+                self._nodes, self._lines, self._symbols = nodes, lines, symbols
+                segments = self._segments
+                source = self._source
+        self._source = source if segments is not None else None
+        self._segments = segments
+        self.stats['full'] = full
+        self.stats['seconds'] = time.perf_counter() - start
+        return result
+
+    # =========================================================================
+    # Segmentation
+    # =========================================================================
+    def _split_program(self, source):
+        """
+        Lexes the whole source and splits it into segments.
+
+        Returns:
+            A tuple (segments, tokens); segments is None if the source can't
+            be split (lexer errors, no complete procedure).
+        """
+        tokens, errors = self._transpiler.tokenize(source)
+        self.stats = {'relexed': len(source)}
+        if errors or len(tokens) < 11:
+            return None, tokens
+        # header: ID : PROC OPTIONS ( MAIN ) ;    tail: END ID ;
+        if tokens[7].type != 'SEMICOLON' or tokens[-3].type != 'END':
+            return None, tokens
+        bounds = unit_bounds(tokens[8:-3])
+        if bounds is None:
+            return None, tokens
+        bounds = [(first + 8, last + 8) for first, last in bounds]
+        body_start = tokens[8].lexpos if bounds else tokens[-3].lexpos
+        tail_start = tokens[-3].lexpos
+        segments = [Segment(source[:body_start], 'head', tokens[0].type)]
+        segments += segments_of(source[:tail_start], tokens, bounds, 'decl')
+        segments.append(Segment(source[tail_start:], 'tail', 'END'))
+        return segments, tokens
+
+    def _update_segments(self, source):
+        """Re-splits only the edited region; None if that isn't possible."""
+        old = self._source
+        segments = self._segments
+        if source == old:
+            self.stats = {'relexed': 0}
+            return segments
+        prefix = common_prefix(old, source)
+        suffix = common_suffix(old, source, min(len(old), len(source)) - prefix)
+        # segments touched by the edit, one more on each side for safety
+        offset = 0
+        first = last = None
+        changed_end = len(old) - suffix
+        for n, segment in enumerate(segments):
+            end = offset + len(segment.text)
+            if first is None and end > prefix:
+                first = n
+                first_offset = offset
+            if first is not None and end >= changed_end:
+                last = n
+                last_end = end
+                break
+            offset = end
+        if first is None or last is None:
+            return None
+        if first > 1:
+            first -= 1
+            first_offset -= len(segments[first].text)
+        if last < len(segments) - 2:
+            last += 1
+            last_end += len(segments[last].text)
+        if segments[first].kind == 'head' or segments[last].kind == 'tail':
+            return None
+        if last + 1 < len(segments) and segments[last + 1].first == 'ELSE':
+            return None
+        region_end = last_end + len(source) - len(old)
+        region = source[first_offset:region_end]
+        lineno = source.count('\n', 0, first_offset) + 1
+        tokens, errors = self._transpiler.tokenize(region, lineno)
+        self.stats = {'relexed': len(region)}
+        if errors or (tokens and tokens[0].type == 'ELSE'):
+            return None
+        bounds = unit_bounds(tokens)
+        if bounds is None:
+            return None
+        kinds_from = 'stmt' if segments[first - 1].kind == 'stmt' else 'decl'
+        replaced = segments_of(region, tokens, bounds, kinds_from)
+        if tokens and tokens[0].lexpos > 0:
+            # blanks or comments in front of the first unit belong to the segment before
+            leading = region[:tokens[0].lexpos]
+            before = segments[first - 1]
+            replaced_before = Segment(before.text + leading, before.kind, before.first)
+            return segments[:first - 1] + [replaced_before] + replaced + segments[last + 1:]
+        if not tokens:
+            before = segments[first - 1]
+            replaced_before = Segment(before.text + region, before.kind, before.first)
+            return segments[:first - 1] + [replaced_before] + segments[last + 1:]
+        if any(s.kind == 'decl' for s in segments[last + 1:]) and \
+                any(s.kind == 'stmt' for s in replaced):
+            return None
+        return segments[:first] + replaced + segments[last + 1:]
+
+    # =========================================================================
+    # Translation
+    # =========================================================================
+    def _translate(self, segments):
+        """Translates the segments, parsing only units not seen before."""
+        nodes = self._nodes
+        missing = [s for s in segments[1:-1] if (s.kind, s.key) not in nodes]
+        if missing and not self._parse_units(missing):
+            return None
+        return self._assemble(segments, len(missing))
+
+    def _parse_units(self, missing):
+        """Parses the changed units together in one wrapper program."""
+        transpiler = self._transpiler
+        decls = [s for s in missing if s.kind == 'decl']
+        stmts = [s for s in missing if s.kind == 'stmt']
+        tokens = [make_token(kind, value) for kind, value in HEADER]
+        for segment in decls:
+            unit_tokens, errors = transpiler.tokenize(segment.key)
+            if errors:
+                return False
+            tokens += unit_tokens
+        if not decls:
+            tokens += [make_token(kind, value) for kind, value in DUMMY_DECL]
+        counts = []
+        for segment in stmts:
+            unit_tokens, errors = transpiler.tokenize(segment.key)
+            if errors:
+                return False
+            tokens += unit_tokens
+        tokens += [make_token(kind, value) for kind, value in TRAILER]
+        program, errors = transpiler.parse_tokens(tokens)
+        if errors or program is None:
+            return False
+        if len(program.body) != len(stmts) or (decls and len(program.decls) != len(decls)):
+            return False
+        for segment, node in zip(decls, program.decls):
+            self._nodes[(segment.kind, segment.key)] = node
+        for segment, node in zip(stmts, program.body):
+            self._nodes[(segment.kind, segment.key)] = node
+        return True
+
+    def _assemble(self, segments, parsed):
+        """Builds the Program and its code from the (cached) units."""
+        nodes = self._nodes
+        lines = self._lines
+        generator = self._generator
+        head = self._head_token(segments[0])
+        if head is None:
+            return None
+        decls = [nodes[(s.kind, s.key)] for s in segments[1:-1] if s.kind == 'decl']
+        symbols = generator.declare(decls)
+        optimizer = Optimizer(decls, self._transpiler.passes)
+        if symbols != self._symbols:
+            # element accesses depend on the declarations: generate all again
+            lines = {}
+        body = []
+        code = []
+        imports = set()
+        positions = []
+        facts = {}
+        generated = 0
+        used_nodes = {}
+        used_lines = {}
+        lineno = 1 + segments[0].newlines
+        for segment in segments[1:-1]:
+            key = (segment.kind, segment.key)
+            node = nodes[key]
+            used_nodes[key] = node
+            if segment.kind == 'stmt':
+                body.append(node)
+            unit = lines.get(key)
+            # the code of a statement also depends on the value ranges known before it
+            if unit is None or unit[2] != facts:
+                try:
+                    code_lines = generator.statement_lines(optimizer.statement(node), facts=facts)
+                    # the PL/I lines relative to the first line of the unit, which can move
+                    unit = (code_lines, generator.imports, facts, generator.facts,
+                            [(line - node.lineno, first, last, kind)
+                             for line, first, last, kind in generator.positions])
+                except (RecursionError, CodeGenError):
+                    return None
+                generated += 1
+            used_lines[key] = unit
+            positions += [(lineno + line, first + len(code), last + len(code), kind)
+                          for line, first, last, kind in unit[4]]
+            code += unit[0]
+            imports |= unit[1]
+            facts = unit[3]
+            lineno += segment.newlines
+        # forget the units that are gone; the symbols change only with a good
+        # translation, a failed one keeps those of the lines kept
+        self._symbols = symbols
+        self._nodes = used_nodes
+        self._lines = used_lines
+        program = plithon.ast.Program(head.value, decls, body)
+        program.lineno = head.lineno
+        self.stats.update(units=len(segments) - 2, parsed=parsed, generated=generated)
+        code = generator.program_lines(head.value, code, imports, positions, head.lineno)
+        return plithon.TranspileResult("\n".join(code), [], program)
+
+    def _head_token(self, segment):
+        """The first token of the procedure header (its name), None if it isn't one."""
+        tokens, errors = self._transpiler.tokenize(segment.text)
+        if errors or len(tokens) != 8:
+            return None
+        return tokens[0]
+
+    def _translate_all(self, source):
+        """Translates from scratch; keeps the units for the next edit if possible."""
+        self._nodes = {}
+        self._lines = {}
+        self._symbols = None
+        segments, tokens = self._split_program(source)
+        if segments is not None:
+            program, errors = self._transpiler.parse_tokens(tokens)
+            units = segments[1:-1]
+            decls = [s for s in units if s.kind == 'decl']
+            stmts = [s for s in units if s.kind == 'stmt']
+            if not errors and program is not None and \
+                    len(program.decls) == len(decls) and len(program.body) == len(stmts):
+                for segment, node in zip(decls + stmts, program.decls + program.body):
+                    self._nodes[(segment.kind, segment.key)] = node
+                result = self._assemble(segments, len(units))
+                if result is not None:
+                    return segments, result
+            elif errors:
+                # the same tokens as a plain translation: don't parse them twice
+                self.stats.update(units=0, parsed=0, generated=0)
+                return None, self._transpiler.generate(program, errors)
+        # not split into units (or a syntax error): plain translation
+        result = self._transpiler.transpile(source)
+        self.stats.update(units=0, parsed=0, generated=0)
+        return None, result
+
+def watch(inputs, output_dir, interval=0.2, sql_config=None, passes=PASSES):
+    """
+    Translates the PL/I files again whenever they are saved (until Ctrl-C).
+
+    Args:
+        inputs: List of (input path, output name) tuples, see
+            plithon.collect_inputs.
+        output_dir: Directory receiving the generated Python modules.
+        interval: Seconds between two checks of the modification times.
+        sql_config: SQL connection configuration, see plithon.Transpiler.
+        passes: Optimization passes, see plithon.Transpiler.
+    """
+    import os
+    config = plithon.SqlConfig(sql_config)
+    transpilers = {path: (name, IncrementalTranspiler(plithon.Transpiler(sql_config=config, passes=passes)))
+                   for path, name in inputs}
+    mtimes = {}
+    print(f"watching {len(transpilers)} file(s), Ctrl-C to stop", flush=True)
+    try:
+        while True:
+            for path, (name, transpiler) in transpilers.items():
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                if mtimes.get(path) == mtime:
+                    continue
+                mtimes[path] = mtime
+                source = plithon.read_pli_from_file(path)
+                result = transpiler.transpile(source)
+                stats = transpiler.stats
+                if not result.ok:
+                    print(f"{path}: {'; '.join(result.errors)}", flush=True)
+                    continue
+                out_path = os.path.join(output_dir, os.path.splitext(name)[0] + '.py')
+                os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+                with open(out_path, 'w') as file:
+                    file.write(result.code + "\n")
+                print(f"{path} -> {out_path}: {stats['seconds'] * 1000:.1f} ms, "
+                      f"{stats['parsed']} of {stats['units']} units parsed"
+                      f"{' (full)' if stats['full'] else ''}", flush=True)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,403 @@
+# =============================================================================
+# Optimization passes over the plithon AST, run between parsing and code
+# generation (plithon_codegen.py). Every pass can be switched off:
+#
+#   fold  : constant arithmetic and concatenation is computed once by the
+#           translator - 60 * 60 * 24 becomes 86400, 'ab' || 'c' becomes 'abc'
+#   select: a SELECT subject that isn't a variable or a constant is evaluated
+#           once into a temporary instead of once per WHEN
+#   hoist : subexpressions of a loop (DO WHILE, DO UNTIL, the body of a
+#           counted DO) whose variables the loop doesn't assign (and SUM of
+#           an array it doesn't assign) are computed once before the loop;
+#           equal ones share a temporary
+#   prune : an IF with a constant condition is replaced by the branch taken,
+#           a SELECT of constants by the matching WHEN, a DO WHILE whose
+#           condition is false is removed, a DO UNTIL whose condition is true
+#           becomes its body
+#
+# The passes build new nodes and never change the parsed ones: the
+# incremental translator keeps those of the unchanged statements. A new
+# statement keeps the lineno of the one it replaces. The temporaries are Let
+# statements and Temp expressions, locals _t1, _t2, ... of the program
+# function (numbered per top-level statement, which only uses its own).
+#
+# Quotients are not folded (the code generator decides between / and an
+# exact int quotient), loops that READ, GET or run SQL (which can assign any
+# variable) hoist nothing.
+# =============================================================================
+from plithon_ast import (Program, Assign, If, Select, DoWhile, DoUntil, DoLoop, Block, Put,
+                         Write, OnEndfile, OnKey, Let, Num, Str, Var, Subscript, BinOp, Compare,
+                         Builtin, Temp, walk, declared)
+from plithon_codegen import FIXED_KINDS, STRUCT, opaque
+
+# Names of the passes, all on by default
+PASSES = ('fold', 'select', 'hoist', 'prune')
+
+# Prefix of the temporaries
+TEMP = '_t'
+
+def passes_from(text):
+    """
+    The passes of a comma separated list like 'fold,prune'; 'all' (or
+    'none') and an empty text are all (no) passes.
+
+    Raises:
+        ValueError: An unknown pass name.
+    """
+    names = [name.strip().lower() for name in text.split(',') if name.strip()]
+    if names == ['all']:
+        return PASSES
+    if names in ([], ['none']):
+        return ()
+    unknown = [name for name in names if name not in PASSES]
+    if unknown:
+        raise ValueError(f"unknown optimization pass {', '.join(unknown)} "
+                         f"(passes: {', '.join(PASSES)})")
+    return tuple(name for name in PASSES if name in names)
+
+class Optimizer:
+    """
+    Applies the optimization passes to the statements of a program.
+
+    Args:
+        decls: The Declare and Structure nodes of the program (only expressions of
+            declared scalars of the right kinds are hoisted: the loop may
+            not run at all, the temporary must not raise an exception).
+        passes: Names of the passes to apply, default: all (PASSES).
+    """
+    def __init__(self, decls, passes=PASSES):
+        self.passes = frozenset(passes)
+        self.symbols = {name: (STRUCT if type is None else type.kind, dims)
+                        for name, type, dims in declared(decls)}
+        self._temps = 0
+
+    def program(self, program):
+        """Returns the optimized copy of a Program node."""
+        body = []
+        for node in program.body:
+            body += self.flattened([self.statement(node)])
+        return located(Program(program.name, program.decls, body), program)
+
+    def statement(self, node):
+        """
+        Returns the optimized copy of a top-level statement: a Block if it
+        became several statements (or none), node itself if no pass is on.
+        """
+        self._temps = 0
+        if not self.passes:
+            return node
+        return self.optimized(node)
+
+    def optimized(self, node):
+        return located(self.rebuilt(node), node)
+
+    def rebuilt(self, node):
+        if isinstance(node, Assign):
+            return Assign(self.expression(node.target), self.expression(node.expr))
+        if isinstance(node, If):
+            return self.optimized_if(node)
+        if isinstance(node, Select):
+            return self.optimized_select(node)
+        if isinstance(node, (DoWhile, DoUntil)):
+            return self.optimized_loop(node)
+        if isinstance(node, DoLoop):
+            return self.optimized_counted(node)
+        if isinstance(node, Block):
+            return Block(self.body(node.body))
+        if isinstance(node, (OnEndfile, OnKey)):
+            return type(node)(node.file, self.body(node.body))
+        if isinstance(node, Put):
+            return Put([self.expression(item) for item in node.items])
+        if isinstance(node, Write):
+            return Write(node.file, self.expression(node.source),
+                         self.expression(node.keyfrom) if node.keyfrom is not None else None)
+        return node
+
+    def body(self, stmts):
+        return self.flattened(self.optimized(stmt) for stmt in stmts)
+
+    def flattened(self, stmts):
+        """The statements with the Blocks of the optimizer replaced by their bodies."""
+        body = []
+        for stmt in stmts:
+            if isinstance(stmt, Block):
+                body += stmt.body
+            else:
+                body.append(stmt)
+        return body
+
+    def temp(self, expr, lets):
+        """A new temporary holding expr; appends its Let to lets."""
+        self._temps += 1
+        name = f"{TEMP}{self._temps}"
+        lets.append(Let(name, expr))
+        return Temp(name, expr)
+
+    # =========================================================================
+    # fold
+    # =========================================================================
+    def expression(self, node):
+        """The expression with constant subexpressions folded (if fold is on)."""
+        if 'fold' not in self.passes:
+            return node
+        if isinstance(node, BinOp):
+            left, right = self.expression(node.left), self.expression(node.right)
+            return folded(node.op, left, right) or BinOp(node.op, left, right)
+        if isinstance(node, Compare):
+            return Compare(node.op, self.expression(node.left), self.expression(node.right))
+        if isinstance(node, Subscript):
+            return Subscript(node.name, [self.expression(index) for index in node.indexes])
+        if isinstance(node, Builtin):
+            return Builtin(node.name, [self.expression(arg) for arg in node.args])
+        return node
+
+    # =========================================================================
+    # select, prune
+    # =========================================================================
+    def optimized_if(self, node):
+        cond = self.expression(node.cond)
+        truth = constant_truth(cond) if 'prune' in self.passes else None
+        if truth is not None:
+            return Block(self.body(node.then if truth else node.orelse))
+        return If(cond, self.body(node.then), self.body(node.orelse))
+
+    def optimized_select(self, node):
+        subject = self.expression(node.subject)
+        whens = [(self.expression(value), body) for value, body in node.whens]
+        if 'prune' in self.passes:
+            taken = taken_branch(subject, whens, node.other)
+            if taken is not None:
+                return Block(self.body(taken))
+        whens = [(value, self.body(body)) for value, body in whens]
+        other = self.body(node.other) if node.other else node.other
+        if 'select' not in self.passes or len(whens) < 2 or \
+                isinstance(subject, (Num, Str, Var, Temp)):
+            return Select(subject, whens, other)
+        lets = []
+        subject = self.temp(subject, lets)
+        return Block(lets + [Select(subject, whens, other)])
+
+    # =========================================================================
+    # hoist, prune
+    # =========================================================================
+    def optimized_loop(self, node):
+        loop = type(node)
+        cond = self.expression(node.cond)
+        body = self.body(node.body)
+        if 'prune' in self.passes:
+            # DO WHILE tests before the first iteration, DO UNTIL after it
+            if loop is DoWhile and constant_truth(cond) is False:
+                return Block([])
+            if loop is DoUntil and constant_truth(cond) is True:
+                return Block(body)
+        if 'hoist' not in self.passes:
+            return loop(cond, body)
+        assigned = assigned_names(body)
+        if assigned is None:
+            return loop(cond, body)
+        hoisting = Hoisting(self, assigned)
+        hoisted = loop(hoisting.expression(cond), hoisting.body(body))
+        return Block(hoisting.lets + [hoisted]) if hoisting.lets else hoisted
+
+    def optimized_counted(self, node):
+        # the TO and BY values are computed once by the loop itself
+        start, stop = self.expression(node.start), self.expression(node.stop)
+        step = self.expression(node.step) if node.step is not None else None
+        body = self.body(node.body)
+        assigned = assigned_names(body) if 'hoist' in self.passes else None
+        if assigned is None:
+            return DoLoop(node.var, start, stop, step, body)
+        hoisting = Hoisting(self, assigned | {node.var.name})
+        loop = DoLoop(node.var, start, stop, step, hoisting.body(body))
+        return Block(hoisting.lets + [loop]) if hoisting.lets else loop
+
+    def invariant(self, node, assigned):
+        """True if the value of the expression is the same in every iteration."""
+        if isinstance(node, (Num, Str)):
+            return True
+        if isinstance(node, Var):
+            return self.scalar(node) is not None and node.name not in assigned
+        if isinstance(node, BinOp):
+            if node.op not in ('+', '-', '*', '||') or not (self.invariant(node.left, assigned) and
+                                                            self.invariant(node.right, assigned)):
+                return False
+            return node.op == '||' or self.numeric(node.left) and self.numeric(node.right)
+        if isinstance(node, Builtin):
+            if not all(self.invariant(arg, assigned) for arg in node.args):
+                return False
+            if node.name == 'mod':
+                modulus = node.args[1]
+                return self.numeric(node.args[0]) and isinstance(modulus, Num) and modulus.value != 0
+            if node.name == 'substr':
+                return self.text(node.args[0]) and all(self.numeric(arg) for arg in node.args[1:])
+            if node.name == 'index':
+                return self.text(node.args[0]) and self.text(node.args[1])
+            return node.name == 'decimal'
+        return self.summed(node) is not None and self.summed(node) not in assigned
+
+    def scalar(self, node):
+        """Kind of a declared scalar variable, else None."""
+        symbol = self.symbols.get(node.name)
+        return symbol[0] if symbol is not None and symbol[1] is None else None
+
+    def summed(self, node):
+        """The array of SUM(array) (SUM undeclared, the array declared), else None."""
+        if not isinstance(node, Subscript) or node.name.lower() != 'sum' or node.name in self.symbols or \
+                len(node.indexes) != 1 or not isinstance(node.indexes[0], Var):
+            return None
+        symbol = self.symbols.get(node.indexes[0].name)
+        if symbol is None or symbol[1] is None or symbol[0] not in FIXED_KINDS:
+            return None
+        return node.indexes[0].name
+
+    def numeric(self, node):
+        """True if the value of the expression is a number."""
+        if isinstance(node, Num):
+            return True
+        if isinstance(node, Var):
+            return self.scalar(node) in FIXED_KINDS
+        if isinstance(node, BinOp):
+            return node.op in ('+', '-', '*') and self.numeric(node.left) and self.numeric(node.right)
+        if isinstance(node, Builtin):
+            return node.name in ('mod', 'index')
+        return self.summed(node) is not None
+
+    def text(self, node):
+        """True if the value of the expression is a str."""
+        if isinstance(node, Str):
+            return True
+        if isinstance(node, Var):
+            return self.scalar(node) == 'char'
+        if isinstance(node, BinOp):
+            return node.op == '||'
+        return isinstance(node, Builtin) and node.name in ('substr', 'decimal')
+
+class Hoisting:
+    """The invariant subexpressions of one loop, replaced by temporaries."""
+    def __init__(self, optimizer, assigned):
+        self.optimizer = optimizer
+        self.assigned = assigned
+        self.lets = []
+        self.temps = {}   # repr of a hoisted expression: its Temp
+
+    def expression(self, node):
+        if isinstance(node, (Num, Str, Var, Temp)):
+            return node
+        if self.optimizer.invariant(node, self.assigned) and any(isinstance(n, Var) for n in walk(node)):
+            key = repr(node)
+            if key not in self.temps:
+                self.temps[key] = self.optimizer.temp(node, self.lets)
+            return self.temps[key]
+        if isinstance(node, (BinOp, Compare)):
+            return type(node)(node.op, self.expression(node.left), self.expression(node.right))
+        if isinstance(node, Subscript):
+            return Subscript(node.name, [self.expression(index) for index in node.indexes])
+        if isinstance(node, Builtin):
+            return Builtin(node.name, [self.expression(arg) for arg in node.args])
+        return node
+
+    def body(self, stmts):
+        return [self.statement(stmt) for stmt in stmts]
+
+    def statement(self, node):
+        return located(self.rebuilt(node), node)
+
+    def rebuilt(self, node):
+        expression = self.expression
+        if isinstance(node, Assign):
+            return Assign(expression(node.target), expression(node.expr))
+        if isinstance(node, If):
+            return If(expression(node.cond), self.body(node.then), self.body(node.orelse))
+        if isinstance(node, Select):
+            return Select(expression(node.subject), [(expression(value), self.body(body))
+                                                     for value, body in node.whens],
+                          self.body(node.other) if node.other else node.other)
+        if isinstance(node, (DoWhile, DoUntil)):
+            return type(node)(expression(node.cond), self.body(node.body))
+        if isinstance(node, DoLoop):
+            return DoLoop(node.var, expression(node.start), expression(node.stop),
+                          expression(node.step) if node.step is not None else None,
+                          self.body(node.body))
+        if isinstance(node, Block):
+            return Block(self.body(node.body))
+        if isinstance(node, Put):
+            return Put([expression(item) for item in node.items])
+        if isinstance(node, Write):
+            return Write(node.file, expression(node.source),
+                         expression(node.keyfrom) if node.keyfrom is not None else None)
+        # ON units run later, when the temporaries can hold other values;
+        # the Let of an inner loop is computed in every iteration anyway
+        return node
+
+def located(node, source):
+    """
+    node with the source line of the statement it replaces; the Blocks of
+    the optimizer and the Lets keep none (their code belongs to the
+    statement around them).
+    """
+    if node is not source and not isinstance(node, Block):
+        node.lineno = source.lineno
+    return node
+
+def assigned_names(body):
+    """Names a statement list assigns (whole arrays included), None if it can assign any."""
+    names = set()
+    for node in walk(body):
+        if opaque(node):
+            return None
+        if isinstance(node, Assign):
+            names.add(node.target.name)
+        elif isinstance(node, DoLoop):
+            names.add(node.var.name)
+    return names
+
+def folded(op, left, right):
+    """The constant value of op applied to two constants, None if it isn't one."""
+    if isinstance(left, Num) and isinstance(right, Num) and op in ('+', '-', '*'):
+        if op == '+':
+            return Num(left.value + right.value)
+        if op == '-':
+            return Num(left.value - right.value)
+        return Num(left.value * right.value)
+    if op == '||' and isinstance(left, (Num, Str)) and isinstance(right, (Num, Str)):
+        return Str(str(left.value) + str(right.value))
+    return None
+
+def constant_truth(cond):
+    """True or False if cond compares two constants, else None."""
+    if not isinstance(cond, Compare):
+        return None
+    left, right = cond.left, cond.right
+    if isinstance(left, Num) and isinstance(right, Num):
+        first, second = left.value, right.value
+    elif isinstance(left, Str) and isinstance(right, Str):
+        # strings are compared with blanks padded, like the generated code
+        first, second = left.value.rstrip(' '), right.value.rstrip(' ')
+    else:
+        return None
+    op = cond.op
+    if op in ('=', '=='):
+        return first == second
+    if op == '<>':
+        return first != second
+    if op == '<':
+        return first < second
+    if op == '<=':
+        return first <= second
+    if op == '>':
+        return first > second
+    return first >= second
+
+def taken_branch(subject, whens, other):
+    """The body a SELECT of constants runs (a list), None if it isn't known."""
+    for value, body in whens:
+        truth = constant_truth(Compare('=', subject, value))
+        if truth is None:
+            return None
+        if truth:
+            return body
+    return other or []
+
+def optimize(program, passes=PASSES):
+    """Returns the optimized copy of a Program node."""
+    return Optimizer(program.decls, passes).program(program)
@@ -0,0 +1,284 @@
+# =============================================================================
+# Profile of a generated program per PL/I statement (plithon.py -r --profile,
+# python plithon_profile.py module.py [source.pli]).
+#
+# The generated modules end with a SOURCE_MAP (plithon_codegen.py): per
+# statement its PL/I line, the first and last line of its Python code and the
+# kind of the statement. While the program runs, the lines of its code
+# objects are counted and timed - with sys.monitoring on Python 3.12+ (events
+# only on the code objects of the program), else with sys.settrace - and
+# added up per statement:
+#
+#   statements: the time of the lines of a statement outside the statements
+#               nested in it, the count of its first line
+#   DO loops  : the time of all lines of the loop, the iterations are the
+#               executions of the first statement in it
+#
+# The time of the runtime functions a line calls counts for the line, that
+# of an ON unit for its statements; the lines outside all statements (the
+# imports and locals of the prologue) count for the PROC statement. The
+# clock is read again at the end of each event, so the time of the profiler
+# itself is left out of the statements, not out of the total.
+#
+# Without --profile none of this runs: the generated code has no counters,
+# the map is one constant of the module.
+# =============================================================================
+import ast
+import os
+import sys
+import time
+import types
+
+from plithon_codegen import SOURCE_MAP
+
+# Statements listed in the report, the most expensive first
+TOP = 20
+
+# Kinds of the statements reported as DO loops
+LOOPS = ('DoWhile', 'DoUntil', 'DoLoop')
+
+# Characters of the PL/I text shown per statement
+TEXT_WIDTH = 60
+
+def source_map(code):
+    """
+    Reads the SOURCE_MAP of a generated module.
+
+    Args:
+        code: Text of the module.
+
+    Returns:
+        A tuple of (PL/I line, first line, last line, kind), empty if the
+        module has no map.
+    """
+    start = code.rfind(f"\n{SOURCE_MAP} = (")
+    if start < 0:
+        return ()
+    end = code.index("\n)", start)
+    return ast.literal_eval(code[start + len(SOURCE_MAP) + 4:end + 2])
+
+def code_objects(code_object):
+    """A code object and all code objects nested in it (functions, ON units, classes)."""
+    found = [code_object]
+    for const in code_object.co_consts:
+        if isinstance(const, types.CodeType):
+            found.extend(code_objects(const))
+    return found
+
+class LineTimes:
+    """
+    Executions and nanoseconds of the lines of a program while it runs.
+
+    Args:
+        size: Number of lines of the generated module.
+
+    Attributes:
+        hits: Line events per line number.
+        times: Nanoseconds per line number, from its line event to the next
+            event of the program.
+        elapsed: Nanoseconds of the whole run, profiler included.
+    """
+
+    def __init__(self, size):
+        self.hits = [0] * (size + 2)
+        self.times = [0] * (size + 2)
+        self.elapsed = 0
+
+    def run(self, code_object, namespace):
+        """Executes code_object in namespace, counting and timing its lines."""
+        start = time.perf_counter_ns()
+        try:
+            if hasattr(sys, 'monitoring'):
+                self._monitored(code_object, namespace)
+            else:
+                self._traced(code_object, namespace)
+        finally:
+            self.elapsed = time.perf_counter_ns() - start
+
+    def _events(self):
+        """
+        The line, call and return callbacks (the arguments of sys.monitoring);
+        the time between two events goes to the current line.
+        """
+        hits, times = self.hits, self.times
+        clock = time.perf_counter_ns
+        stack = []                  # lines of the callers of the running code
+        line = 0
+        start = clock()
+
+        def on_line(code, number):
+            nonlocal line, start
+            times[line] += clock() - start
+            line = number
+            hits[number] += 1
+            start = clock()
+
+        def on_call(code, offset):
+            nonlocal start
+            times[line] += clock() - start
+            stack.append(line)
+            start = clock()
+
+        def on_return(code, offset, value):
+            nonlocal line, start
+            times[line] += clock() - start
+            line = stack.pop() if stack else 0
+            start = clock()
+
+        return on_line, on_call, on_return
+
+    def _monitored(self, code_object, namespace):
+        monitoring = sys.monitoring
+        events = monitoring.events
+        tool = monitoring.PROFILER_ID
+        codes = code_objects(code_object)
+        on_line, on_call, on_return = self._events()
+        monitoring.use_tool_id(tool, 'plithon')
+        try:
+            monitoring.register_callback(tool, events.LINE, on_line)
+            monitoring.register_callback(tool, events.PY_START, on_call)
+            monitoring.register_callback(tool, events.PY_RETURN, on_return)
+            for code in codes:
+                monitoring.set_local_events(tool, code, events.LINE | events.PY_START | events.PY_RETURN)
+            exec(code_object, namespace)
+        finally:
+            for code in codes:
+                monitoring.set_local_events(tool, code, 0)
+            for event in (events.LINE, events.PY_START, events.PY_RETURN):
+                monitoring.register_callback(tool, event, None)
+            monitoring.free_tool_id(tool)
+
+    def _traced(self, code_object, namespace):
+        codes = set(code_objects(code_object))
+        on_line, on_call, on_return = self._events()
+
+        def local(frame, event, arg):
+            if event == 'line':
+                on_line(None, frame.f_lineno)
+            elif event == 'return':
+                on_return(None, 0, arg)
+            return local
+
+        def calls(frame, event, arg):
+            if frame.f_code not in codes:
+                return None
+            on_call(None, 0)
+            return local
+
+        sys.settrace(calls)
+        try:
+            exec(code_object, namespace)
+        finally:
+            sys.settrace(None)
+
+def statement_times(entries, hits, times):
+    """
+    Adds the lines up per statement of a SOURCE_MAP.
+
+    Args:
+        entries: The SOURCE_MAP of the module.
+        hits, times: Executions and nanoseconds per line (LineTimes).
+
+    Returns:
+        A list of (entry, count, self time) and one of (entry, iterations,
+        time) of the DO loops, both in the order of the map.
+    """
+    entries = sorted(entries, key=lambda entry: (entry[1], -entry[2]))
+    program = next((n for n, entry in enumerate(entries) if entry[3] == 'Program'), None)
+    owner = [program] * len(times)
+    # the statements nested in another one come after it and take their lines
+    for n, (lineno, first, last, kind) in enumerate(entries):
+        for line in range(first, min(last + 1, len(times))):
+            owner[line] = n
+    own = [0] * len(entries)
+    for line, nanoseconds in enumerate(times):
+        if owner[line] is not None:
+            own[owner[line]] += nanoseconds
+    statements, loops = [], []
+    for n, entry in enumerate(entries):
+        lineno, first, last, kind = entry
+        count = hits[first] if first < len(hits) else 0
+        if kind in LOOPS:
+            inner = entries[n + 1] if n + 1 < len(entries) else None
+            if inner is not None and inner[1] <= last:
+                count = hits[inner[1]]
+            loops.append((entry, count, sum(times[first:last + 1])))
+        statements.append((entry, count, own[n]))
+    return statements, loops
+
+def report(entries, line_times, source=None, name='program', top=TOP):
+    """
+    The profile of a run as text.
+
+    Args:
+        entries: The SOURCE_MAP of the module.
+        line_times: The LineTimes of the run.
+        source: The PL/I source text, None to leave the statement texts out.
+        name: Name of the program in the title.
+        top: Number of statements listed.
+    """
+    statements, loops = statement_times(entries, line_times.hits, line_times.times)
+    total = sum(line_times.times) or 1
+    pli_lines = source.splitlines() if source is not None else []
+
+    def text(entry):
+        lineno = entry[0]
+        if 0 < lineno <= len(pli_lines):
+            return pli_lines[lineno - 1].strip()[:TEXT_WIDTH]
+        return ''
+
+    def rows(title, counted, items):
+        lines = [title, f"{'line':>8} {counted:>12} {'seconds':>11} {'%':>6}  {'kind':10} statement"]
+        for entry, count, nanoseconds in items:
+            lines.append(f"{entry[0]:8} {count:12,} {nanoseconds / 1e9:11.6f} {100 * nanoseconds / total:6.1f}"
+                         f"  {entry[3]:10} {text(entry)}")
+        return lines
+
+    executed = [item for item in statements if item[1]]
+    executed.sort(key=lambda item: -item[2])
+    loops.sort(key=lambda item: -item[2])
+    lines = [f"Profile of {name}: {line_times.elapsed / 1e9:.3f} s, {total / 1e9:.3f} s in the program, "
+             f"{sum(line_times.hits):,} lines executed"]
+    lines += rows(f"Statements by time (without the statements nested in them, top {top}):", 'count',
+                  executed[:top])
+    if loops:
+        lines += rows("DO loops by time (with the statements in them):", 'iterations', loops)
+    return '\n'.join(lines)
+
+def profile(code_object, code, source=None, name='program', file=None):
+    """
+    Executes a compiled program as script and writes its profile.
+
+    Args:
+        code_object: The compiled module.
+        code: Text of the module (for its SOURCE_MAP).
+        source: The PL/I source text.
+        name: Name of the program in the report.
+        file: Stream of the report (default: sys.stderr).
+    """
+    line_times = LineTimes(code.count('\n') + 1)
+    try:
+        line_times.run(code_object, {'__name__': '__main__'})
+    finally:
+        print(report(source_map(code), line_times, source, name), file=file or sys.stderr)
+
+def main(argv=None):
+    """Command line: python plithon_profile.py module.py [source.pli]."""
+    import argparse
+    parser = argparse.ArgumentParser(prog='python plithon_profile.py',
+                                     description='Run a generated module and profile it per PL/I statement')
+    parser.add_argument('module', help='Python module generated by plithon')
+    parser.add_argument('source', nargs='?', default=None, help='its PL/I source (for the statement texts)')
+    args = parser.parse_args(argv)
+    with open(args.module, encoding='utf-8') as file:
+        code = file.read()
+    source = None
+    if args.source:
+        with open(args.source) as file:
+            source = file.read()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(args.module)))
+    profile(compile(code, args.module, 'exec'), code, source, args.source or args.module)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,28 @@
+# Run-time support of the Python modules generated by plithon.
+#
+# A generated module imports the runtime modules it uses once, checks that
+# this runtime serves the interface it was generated for and binds the
+# runtime names to locals at the start of the program function, so calls
+# inside its loops don't look them up in the module:
+#
+#   import plithon_runtime.arrays
+#   plithon_runtime.require(1)
+#   def prog():
+#       fixed_array = plithon_runtime.arrays.fixed_array
+#
+# so this package has to be importable wherever the generated modules run.
+
+__version__ = '1.10'
+
+# Version of the interface between the generated modules and the runtime:
+# increased whenever a runtime name they use changes incompatibly
+INTERFACE = 1
+
+def require(interface):
+    """
+    Raises ImportError unless the runtime serves the interface a generated
+    module was generated for (called by the module when it is imported).
+    """
+    if interface != INTERFACE:
+        raise ImportError(f"plithon_runtime {__version__} serves interface {INTERFACE}, "
+                          f"the module needs interface {interface}: translate it again")
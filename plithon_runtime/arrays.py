@@ -0,0 +1,128 @@
+# =============================================================================
+# Storage of declared PL/I arrays and whole-array assignment (fill, copy).
+#
+# Arrays are flat buffers with one machine value per element instead of
+# (nested) lists of Python objects:
+#
+#   dcl x(5) fixed bin(15);     x = fixed_array(15, 5)     array('h')
+#   dcl z(2,3) fixed bin(31);   z = fixed_array(31, 6)     array('i')
+#   dcl b(8,8) char(1);         b = CharArray(1, 64)       bytearray
+#
+# The generated code turns the 1-based PL/I subscripts into a 0-based offset
+# (row major: z(i,j) is z[(i - 1) * 3 + j - 1]), so there are no padding
+# elements and a FIXED BIN element access is a plain C-level array index.
+# =============================================================================
+from array import array
+
+# Code page of CHAR elements: one byte per character
+CHARSET = 'latin-1'
+
+def typecode(precision):
+    """Array type code of FIXED BIN(precision): 'h' (16 bit), 'i' (32 bit) or 'q'."""
+    if precision <= 15:
+        return 'h'
+    if precision <= 31:
+        return 'i'
+    return 'q'
+
+def fixed_array(precision, count):
+    """Returns a FIXED BIN(precision) array of count elements, all 0."""
+    code = typecode(precision)
+    return array(code, bytes(array(code).itemsize * count))
+
+class CharArray(bytearray):
+    """
+    Array of CHAR(width) elements in one bytearray.
+
+    Every element takes width bytes; shorter values are padded with blanks
+    and read back padded like a CHAR(width) scalar, longer values are
+    truncated to width characters. All elements start as blanks.
+
+    Args:
+        width: Length of one element.
+        count: Number of elements.
+    """
+    __slots__ = ('width',)
+
+    def __init__(self, width, count):
+        super().__init__(b' ' * (width * count))
+        self.width = width
+
+    def item(self, offset):
+        """Returns the element at the 0-based offset as a string."""
+        width = self.width
+        start = offset * width
+        if not 0 <= start < len(self):
+            raise IndexError("CharArray index out of range")
+        return self[start:start + width].decode(CHARSET)
+
+    def store(self, offset, value):
+        """Assigns a value to the element at the 0-based offset."""
+        width = self.width
+        start = offset * width
+        if not 0 <= start < len(self):
+            raise IndexError("CharArray assignment index out of range")
+        self[start:start + width] = str(value).encode(CHARSET)[:width].ljust(width)
+
+    def store_all(self, values):
+        """
+        Assigns the values to the first elements (element 1, 2, ...); None
+        (a NULL column) leaves an element unchanged.
+        """
+        width = self.width
+        if None in values:
+            for offset, value in enumerate(values):
+                if value is not None:
+                    self.store(offset, value)
+            return
+        data = ''.join(format(str(value), f"<{width}.{width}") for value in values).encode(CHARSET)
+        self[:len(data)] = data
+
+    def fill(self, value):
+        """Assigns the value to all elements."""
+        width = self.width
+        self[:] = str(value).encode(CHARSET)[:width].ljust(width) * (len(self) // width)
+
+def elements(source):
+    """Iterates over the element values of a fixed_array or CharArray."""
+    if isinstance(source, CharArray):
+        return (source.item(offset) for offset in range(len(source) // source.width))
+    return iter(source)
+
+def fill(target, value):
+    """Whole-array assignment of a scalar: target = value;"""
+    if isinstance(target, CharArray):
+        target.fill(value)
+    else:
+        target[:] = array(target.typecode, [value]) * len(target)
+
+def copy(target, source, name='array'):
+    """
+    Whole-array assignment of an array with the same dimensions: target = source;
+    raises FixedOverflow with the name of the target if a value doesn't fit
+    its FIXED BIN elements.
+    """
+    if isinstance(target, CharArray):
+        if isinstance(source, CharArray) and source.width == target.width:
+            target[:] = source
+        else:
+            for offset, value in enumerate(elements(source)):
+                target.store(offset, value)
+    elif isinstance(source, CharArray):
+        store_values(target, [int(value) for value in elements(source)], name)
+    elif source.typecode == target.typecode:
+        target[:] = source
+    else:
+        store_values(target, source, name)
+
+def store_values(target, values, name):
+    """Assigns values to all elements of a fixed_array, FixedOverflow if one doesn't fit."""
+    try:
+        target[:] = array(target.typecode, values)
+    except OverflowError:
+        bits = target.itemsize * 8 - 1
+        value = next((value for value in values if not -(1 << bits) <= value < 1 << bits), None)
+        if value is None:
+            raise
+        from plithon_runtime.fixed import FixedOverflow
+        raise FixedOverflow(name, value) from None
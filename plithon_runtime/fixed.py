@@ -0,0 +1,72 @@
+# =============================================================================
+# FIXED BIN and FIXED DECIMAL arithmetic of the generated code.
+#
+# FIXED BIN(p) values are Python ints limited to the storage of the
+# precision (16, 32 or 64 bits, like the typed arrays of
+# plithon_runtime.arrays); FIXED DEC(p,q) values are ints scaled by 10**q,
+# limited to p digits:
+#
+#   dcl d fixed dec(7,2);    d = 1.05;    d = 105
+#
+# The generated code checks the range after an assignment only if the code
+# generator can't prove that the value fits:
+#
+#   i = i + 1
+#   if not -32768 <= i <= 32767:
+#       raise FixedOverflow('i', i)
+#
+# Quotients assigned to FIXED variables are truncated towards zero (divide),
+# values of unknown type (strings, floats) are converted exactly (scaled).
+# =============================================================================
+from decimal import Decimal, ROUND_DOWN
+
+class FixedOverflow(OverflowError):
+    """
+    FIXEDOVERFLOW condition: a value doesn't fit into the FIXED variable
+    it is assigned to.
+
+    Args:
+        name: Name of the variable.
+        value: The value (scaled by 10**scale for FIXED DECIMAL).
+        scale: Number of decimal places of a FIXED DECIMAL variable.
+    """
+    def __init__(self, name, value, scale=0):
+        super().__init__(f"FIXEDOVERFLOW: {decimal_text(value, scale)} assigned to {name}")
+        self.name = name
+        self.value = value
+
+def binary_range(precision):
+    """(min, max) of FIXED BIN(precision): its storage has 16, 32 or 64 bits."""
+    bits = 16 if precision <= 15 else 32 if precision <= 31 else 64
+    return -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+
+def decimal_range(precision):
+    """(min, max) of a FIXED DEC(precision,q) variable as a scaled int."""
+    return -(10 ** precision - 1), 10 ** precision - 1
+
+def divide(dividend, divisor):
+    """Integer quotient truncated towards zero (// rounds towards minus infinity)."""
+    quotient = dividend // divisor
+    if quotient < 0 and quotient * divisor != dividend:
+        quotient += 1
+    return quotient
+
+def scaled(value, scale):
+    """
+    Converts a value of any type (int, float, numeric string) to an int
+    scaled by 10**scale, truncating further digits (None stays None, like
+    a NULL column).
+    """
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return value * 10 ** scale
+    number = Decimal(repr(value) if isinstance(value, float) else str(value).strip())
+    return int(number.scaleb(scale).to_integral_value(ROUND_DOWN))
+
+def decimal_text(value, scale):
+    """The text of a scaled int with scale decimal places, e.g. -0.05 for (-5, 2)."""
+    if not scale:
+        return str(value)
+    digits = str(abs(value)).rjust(scale + 1, '0')
+    return f"{'-' if value < 0 else ''}{digits[:-scale]}.{digits[-scale:]}"
@@ -0,0 +1,192 @@
+# =============================================================================
+# KEYED files of the generated programs (READ ... KEY, WRITE ... KEYFROM,
+# REWRITE, DELETE).
+#
+# OPEN FILE('name') INPUT|OUTPUT|UPDATE KEYED; opens name.db, an SQLite
+# database whose records table is the B-tree of the keys (WITHOUT ROWID, the
+# records are stored in it): a READ by key costs O(log n) page visits instead
+# of a scan of the file, and the index stays on disk from run to run.
+# OUTPUT creates the file anew, INPUT and UPDATE open an existing one:
+#
+#   READ FILE('f') INTO(x) KEY(k);       _record = f.read_key(k)
+#                                        if _record is not None:
+#                                            x = _record
+#                                        else:
+#                                            f.key(_key_f)
+#   WRITE FILE('f') FROM(x) KEYFROM(k);  if not f.write_key(k, x):
+#                                            f.key(_key_f)
+#   REWRITE FILE('f') FROM(x) KEY(k);    if not f.rewrite(x, k): ...
+#   DELETE FILE('f') KEY(k);             if not f.delete(k): ...
+#
+# A key not found (READ, REWRITE, DELETE) or written twice (WRITE) raises
+# the KEY condition: key() calls the ON KEY unit of the file, without one it
+# raises KeyCondition. A key is a string without its trailing blanks (like
+# PL/I comparisons of strings) or a number (FIXED BIN; FIXED DEC values are
+# keys as their text).
+#
+# A READ without KEY reads the records in the order of their keys, starting
+# after the record read last (by key or not), a batch of records at a time;
+# REWRITE and DELETE without KEY apply to the record read last. With
+# RECSIZE(n) the records are padded with blanks or truncated to n
+# characters, BUFSIZE(n) is the size of the page cache of SQLite in bytes.
+#
+# All changes are one transaction, committed by CLOSE (or at the end of the
+# process for a file that isn't closed).
+# =============================================================================
+import os
+import sqlite3
+import weakref
+
+from plithon_runtime.records import RecordFile
+
+# File name suffix of a KEYED FILE('name')
+SUFFIX = '.db'
+
+# Records fetched at a time by a READ without KEY
+BATCH_SIZE = 1000
+
+CREATE = "create table records (key primary key, record text) without rowid"
+SELECT = "select record from records where key = ?"
+FIRST = "select key, record from records order by key limit ?"
+NEXT = "select key, record from records where key > ? order by key limit ?"
+INSERT = "insert into records values (?, ?)"
+UPDATE = "update records set record = ? where key = ?"
+DELETE = "delete from records where key = ?"
+
+class KeyCondition(LookupError):
+    """KEY condition without an ON KEY unit."""
+
+    def __init__(self, name, key):
+        super().__init__(f"KEY condition raised on file '{name}' (key {key!r}) without ON KEY unit")
+        self.name = name
+        self.key = key
+
+def key_of(value):
+    """The key of a KEY or KEYFROM value: a number, or a string without trailing blanks."""
+    if isinstance(value, int):
+        return value
+    return str(value).rstrip(' ')
+
+def _finish(db):
+    """Commits the changes and closes the database."""
+    try:
+        db.commit()
+    finally:
+        db.close()
+
+class KeyedFile(RecordFile):
+    """
+    Records indexed by their keys in an SQLite database.
+
+    Args:
+        name: The PL/I file name; the file is name.db.
+        mode: 'input', 'output' or 'update'.
+        recsize: Length of the records, None for records of any length.
+        bufsize: Size of the page cache in bytes, None for the SQLite default.
+    """
+
+    def __init__(self, name, mode, recsize=None, bufsize=None):
+        path = name + SUFFIX
+        if mode == 'output':
+            for stale in (path, path + '-journal'):
+                if os.path.exists(stale):
+                    os.remove(stale)
+        elif not os.path.exists(path):
+            raise FileNotFoundError(f"KEYED file '{name}': {path} not found")
+        db = sqlite3.connect(path)
+        super().__init__(name, db)
+        self._finalizer = weakref.finalize(self, _finish, db)
+        if mode == 'output':
+            db.execute(CREATE)
+        if bufsize:
+            db.execute(f"pragma cache_size = {-max(1, bufsize // 1024)}")
+        self.mode = mode
+        self.recsize = recsize
+        self._last = None           # key of the record read last
+        self._key = None            # key of the last keyed statement
+        self._rows = iter(())       # the batch of the next READ without KEY
+        if mode != 'output':
+            self.read = self._read_next
+
+    def _require(self, statement, *modes):
+        if self.mode not in modes:
+            raise ValueError(f"file '{self.name}': {statement} needs a KEYED file opened "
+                             f"{' or '.join(mode.upper() for mode in modes)}")
+
+    def _record(self, value):
+        if self.recsize is None:
+            return str(value)
+        return str(value)[:self.recsize].ljust(self.recsize)
+
+    def _read_next(self):
+        """The record after the one read last, None at the end of the file."""
+        row = next(self._rows, None)
+        if row is None:
+            if self._last is None:
+                rows = self._file.execute(FIRST, (BATCH_SIZE,))
+            else:
+                rows = self._file.execute(NEXT, (self._last, BATCH_SIZE))
+            self._rows = iter(rows.fetchall())
+            row = next(self._rows, None)
+            if row is None:
+                return None
+        self._last = row[0]
+        return row[1]
+
+    def key(self, unit):
+        """Raises the KEY condition: calls unit, raises KeyCondition without one."""
+        if unit is None:
+            raise KeyCondition(self.name, self._key)
+        unit()
+
+    def read_key(self, key):
+        """The record of a key, None if there is none."""
+        self._require('READ', 'input', 'update')
+        key = self._key = key_of(key)
+        row = self._file.execute(SELECT, (key,)).fetchone()
+        if row is None:
+            return None
+        self._last, self._rows = key, iter(())
+        return row[0]
+
+    def read_key_into(self, structure, key):
+        """Unpacks the record of a key into a structure; returns False if there is none."""
+        return self._unpack(structure, self.read_key(key))
+
+    def write(self, value):
+        raise ValueError(f"file '{self.name}': WRITE to a KEYED file needs KEYFROM")
+
+    def write_key(self, key, value):
+        """Adds a record; returns False if the key exists already."""
+        self._require('WRITE', 'output', 'update')
+        key = self._key = key_of(key)
+        try:
+            self._file.execute(INSERT, (key, self._record(value)))
+        except sqlite3.IntegrityError:
+            return False
+        self._rows = iter(())
+        return True
+
+    def rewrite(self, value, key=None):
+        """Replaces the record of a key (None: the record read last); returns False if there is none."""
+        self._require('REWRITE', 'update')
+        key = self._key = self._last_read('REWRITE') if key is None else key_of(key)
+        self._rows = iter(())
+        return self._file.execute(UPDATE, (self._record(value), key)).rowcount == 1
+
+    def delete(self, key=None):
+        """Deletes the record of a key (None: the record read last); returns False if there is none."""
+        self._require('DELETE', 'update')
+        key = self._key = self._last_read('DELETE') if key is None else key_of(key)
+        self._rows = iter(())
+        return self._file.execute(DELETE, (key,)).rowcount == 1
+
+    def _last_read(self, statement):
+        if self._last is None:
+            raise ValueError(f"file '{self.name}': {statement} without KEY needs a READ before")
+        return self._last
+
+    def close(self):
+        self.read = self._not_input
+        self.mode = None
+        self._finalizer()
@@ -0,0 +1,566 @@
+# =============================================================================
+# Record I/O of the generated programs (OPEN / READ / WRITE / CLOSE FILE).
+#
+# FILE('name') is the file name.txt. It is read and written through one large
+# buffer (BUFFER_SIZE bytes, the environment variable PLITHON_BUFFER_SIZE or
+# the BUFSIZE(n) option of OPEN) instead of a system call per record:
+#
+#   OPEN FILE('infile') INPUT;              a record is a line of infile.txt
+#   OPEN FILE('infile') INPUT RECSIZE(80);  fixed-length records of 80 bytes
+#                                           without line ends (RECFM=F)
+#
+# A file is read a buffer full at a time: the buffer is decoded once and cut
+# into records, fixed-length records are read with readinto() into one
+# reusable buffer. read() is a C-level iterator step, so a READ doesn't call
+# Python code of this module. Written fixed-length records are padded with
+# blanks or truncated to RECSIZE.
+#
+# OPEN FILE('infile') INPUT RECSIZE(n) MMAP; maps the file into memory
+# instead: a READ returns a Record, a memoryview of the mapped bytes that is
+# decoded when the program uses it as a string (SUBSTR decodes only the
+# substring). The pages already read are released, so a mapped file of any
+# size costs little resident memory.
+#
+# OPEN ... BACKGROUND; moves the file I/O to a thread of its own: an input
+# file is read up to QUEUE_DEPTH buffers ahead of the READ statements, the
+# records of an output file are collected into buffers that a writer thread
+# writes while the program goes on (at most QUEUE_DEPTH buffers wait). CLOSE
+# writes everything and waits for the thread, an error of the thread is
+# raised by the next WRITE or by CLOSE.
+#
+# A READ at the end of the file leaves its target unchanged and raises the
+# ENDFILE condition: the generated code passes the ON ENDFILE unit of the
+# file (a function, None if no ON ENDFILE statement was executed):
+#
+#   ON ENDFILE(infile) eof = 1;       def _endfile_infile(): nonlocal eof ...
+#   READ FILE('infile') INTO(line);   _record = infile.read()
+#                                     if _record is not None:
+#                                         line = _record
+#                                     else:
+#                                         infile.endfile(_endfile_infile)
+#
+# Without an ON ENDFILE unit the READ raises EndFile, like the ERROR
+# condition that ends a PL/I program.
+#
+# READ INTO a structure (plithon_runtime.structures) unpacks the record into
+# its fields: read_into() returns False at the end of the file. A RECSIZE
+# file unpacks it from the read buffer and an MMAP file from the mapped
+# bytes, without decoding the record or creating a Record; a text line (or a
+# record read in the background) is encoded first, a short one padded with
+# blanks. A file is read either into strings or into structures. WRITE FROM
+# a structure writes the record of its fields (write_from()).
+#
+# OPEN ... KEYED opens a file of records indexed by their keys
+# (plithon_runtime.keyed, imported only then).
+# =============================================================================
+import mmap
+import os
+from functools import partial
+from itertools import chain
+from queue import Empty, Queue
+from threading import Thread
+
+from plithon_runtime.arrays import CHARSET
+
+# File name suffix of FILE('name')
+SUFFIX = '.txt'
+
+# Default buffer size in bytes
+BUFFER_SIZE = int(os.environ.get('PLITHON_BUFFER_SIZE', 1 << 20))
+
+# Buffers queued between a BACKGROUND file and its thread
+QUEUE_DEPTH = 4
+
+class EndFile(EOFError):
+    """ENDFILE condition without an ON ENDFILE unit."""
+
+    def __init__(self, name):
+        super().__init__(f"ENDFILE condition raised on file '{name}' without ON ENDFILE unit")
+        self.name = name
+
+class RecordFile:
+    """
+    Base of the opened files.
+
+    Args:
+        name: The PL/I file name.
+        file: The opened Python file.
+
+    Attributes:
+        read: Function returning the next record, None at the end of the file.
+    """
+
+    def __init__(self, name, file):
+        self.name = name
+        self._file = file
+        self._background = None     # ReadAhead or WriteBehind
+        self._use = None            # 'string' or 'structure', the kind of READ INTO
+        self.read = self._not_input
+
+    def _not_input(self):
+        raise ValueError(f"file '{self.name}' is not opened for input")
+
+    def _claim(self, use):
+        if self._use not in (None, use):
+            raise ValueError(f"file '{self.name}' is read into strings and structures")
+        self._use = use
+
+    def endfile(self, unit):
+        """Raises the ENDFILE condition: calls unit, raises EndFile without one."""
+        if unit is None:
+            raise EndFile(self.name)
+        unit()
+
+    def read_into(self, structure):
+        """Unpacks the next record into a structure; returns False at the end of the file."""
+        return self._unpack(structure, self.read())
+
+    @staticmethod
+    def _unpack(structure, record):
+        """Unpacks a record (None: no record, returns False) into a structure."""
+        if record is None:
+            return False
+        data = bytes(record.view) if isinstance(record, Record) else record.encode(CHARSET, 'replace')
+        structure._unpack_from(data.ljust(structure._layout.size))
+        return True
+
+    def write(self, value):
+        raise ValueError(f"file '{self.name}' is not opened for output")
+
+    def _not_keyed(self, *args):
+        raise ValueError(f"file '{self.name}' is not KEYED")
+
+    read_key = read_key_into = write_key = rewrite = delete = _not_keyed
+
+    def write_from(self, structure):
+        """Writes the record of a structure."""
+        self.write(structure._text())
+
+    def close(self):
+        self.read = self._next_offset = self._not_input
+        try:
+            if self._background is not None:
+                self._background.close()
+                self._background = None
+        finally:
+            self._file.close()
+
+    def _reader(self, blocks, background):
+        """Returns the read function of the record lists of blocks."""
+        if background:
+            blocks = self._background = ReadAhead(self.name, blocks)
+        return partial(next, chain.from_iterable(blocks), None)
+
+    def _writer(self, write, buffer_size, background):
+        """Returns the function writing the text of a record."""
+        if background:
+            self._background = WriteBehind(self.name, write, buffer_size)
+            return self._background.write
+        return write
+
+class ReadAhead:
+    """
+    Iterates the blocks of an input file on a background thread, up to
+    QUEUE_DEPTH blocks ahead of the consumer.
+
+    Args:
+        name: The PL/I file name (name of the thread).
+        blocks: Iterator of the blocks.
+    """
+
+    def __init__(self, name, blocks):
+        self._queue = Queue(QUEUE_DEPTH)
+        self._closing = False
+        self._thread = Thread(target=self._run, args=(blocks,), name=f"read-ahead {name}", daemon=True)
+        self._thread.start()
+
+    def _run(self, blocks):
+        queue = self._queue
+        try:
+            for block in blocks:
+                if self._closing:
+                    return
+                queue.put(block)
+        except Exception as error:
+            queue.put(error)
+            return
+        queue.put(None)
+
+    def __iter__(self):
+        for block in iter(self._queue.get, None):
+            if isinstance(block, Exception):
+                raise block
+            yield block
+
+    def close(self):
+        """Stops the thread (it may wait for room in the queue)."""
+        self._closing = True
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.05)
+            except Empty:
+                pass
+
+class WriteBehind:
+    """
+    Collects the text written to an output file and writes it on a background
+    thread, a buffer full at a time.
+
+    Args:
+        name: The PL/I file name (name of the thread).
+        write: Function writing text to the file.
+        buffer_size: Number of characters collected before they are queued.
+    """
+
+    def __init__(self, name, write, buffer_size):
+        self._write = write
+        self._buffer_size = buffer_size
+        self._pending = []
+        self._size = 0
+        self._error = None
+        self._queue = Queue(QUEUE_DEPTH)
+        self._thread = Thread(target=self._run, name=f"write-behind {name}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for text in iter(self._queue.get, None):
+            if self._error is None:
+                try:
+                    self._write(text)
+                except Exception as error:
+                    self._error = error
+
+    def write(self, text):
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Queues the collected text; waits while QUEUE_DEPTH buffers are queued."""
+        if self._error is not None:
+            raise self._error
+        if self._pending:
+            self._queue.put(''.join(self._pending))
+            self._pending = []
+            self._size = 0
+
+    def close(self):
+        """Writes all text and stops the thread."""
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+class LineInput(RecordFile):
+    """
+    Records are text lines (without the line end).
+
+    Args:
+        buffer_size: Number of characters read at a time.
+        background: Read on a background thread.
+    """
+
+    def __init__(self, name, file, buffer_size, background=False):
+        super().__init__(name, file)
+        self.read = self._reader(self._blocks(buffer_size), background)
+
+    def _blocks(self, buffer_size):
+        """Yields the lists of the lines of every buffer full."""
+        read, pending = self._file.read, ''
+        while True:
+            block = read(buffer_size)
+            if not block:
+                if pending:
+                    yield (pending,)
+                return
+            lines = (pending + block).split('\n')
+            pending = lines.pop()
+            yield lines
+
+class LineOutput(RecordFile):
+
+    def __init__(self, name, file, buffer_size, background=False):
+        super().__init__(name, file)
+        self._write = self._writer(file.write, buffer_size, background)
+
+    def write(self, value):
+        self._write(f"{value}\n")
+
+class FixedInput(RecordFile):
+    """
+    Fixed-length records, read a buffer full at a time.
+
+    Args:
+        recsize: Record length in bytes.
+        buffer_size: Size of the read buffer, rounded down to whole records.
+        background: Read on a background thread.
+    """
+
+    def __init__(self, name, file, recsize, buffer_size, background=False):
+        super().__init__(name, file)
+        self.recsize = recsize
+        self._buffer = bytearray(max(1, buffer_size // recsize) * recsize)
+        self.read = self._reader(self._blocks(), background)
+        self._next_offset = partial(next, chain.from_iterable(self._offsets()), None)
+
+    def read_into(self, structure):
+        if self._background is not None:
+            # the thread decodes the records
+            return super().read_into(structure)
+        if structure._layout.size > self.recsize:
+            raise ValueError(f"file '{self.name}': structure of {structure._layout.size} bytes "
+                             f"longer than RECSIZE({self.recsize})")
+        offset = self._next_offset()
+        if offset is None:
+            return False
+        structure._unpack_from(self._buffer, offset)
+        return True
+
+    def _offsets(self):
+        """Yields the offsets of the records of every buffer full (a short last record padded)."""
+        self._claim('structure')
+        recsize = self.recsize
+        with memoryview(self._buffer) as view:
+            while True:
+                end = self._fill(view)
+                if not end:
+                    return
+                short = -end % recsize
+                view[end:end + short] = b' ' * short
+                yield range(0, end, recsize)
+
+    def _fill(self, view):
+        """Reads the next buffer full; returns the number of bytes."""
+        end = 0
+        while end < len(view):
+            count = self._file.readinto(view[end:])
+            if not count:
+                break
+            end += count
+        return end
+
+    def _blocks(self):
+        """Yields the records of every buffer full (a short last record as it is)."""
+        self._claim('string')
+        recsize = self.recsize
+        with memoryview(self._buffer) as view:
+            while True:
+                end = self._fill(view)
+                if not end:
+                    return
+                text = str(view[:end], CHARSET)
+                yield [text[start:start + recsize] for start in range(0, end, recsize)]
+
+class Record:
+    """
+    A record of a memory-mapped file, decoded on first use.
+
+    Behaves like the str of its bytes: print(), comparisons, +, slices,
+    str methods, int().
+
+    Args:
+        view: memoryview of the record bytes.
+    """
+    __slots__ = ('view', '_text')
+
+    def __init__(self, view):
+        self.view = view
+        self._text = None
+
+    def __str__(self):
+        text = self._text
+        if text is None:
+            text = self._text = str(self.view, CHARSET)
+        return text
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __format__(self, spec):
+        return format(str(self), spec)
+
+    def __bytes__(self):
+        return bytes(self.view)
+
+    def __len__(self):
+        return len(self.view)
+
+    def __bool__(self):
+        return len(self.view) > 0
+
+    def __getitem__(self, index):
+        if self._text is None and isinstance(index, slice):
+            # SUBSTR: decode the substring only
+            return str(self.view[index], CHARSET)
+        return str(self)[index]
+
+    def __eq__(self, other):
+        return str(self) == text_of(other)
+
+    def __ne__(self, other):
+        return str(self) != text_of(other)
+
+    def __lt__(self, other):
+        return str(self) < text_of(other)
+
+    def __le__(self, other):
+        return str(self) <= text_of(other)
+
+    def __gt__(self, other):
+        return str(self) > text_of(other)
+
+    def __ge__(self, other):
+        return str(self) >= text_of(other)
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        return str(self) + text_of(other)
+
+    def __radd__(self, other):
+        return other + str(self)
+
+    def __contains__(self, item):
+        return text_of(item) in str(self)
+
+    def __int__(self):
+        return int(str(self))
+
+    def __float__(self):
+        return float(str(self))
+
+    def __getattr__(self, name):
+        # find(), strip(), encode(), ... of the decoded string
+        return getattr(str(self), name)
+
+def text_of(value):
+    """The str of a Record, other values as they are."""
+    return str(value) if isinstance(value, Record) else value
+
+class MappedInput(RecordFile):
+    """
+    Fixed-length records of a memory-mapped file.
+
+    Args:
+        recsize: Record length in bytes.
+        buffer_size: The pages of every buffer_size bytes read are released.
+    """
+
+    def __init__(self, name, file, recsize, buffer_size):
+        super().__init__(name, file)
+        self.recsize = recsize
+        size = os.fstat(file.fileno()).st_size
+        self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.read = partial(next, chain.from_iterable(self._blocks(buffer_size)), None)
+        self._next_offset = partial(next, chain.from_iterable(self._offsets(buffer_size)), None)
+
+    def read_into(self, structure):
+        if structure._layout.size > self.recsize:
+            raise ValueError(f"file '{self.name}': structure of {structure._layout.size} bytes "
+                             f"longer than RECSIZE({self.recsize})")
+        offset = self._next_offset()
+        if offset is None:
+            return False
+        if offset + structure._layout.size <= len(self._map):
+            structure._unpack_from(self._map, offset)
+        else:
+            structure._unpack_from(self._map[offset:].ljust(structure._layout.size))
+        return True
+
+    def _spans(self, buffer_size):
+        """Yields start and end of every buffer_size bytes, releasing the pages before them."""
+        if self._map is None:
+            return
+        size = len(self._map)
+        step = max(1, buffer_size // self.recsize) * self.recsize
+        released = 0
+        for start in range(0, size, step):
+            # Records still in use read released pages from the file again
+            done = start // mmap.PAGESIZE * mmap.PAGESIZE
+            if done > released and hasattr(mmap, 'MADV_DONTNEED'):
+                self._map.madvise(mmap.MADV_DONTNEED, released, done - released)
+                released = done
+            yield start, min(start + step, size)
+
+    def _blocks(self, buffer_size):
+        """Yields the Records of every buffer_size bytes (a short last record as it is)."""
+        self._claim('string')
+        recsize = self.recsize
+        view = memoryview(self._map) if self._map is not None else None
+        for start, end in self._spans(buffer_size):
+            yield map(Record, map(view.__getitem__, map(slice, range(start, end, recsize),
+                                                        range(start + recsize, end + recsize, recsize))))
+
+    def _offsets(self, buffer_size):
+        """Yields the offsets of the records of every buffer_size bytes."""
+        self._claim('structure')
+        for start, end in self._spans(buffer_size):
+            yield range(start, end, self.recsize)
+
+    def close(self):
+        super().close()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass    # Records still refer to it: unmapped when they are gone
+            self._map = None
+
+class FixedOutput(RecordFile):
+    """Fixed-length records: values are padded with blanks or truncated."""
+
+    def __init__(self, name, file, recsize, buffer_size, background=False):
+        super().__init__(name, file)
+        self.recsize = recsize
+        self._write = self._writer(file.write, buffer_size, background)
+
+    def write(self, value):
+        recsize = self.recsize
+        self._write(str(value)[:recsize].ljust(recsize))
+
+def open_file(name, mode, recsize=None, bufsize=None, mmap=False, background=False, keyed=False):
+    """
+    OPEN FILE('name') INPUT|OUTPUT|UPDATE options.
+
+    Args:
+        name: The PL/I file name; the file is name.txt.
+        mode: 'input', 'output' or 'update' (KEYED files only).
+        recsize: Length of fixed-length records, None for text lines.
+        bufsize: Buffer size in bytes (default BUFFER_SIZE).
+        mmap: Map an input file of fixed-length records into memory.
+        background: Read ahead / write behind on a background thread.
+        keyed: Records indexed by their keys (plithon_runtime.keyed).
+
+    Returns:
+        The RecordFile.
+    """
+    if keyed:
+        if mmap or background:
+            raise ValueError(f"file '{name}': KEYED excludes MMAP and BACKGROUND")
+        from plithon_runtime.keyed import KeyedFile
+        return KeyedFile(name, mode, recsize, bufsize)
+    if mode == 'update':
+        raise ValueError(f"file '{name}': UPDATE needs KEYED")
+    path = name + SUFFIX
+    buffer_size = bufsize or BUFFER_SIZE
+    if mmap and (recsize is None or mode != 'input'):
+        raise ValueError(f"file '{name}': MMAP needs INPUT and RECSIZE(n)")
+    if mmap and background:
+        raise ValueError(f"file '{name}': MMAP and BACKGROUND exclude each other")
+    if recsize is None:
+        if mode == 'input':
+            return LineInput(name, open(path, 'r', buffering=buffer_size), buffer_size, background)
+        return LineOutput(name, open(path, 'w', buffering=buffer_size), buffer_size, background)
+    if recsize <= 0:
+        raise ValueError(f"file '{name}': RECSIZE must be positive")
+    if mode == 'input' and mmap:
+        return MappedInput(name, open(path, 'rb'), recsize, buffer_size)
+    if mode == 'input':
+        return FixedInput(name, open(path, 'rb', buffering=0), recsize, buffer_size, background)
+    file = open(path, 'w', encoding=CHARSET, errors='replace', newline='', buffering=buffer_size)
+    return FixedOutput(name, file, recsize, buffer_size, background)
@@ -0,0 +1,350 @@
+# =============================================================================
+# External merge sort of record files (CALL PLISRTA in the generated
+# programs, python -m plithon_runtime.sort on the command line).
+#
+# A file larger than the memory budget is sorted in two phases:
+#
+#   1. Runs: the file is cut into byte ranges that fit the budget; every
+#      range is read, sorted in memory (list.sort() with a key built from the
+#      sort fields) and written to a run file in a temporary directory. With
+#      jobs > 1 worker processes sort the ranges, each with its share of the
+#      budget.
+#   2. Merge: heapq.merge() of the runs - a k-way merge through a heap of the
+#      next record of every run - streamed into the output. More runs than
+#      FAN_IN, or than read buffers of MIN_BUFFER bytes fit the budget, are
+#      merged in several passes.
+#
+# A file that fits the budget is sorted in memory, without run files.
+#
+# The records are fixed-length (RECSIZE) or text lines. The sort fields are
+# written like in the SORT control statement of PLISRTA:
+#
+#   SORT FIELDS=(1,10,CH,A,21,4,FI,D)    start (from 1), length, format, order
+#
+# CH (characters) and BI (unsigned binary) compare the bytes, FI compares
+# signed big-endian binaries (the FIXED fields of structures), ZD and FS
+# compare numbers written as text (like PUT writes them); A is ascending, D
+# descending. The sort is stable: records with equal keys keep their order.
+#
+#   CALL PLISRTA(' SORT FIELDS=(1,10,CH,A) ',     rc = plisrta(' SORT ...',
+#                ' RECORD TYPE=F,LENGTH=(80) ',                ' RECORD ...',
+#                4000000, rc);                                 4000000)
+#
+# sorts the file SORTIN (sortin.txt) into SORTOUT (sortout.txt) with a memory
+# budget of 4000000 bytes; rc is 0, or 16 if the sort failed (the error is
+# written to stderr). TYPE=F sorts records of LENGTH bytes, TYPE=V lines. The
+# environment variable PLITHON_SORT_JOBS is the number of processes sorting
+# the runs of PLISRTA (default 1).
+# =============================================================================
+import heapq
+import os
+import re
+import sys
+import time
+from itertools import chain, repeat
+from operator import itemgetter
+
+from plithon_runtime.records import SUFFIX
+
+# Default memory budget in bytes
+MEMORY = 64 << 20
+
+# Processes sorting the runs of PLISRTA
+JOBS = int(os.environ.get('PLITHON_SORT_JOBS', 1))
+
+# Most runs merged at a time, and the smallest read buffer of a run
+FAN_IN = 64
+MIN_BUFFER = 64 << 10
+
+# Bytes a record in memory costs beyond its data (the bytes object and its
+# list slot), and the keys of the fields by format (a bytes object, an int, a
+# Decimal) and the tuple of several keys
+OVERHEAD = 41
+KEY_OVERHEAD = {'CH': 33, 'BI': 33, 'FI': 32, 'ZD': 104, 'FS': 104}
+TUPLE_OVERHEAD = 40
+
+# Bytes of a file of lines read to estimate the length of a line
+SAMPLE = 1 << 16
+
+# The files of PLISRTA
+SORTIN = 'sortin'
+SORTOUT = 'sortout'
+
+# Return codes of PLISRTA
+SORTED = 0
+FAILED = 16
+
+FORMATS = ('CH', 'BI', 'FI', 'ZD', 'FS')
+
+SORT_STATEMENT = re.compile(r"\s*SORT\s+FIELDS=\(([^)]*)\)(?:\s*,\s*FORMAT=(\w+))?\s*$", re.I)
+RECORD_STATEMENT = re.compile(r"\s*RECORD\s+TYPE=([FV])(?:\s*,\s*LENGTH=\((\d*)[^)]*\))?\s*$", re.I)
+
+# Translation of the bytes of a descending CH or BI field
+INVERT = bytes(range(255, -1, -1))
+
+def parse_fields(text):
+    """
+    The sort fields of a SORT control statement (' SORT FIELDS=(1,10,CH,A) ',
+    with FORMAT=f the fields have no format of their own) or of its list of
+    fields alone ('1,10,CH,A' or '(1,10,CH,A)').
+
+    Returns:
+        A list of (start, length, format, order), start counted from 1, order 'A' or 'D'.
+    """
+    match = SORT_STATEMENT.match(text)
+    common = match[2].upper() if match and match[2] else None
+    items = [item.strip().upper() for item in (match[1] if match else text.strip().strip('()')).split(',')]
+    size = 3 if common else 4
+    if len(items) % size:
+        raise ValueError(f"sort fields {text.strip()!r}: start, length, "
+                         f"{'' if common else 'format, '}order expected")
+    fields = []
+    for n in range(0, len(items), size):
+        start, length, *format, order = items[n:n + size]
+        format = common or format[0]
+        if not (start.isdigit() and length.isdigit() and int(start) >= 1 and int(length) >= 1):
+            raise ValueError(f"sort field {','.join(items[n:n + size])}: start and length must be positive")
+        if format not in FORMATS:
+            raise ValueError(f"sort format {format} not supported (only {', '.join(FORMATS)})")
+        if order not in ('A', 'D'):
+            raise ValueError(f"sort order {order}: A or D expected")
+        fields.append((int(start), int(length), format, order))
+    return fields
+
+def parse_record(text):
+    """
+    The record length of a RECORD control statement: LENGTH for TYPE=F,
+    None (lines) for TYPE=V.
+    """
+    match = RECORD_STATEMENT.match(text)
+    if not match:
+        raise ValueError(f"record statement {text.strip()!r}: RECORD TYPE=F,LENGTH=(n) or TYPE=V expected")
+    if match[1].upper() == 'V':
+        return None
+    if not match[2] or int(match[2]) < 1:
+        raise ValueError(f"record statement {text.strip()!r}: TYPE=F needs LENGTH=(n)")
+    return int(match[2])
+
+def field_key(start, length, format, order, fixed):
+    """The key of one field of a record (bytes); fields of lines are padded with blanks."""
+    begin, end = start - 1, start - 1 + length
+    if format in ('CH', 'BI'):
+        if fixed and order == 'A':
+            return itemgetter(slice(begin, end))
+        if fixed:
+            return lambda record: record[begin:end].translate(INVERT)
+        if order == 'A':
+            return lambda record: record[begin:end].ljust(length)
+        return lambda record: record[begin:end].ljust(length).translate(INVERT)
+    if format == 'FI':
+        sign = -1 if order == 'D' else 1
+        return lambda record: sign * int.from_bytes(record[begin:end], 'big', signed=True)
+    from decimal import Decimal
+    sign = -1 if order == 'D' else 1
+    return lambda record: sign * Decimal(record[begin:end].decode('latin-1').strip() or 0)
+
+def key_function(fields, fixed=True):
+    """
+    The key of a record for list.sort() and heapq.merge(): slices of the
+    record if all fields are ascending CH or BI fields of fixed-length
+    records (itemgetter, no Python code per record), else the tuple of the
+    keys of the fields.
+    """
+    if fixed and all(format in ('CH', 'BI') and order == 'A' for start, length, format, order in fields):
+        return itemgetter(*(slice(start - 1, start - 1 + length) for start, length, format, order in fields))
+    keys = [field_key(*field, fixed) for field in fields]
+    if len(keys) == 1:
+        return keys[0]
+    return lambda record: tuple(key(record) for key in keys)
+
+def record_memory(record, fields):
+    """
+    Bytes a record of record bytes costs while its run is sorted: its data
+    and the larger of the read buffer and its key.
+    """
+    key = sum(KEY_OVERHEAD[format] + (length if format in ('CH', 'BI') else 0)
+              for start, length, format, order in fields)
+    if len(fields) > 1:
+        key += TUPLE_OVERHEAD + 8 * len(fields)
+    return record + OVERHEAD + max(record, key)
+
+def read_range(path, start, end, recsize):
+    """
+    The records of the bytes start to end of a file; a line belongs to the
+    range it starts in.
+    """
+    with open(path, 'rb') as file:
+        if recsize:
+            file.seek(start)
+            data = file.read(end - start)
+            return list(map(data.__getitem__, map(slice, range(0, len(data), recsize),
+                                                  range(recsize, len(data) + recsize, recsize))))
+        if start:
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        if position >= end:
+            return []
+        data = file.read(end - position)
+        if not data.endswith(b'\n'):
+            data += file.readline()
+        records = data.split(b'\n')
+        if not records[-1]:
+            records.pop()   # after the last line end
+        return records
+
+def write_records(file, records, recsize):
+    """Writes records (an iterable), lines with a line end."""
+    if recsize:
+        file.writelines(records)
+    else:
+        file.writelines(chain.from_iterable(zip(records, repeat(b'\n'))))
+
+def run_records(file, recsize, buffer_size):
+    """Yields the records of a run file, read buffer_size bytes at a time."""
+    if not recsize:
+        # the lines without their line end
+        yield from map(itemgetter(slice(None, -1)), file)
+        return
+    size = max(1, buffer_size // recsize) * recsize
+    while True:
+        data = file.read(size)
+        if not data:
+            return
+        yield from map(data.__getitem__, map(slice, range(0, len(data), recsize),
+                                             range(recsize, len(data) + recsize, recsize)))
+
+def sort_range(path, start, end, recsize, fields, out_path):
+    """Sorts the records of a byte range of a file in memory into out_path; returns their number."""
+    records = read_range(path, start, end, recsize)
+    records.sort(key=key_function(fields, recsize is not None))
+    with open(out_path, 'wb') as file:
+        write_records(file, records, recsize)
+    return len(records)
+
+def merge(runs, out_path, recsize, fields, buffer_size):
+    """Merges sorted run files into out_path (k-way, through heapq.merge())."""
+    buffer_size = max(buffer_size, MIN_BUFFER)
+    files = []
+    try:
+        for run in runs:
+            files.append(open(run, 'rb', buffering=buffer_size if not recsize else 0))
+        with open(out_path, 'wb', buffering=buffer_size) as out:
+            write_records(out, heapq.merge(*(run_records(file, recsize, buffer_size) for file in files),
+                                           key=key_function(fields, recsize is not None)), recsize)
+    finally:
+        for file in files:
+            file.close()
+
+def line_length(path):
+    """Average length of the lines at the start of a file (with the line end)."""
+    with open(path, 'rb') as file:
+        sample = file.read(SAMPLE)
+    return max(1, len(sample) // max(1, sample.count(b'\n')))
+
+def sort_file(input, output, fields, recsize=None, memory=MEMORY, jobs=1, tmpdir=None):
+    """
+    Sorts a record file into another (which may be the same file).
+
+    Args:
+        input: Path of the file to sort.
+        output: Path of the sorted file.
+        fields: Sort fields: a list of (start, length, format, order) or the
+            text of a SORT statement or of its list of fields.
+        recsize: Length of fixed-length records, None for lines.
+        memory: Memory budget in bytes.
+        jobs: Number of processes sorting the runs.
+        tmpdir: Directory of the run files (default: that of tempfile).
+
+    Returns:
+        The number of runs (1 if the file was sorted in memory).
+    """
+    if isinstance(fields, str):
+        fields = parse_fields(fields)
+    if memory <= 0 or jobs <= 0 or (recsize is not None and recsize <= 0):
+        raise ValueError("memory, jobs and recsize must be positive")
+    size = os.path.getsize(input)
+    record = recsize or line_length(input)
+    # the records of a range and their keys fit the budget of a process
+    run_bytes = max(record, memory // jobs * record // record_memory(record, fields))
+    if recsize:
+        run_bytes = run_bytes // recsize * recsize
+    starts = range(0, size, run_bytes)
+    if len(starts) <= 1:
+        sort_range(input, 0, size, recsize, fields, output)
+        return 1
+    ends = [min(start + run_bytes, size) for start in starts]
+    import tempfile
+    with tempfile.TemporaryDirectory(prefix='plithon-sort-', dir=tmpdir) as directory:
+        runs = [os.path.join(directory, f"run{n}") for n in range(len(starts))]
+        if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                list(pool.map(sort_range, repeat(input), starts, ends, repeat(recsize), repeat(fields), runs))
+        else:
+            list(map(sort_range, repeat(input), starts, ends, repeat(recsize), repeat(fields), runs))
+        fan_in = max(2, min(FAN_IN, memory // MIN_BUFFER - 1))
+        passes = 0
+        while len(runs) > fan_in:
+            passes += 1
+            merged = []
+            for n in range(0, len(runs), fan_in):
+                group = runs[n:n + fan_in]
+                if len(group) > 1:
+                    path = os.path.join(directory, f"pass{passes}-{n}")
+                    merge(group, path, recsize, fields, memory // (len(group) + 1))
+                    for run in group:
+                        os.remove(run)
+                    group = [path]
+                merged += group
+            runs = merged
+        merge(runs, output, recsize, fields, memory // (len(runs) + 1))
+    return len(starts)
+
+def plisrta(sort, record, storage):
+    """
+    CALL PLISRTA(sort, record, storage, retcode); - sorts SORTIN into
+    SORTOUT; returns the return code (0, 16 if the sort failed).
+    """
+    try:
+        sort_file(SORTIN + SUFFIX, SORTOUT + SUFFIX, parse_fields(sort), parse_record(record),
+                  int(storage), JOBS)
+    except (OSError, ValueError, ArithmeticError) as error:
+        print(f"PLISRTA: {error}", file=sys.stderr)
+        return FAILED
+    return SORTED
+
+def memory_size(text):
+    """A number of bytes with an optional K, M or G suffix."""
+    text = text.strip().upper()
+    factor = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}.get(text[-1:], 1)
+    return int(text[:-1] if factor > 1 else text) * factor
+
+def main(argv=None):
+    """Command line: python -m plithon_runtime.sort input output fields [options]."""
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m plithon_runtime.sort',
+                                     description='Sort a file of records larger than memory')
+    parser.add_argument('input', help='file to sort')
+    parser.add_argument('output', help='sorted file (may be the input)')
+    parser.add_argument('fields', help="sort fields: 'SORT FIELDS=(1,10,CH,A)' or '1,10,CH,A'")
+    parser.add_argument('--recsize', type=int, default=None,
+                        help='length of fixed-length records (default: lines)')
+    parser.add_argument('-m', '--memory', type=memory_size, default=MEMORY,
+                        help='memory budget in bytes, K, M or G suffix allowed (default: 64M)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of processes sorting the runs (default: 1)')
+    parser.add_argument('--tmpdir', default=None, help='directory of the run files')
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    try:
+        runs = sort_file(args.input, args.output, args.fields, args.recsize, args.memory, args.jobs,
+                         args.tmpdir)
+    except (OSError, ValueError, ArithmeticError) as error:
+        print(f"sort: {error}", file=sys.stderr)
+        return FAILED
+    print(f"{args.input} -> {args.output}: {runs} run(s), {time.perf_counter() - start:.3f}s")
+    return SORTED
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,371 @@
+# =============================================================================
+# EXEC SQL support of the generated programs.
+#
+# All EXEC SQL statements of a process share one lazily opened connection per
+# set of connection parameters (and per thread, DB-API connections are not
+# thread safe). Every statement text gets its own cursor, created once and
+# reused for every execution, so MySQL prepares the statement only once.
+#
+# Host variables (:name) in the statement text are passed to the driver as
+# parameters and never pasted into the SQL text:
+#
+#   EXEC SQL "select last_name from actor where actor_id = :k" INTO x;
+#
+#   x = select_into(connection(SQL_CONNECTION), "select ... = :k", {'k': k})
+#
+# Declared cursors fetch rows in batches of fetch_size rows (a connection
+# parameter, default 100); FETCH INTO arrays fetches as many rows as the
+# arrays have elements with one fetchmany() call:
+#
+#   EXEC SQL DECLARE c CURSOR FOR "select id, name from t where id > :k";
+#   EXEC SQL OPEN c;                    host variables are read at OPEN
+#   EXEC SQL FETCH c INTO ids, names;   ids(100) fixed bin, names(100) char
+#   EXEC SQL CLOSE c;
+#
+# The driver is any DB-API 2.0 module: 'mysql' (mysql.connector, default),
+# 'sqlite' (sqlite3) or one added with register_driver(), e.g. a fake driver
+# for tests. It is chosen by the 'driver' connection parameter, all other
+# parameters are passed to its connect().
+#
+# SQL_CONNECTION refers to the configuration (plithon_config.SqlConfig): the
+# path of a configuration file, the registered name of a dict configuration
+# or None for the environment and the default file of the process. It is
+# loaded by the first statement that connects.
+# =============================================================================
+import importlib
+import re
+import threading
+from array import array
+
+from plithon_runtime.arrays import CharArray
+from plithon_runtime.fixed import FixedOverflow, scaled
+
+# rows fetched at a time by a declared cursor
+FETCH_SIZE = 100
+
+# SQLCODE of a FETCH without a row (and of an array FETCH that reached the end)
+NOT_FOUND = 100
+
+# name -> (DB-API module or its import name, keyword arguments of cursor())
+DRIVERS = {
+    'mysql': ('mysql.connector', {'prepared': True}),
+    'sqlite': ('sqlite3', {}),
+}
+
+# string literals are skipped, a host variable is a colon followed by a name
+HOST_VARIABLE = re.compile(r"'(?:[^']|'')*'|:([A-Za-z_][A-Za-z_0-9]*)")
+
+def register_driver(name, module, cursor_args=None):
+    """
+    Makes a DB-API module available as driver name.
+
+    Args:
+        name: Value of the 'driver' connection parameter.
+        module: The DB-API module or its import name.
+        cursor_args: Keyword arguments of connection.cursor().
+    """
+    DRIVERS[name] = (module, cursor_args or {})
+
+def host_variables(statement):
+    """Returns the names of the host variables of an SQL text, in order."""
+    return [match.group(1) for match in HOST_VARIABLE.finditer(statement) if match.group(1)]
+
+def bind(statement, paramstyle):
+    """
+    Converts the host variables of an SQL text to the parameter markers of a
+    driver.
+
+    Returns:
+        A tuple (SQL text, names): names is the list of host variables in
+        the order of the markers, or None if the driver takes a mapping.
+    """
+    names = []
+
+    def marker(match):
+        name = match.group(1)
+        if not name:
+            return match.group(0)
+        names.append(name)
+        if paramstyle == 'qmark':
+            return '?'
+        if paramstyle == 'numeric':
+            return f":{len(names)}"
+        if paramstyle == 'named':
+            return f":{name}"
+        if paramstyle == 'pyformat':
+            return f"%({name})s"
+        return '%s'
+
+    if paramstyle in ('format', 'pyformat') and host_variables(statement):
+        # the driver formats the whole text with %: a literal % must be doubled
+        statement = statement.replace('%', '%%')
+    sql = HOST_VARIABLE.sub(marker, statement)
+    if paramstyle in ('named', 'pyformat'):
+        return sql, None
+    return sql, names
+
+class Connection:
+    """
+    One database connection, opened on the first statement.
+
+    Args:
+        params: Connection parameters; 'driver' selects the DB-API module,
+            the others are passed to its connect().
+    """
+
+    def __init__(self, params):
+        params = dict(params)
+        module, self._cursor_args = DRIVERS[params.pop('driver', 'mysql')]
+        self.fetch_size = int(params.pop('fetch_size', FETCH_SIZE))
+        self._module = module
+        self._params = params
+        self._connection = None
+        self._statements = {}   # statement text -> (cursor, sql, names)
+
+    @property
+    def module(self):
+        """The DB-API module of the driver (imported on first use)."""
+        if isinstance(self._module, str):
+            self._module = importlib.import_module(self._module)
+        return self._module
+
+    def prepare(self, text):
+        """Returns a new (cursor, sql, names) for a statement text."""
+        if self._connection is None:
+            self._connection = self.module.connect(**self._params)
+        sql, names = bind(text, getattr(self.module, 'paramstyle', 'qmark'))
+        return self._connection.cursor(**self._cursor_args), sql, names
+
+    def statement(self, text):
+        """Returns the cached (cursor, sql, names) of a statement text."""
+        entry = self._statements.get(text)
+        if entry is None:
+            entry = self._statements[text] = self.prepare(text)
+        return entry
+
+    def execute(self, text, values, entry=None):
+        """
+        Executes a statement with the host variable values; returns the cursor.
+
+        Args:
+            text: The statement text.
+            values: Dict of the host variable values.
+            entry: (cursor, sql, names) to use instead of the cached one.
+        """
+        cursor, sql, names = entry or self.statement(text)
+        if names is None:
+            cursor.execute(sql, values)
+        elif names:
+            cursor.execute(sql, [values[name] for name in names])
+        else:
+            cursor.execute(sql)
+        return cursor
+
+    def close(self):
+        """Closes the cursors and the connection."""
+        for cursor, sql, names in self._statements.values():
+            cursor.close()
+        self._statements = {}
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+_pool = threading.local()
+
+# configuration reference -> its connection parameters
+_configs = {}
+
+def connection_params(config):
+    """
+    The connection parameters of a configuration reference, loaded once.
+
+    Args:
+        config: SQL_CONNECTION of a generated module: the path of a
+            configuration file, the name of a registered dict or None (a
+            dict of modules of former versions; see plithon_config.py).
+    """
+    key = tuple(sorted(config.items())) if isinstance(config, dict) else config
+    params = _configs.get(key)
+    if params is None:
+        from plithon_config import SqlConfig
+        params = _configs[key] = SqlConfig(config).params()
+    return params
+
+def connection(config):
+    """Returns the shared Connection of a configuration reference (one per thread)."""
+    params = connection_params(config)
+    key = tuple(sorted(params.items()))
+    connections = getattr(_pool, 'connections', None)
+    if connections is None:
+        connections = _pool.connections = {}
+    entry = connections.get(key)
+    if entry is None:
+        entry = connections[key] = Connection(params)
+    return entry
+
+def close_all():
+    """Closes all connections of the current thread."""
+    for entry in getattr(_pool, 'connections', {}).values():
+        entry.close()
+    _pool.connections = {}
+
+def report(error):
+    """Prints a driver error like the SQLCODE / SQLSTATE of PL/I."""
+    print(f"SQL Error: SQLCODE={getattr(error, 'errno', None)}, "
+          f"SQLSTATE={getattr(error, 'sqlstate', None)}, "
+          f"Message={getattr(error, 'msg', error)}")
+
+def sqlcode(error):
+    """Negative SQLCODE of a driver error."""
+    code = getattr(error, 'errno', None)
+    return -abs(code) if isinstance(code, int) and code else -1
+
+def select_into(db, text, values):
+    """
+    EXEC SQL "text" INTO target; - returns the first column of the first
+    row, None if there is no row or the statement failed.
+    """
+    try:
+        cursor = db.execute(text, values)
+        row = cursor.fetchone()
+        if row is not None:
+            cursor.fetchall()   # a singleton select: drop any further rows
+    except db.module.Error as error:
+        report(error)
+        return None
+    return row[0] if row else None
+
+def store_fixed(target, values, format):
+    """
+    Stores column values into the first elements of a FIXED array: scaled,
+    checked against the range of the array, NULL leaves an element unchanged.
+    """
+    if format is None:
+        bits = target.itemsize * 8 - 1
+        format = ('array', 0, -(1 << bits), (1 << bits) - 1)
+    name, scale, low, high = format
+    # scaled() converts Decimal, float and numeric strings as well
+    values = [scaled(value, scale) for value in values]
+    present = [value for value in values if value is not None] if None in values else values
+    if present and (min(present) < low or max(present) > high):
+        raise FixedOverflow(name, next(value for value in present if not low <= value <= high), scale)
+    if len(present) == len(values):
+        target[:len(values)] = array(target.typecode, values)
+    else:
+        for offset, value in enumerate(values):
+            if value is not None:
+                target[offset] = value
+
+class Cursor:
+    """
+    A declared SQL cursor.
+
+    Args:
+        db: The Connection.
+        text: The query.
+        host_values: None or a function returning the dict of the host
+            variable values, called at OPEN.
+
+    Attributes:
+        sqlcode: 0, NOT_FOUND or the negative error code of the last statement.
+        rows: Number of rows of the last FETCH.
+    """
+
+    def __init__(self, db, text, host_values=None):
+        self.db = db
+        self.text = text
+        self._host_values = host_values
+        self._cursor = None
+        self._buffer = []
+        self._next = 0
+        self.sqlcode = 0
+        self.rows = 0
+
+    def open(self):
+        """EXEC SQL OPEN: executes the query."""
+        self.close()
+        db = self.db
+        try:
+            entry = db.prepare(self.text)
+            values = self._host_values() if self._host_values else {}
+            self._cursor = db.execute(self.text, values, entry)
+            self.sqlcode = 0
+        except db.module.Error as error:
+            report(error)
+            self.sqlcode = sqlcode(error)
+
+    def _fetch(self, count):
+        """Returns up to count rows: first the buffered ones, then one fetchmany()."""
+        rows = self._buffer[self._next:self._next + count]
+        self._next += len(rows)
+        if len(rows) < count and self._cursor is not None:
+            rows += self._cursor.fetchmany(count - len(rows))
+        return rows
+
+    def fetch_row(self):
+        """EXEC SQL FETCH INTO scalars: returns the next row, None at the end."""
+        db = self.db
+        try:
+            if self._next >= len(self._buffer):
+                if self._cursor is None:
+                    raise db.module.ProgrammingError("cursor is not open")
+                self._buffer = self._cursor.fetchmany(db.fetch_size)
+                self._next = 0
+        except db.module.Error as error:
+            report(error)
+            self.sqlcode = sqlcode(error)
+            self.rows = 0
+            return None
+        if self._next >= len(self._buffer):
+            self.sqlcode = NOT_FOUND
+            self.rows = 0
+            return None
+        row = self._buffer[self._next]
+        self._next += 1
+        self.sqlcode = 0
+        self.rows = 1
+        return row
+
+    def fetch_into(self, targets, formats=None):
+        """
+        EXEC SQL FETCH INTO arrays: fills element 1, 2, ... of every array
+        with one column of the next rows.
+
+        Args:
+            targets: The arrays, one per column.
+            formats: Per array None (CHAR) or (name, scale, min, max) of
+                its FIXED elements: the values are stored as ints scaled by
+                10**scale, FixedOverflow if one is out of range. Without
+                formats the range of the element type applies.
+
+        Returns:
+            The number of rows fetched.
+        """
+        capacity = min(len(t) // t.width if isinstance(t, CharArray) else len(t) for t in targets)
+        db = self.db
+        try:
+            if self._cursor is None:
+                raise db.module.ProgrammingError("cursor is not open")
+            rows = self._fetch(capacity)
+        except db.module.Error as error:
+            report(error)
+            self.sqlcode = sqlcode(error)
+            self.rows = 0
+            return 0
+        for column, target in enumerate(targets):
+            values = [row[column] for row in rows]
+            if isinstance(target, CharArray):
+                target.store_all(values)
+            else:
+                store_fixed(target, values, formats[column] if formats else None)
+        self.rows = len(rows)
+        self.sqlcode = NOT_FOUND if len(rows) < capacity else 0
+        return self.rows
+
+    def close(self):
+        """EXEC SQL CLOSE."""
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+        self._buffer = []
+        self._next = 0
@@ -0,0 +1,18 @@
+# =============================================================================
+# Stream input of the generated programs: GET LIST reads every variable from
+# the console, after a prompt with its name:
+#
+#   GET LIST(n, d);     n = get_item('n')
+#                       d = scaled(get_item('d'), 2)
+#
+# A value is an int if its text is one, else the text; the generated code
+# converts it for FIXED DECIMAL variables.
+# =============================================================================
+
+def get_item(name):
+    """Reads the value of a variable from the console: an int if the text is one, else the text."""
+    text = input(f"Enter {name}: ")
+    try:
+        return int(text)
+    except ValueError:
+        return text   # Fall back to string if not an integer
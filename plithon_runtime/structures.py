@@ -0,0 +1,77 @@
+# =============================================================================
+# Structures of the generated programs (DCL 1 name, 2 field type, ...).
+#
+# Every structure is a class generated with the program: the fields are
+# __slots__ holding the values of scalars of their types (CHAR(n) a str of n
+# characters, FIXED an int), and a struct layout of the record, computed
+# once, maps them to the bytes of a record:
+#
+#   dcl 1 emp,                class _structure_emp(Structure):
+#         2 name char(20),        __slots__ = ('name', 'id', 'pay')
+#         2 id fixed bin(31),     _layout = Struct('>20sii')
+#         2 pay fixed dec(7,2);   _numbers = Struct('>20xii')
+#                                 def _unpack_from(self, _data, _offset=0):
+#                                     _record = _data[_offset:_offset + 28].decode('latin-1')
+#                                     self.name = _record[0:20]
+#                                     self.id, self.pay = self._numbers.unpack_from(_data, _offset)
+#                                 def _pack_into(self, _data, _offset=0): ...
+#                             emp = _structure_emp()
+#
+# The CHAR fields are slices of the record decoded once (cheaper than a
+# decode per field), the numbers are unpacked by _numbers, the layout with
+# the CHAR bytes skipped.
+#
+# The names of the class and of its methods and locals start with an
+# underscore, so they never clash with field names.
+#
+# The fields follow each other without alignment (UNALIGNED): CHAR(n) is n
+# bytes (latin-1), FIXED BIN and FIXED DEC (the scaled int) 2, 4 or 8 bytes,
+# big-endian, after the precision like the elements of FIXED arrays.
+#
+# READ FILE(f) INTO(emp); unpacks the record straight from the read buffer
+# of a RECSIZE file or from the mapped bytes of an MMAP file; WRITE
+# FILE(f) FROM(emp); packs the fields into one buffer of the class
+# (plithon_runtime.records).
+# =============================================================================
+from struct import Struct   # the generated classes take it from here
+
+from plithon_runtime.arrays import CHARSET, typecode
+
+class Structure:
+    """
+    Base of the generated structure classes.
+
+    Class attributes of a structure class:
+        _layout: struct.Struct of the record.
+        _numbers: struct.Struct of the numeric fields (the CHAR fields pad
+            bytes), if the record has both.
+        _buffer: bytearray of the layout's size, the record written last.
+    """
+    __slots__ = ()
+    _layout = Struct('')
+    _buffer = bytearray()
+
+    def _unpack_from(self, _data, _offset=0):
+        """Sets the fields from the record at _offset in _data (bytes, bytearray or mmap)."""
+
+    def _pack_into(self, _data, _offset=0):
+        """Stores the fields as record at _offset in _data."""
+
+    def _text(self):
+        """The record of the fields as str (one character per byte)."""
+        buffer = self._buffer
+        self._pack_into(buffer)
+        return str(buffer, CHARSET)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+def field_format(kind, size):
+    """
+    struct format of a field: kind is 'char', 'bin' or 'dec', size the
+    length, precision or (p, q) of the declaration.
+    """
+    if kind == 'char':
+        return f"{size}s"
+    return typecode((10 ** size[0] - 1).bit_length() if kind == 'dec' else size)
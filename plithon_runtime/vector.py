@@ -0,0 +1,67 @@
+# =============================================================================
+# Whole-array arithmetic on FIXED BIN arrays with NumPy.
+#
+# For a = b + c * 2; the generated code runs
+#
+#   if NUMPY:
+#       assign(a, vec(b) + vec(c) * 2)
+#   else:
+#       for _k in range(count):
+#           a[_k] = b[_k] + c[_k] * 2
+#
+# vec() is a copy of an array's values widened to 64 bit. NumPy wraps int64
+# around silently, so the generated code only takes this path for
+# FIXED BIN(15) and (31) arrays and for expressions whose values, the
+# intermediate ones included, are known to fit into 64 bit; FIXED BIN(63)
+# arrays and the other expressions run the element loop (Python ints).
+# divide() is the exact quotient truncated towards zero, assign() truncates
+# the float values of nested quotients, checks the range of the target type
+# (FixedOverflow, like an assignment to a scalar) and copies the values into
+# the target buffer. NumPy is optional: without it NUMPY is False and the
+# element loop is used.
+# =============================================================================
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NUMPY = numpy is not None
+
+def vec(source):
+    """Returns the values of a fixed_array as a 64 bit NumPy array."""
+    return numpy.frombuffer(source, dtype=source.typecode).astype(numpy.int64)
+
+def divide(dividend, divisor):
+    """
+    Integer quotients truncated towards zero of NumPy int64 values (or ints),
+    exact like fixed.divide().
+    """
+    if not numpy.all(divisor):
+        raise ZeroDivisionError("division by zero")
+    quotient = numpy.floor_divide(dividend, divisor)
+    # floor_divide rounds towards minus infinity
+    return quotient + ((quotient < 0) & (quotient * divisor != dividend))
+
+def assign(target, value, name='array'):
+    """
+    Stores the NumPy result of a whole-array expression into target; raises
+    FixedOverflow with the name of the array if a value doesn't fit.
+    """
+    view = numpy.frombuffer(target, dtype=target.typecode)
+    if value.dtype.kind == 'f':
+        if not numpy.isfinite(value).all():
+            raise ZeroDivisionError("division by zero")
+        value = numpy.trunc(value)
+    if value.size:
+        limits = numpy.iinfo(view.dtype)
+        if value.min() < limits.min or value.max() > limits.max:
+            from plithon_runtime.fixed import FixedOverflow
+            outside = value[(value < limits.min) | (value > limits.max)]
+            raise FixedOverflow(name, int(outside[0]))
+    numpy.copyto(view, value, casting='unsafe')
+
+def total(source):
+    """SUM(array): sum of all elements of a fixed_array."""
+    if NUMPY:
+        return int(numpy.frombuffer(source, dtype=source.typecode).sum(dtype=numpy.int64))
+    return sum(source)
@@ -0,0 +1,7 @@
+# Pre-generated LALR tables of the plithon grammar.
+#
+# The tables are loaded read-only by plithon.parser_tables(); the module name
+# carries the grammar signature, see plithon.grammar_signature(). After any
+# change of a grammar rule docstring or of the token list regenerate them with
+#
+#   python plithon.py --build-tables
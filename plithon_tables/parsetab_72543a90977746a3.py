@@ -0,0 +1,172 @@
+
+# parsetab_72543a90977746a3.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ASSIGN BIN BLOCK_COMMENT BY CALL CHAR CHAR_CONST CLOSE COLON COMMA CONCAT CURSOR DCL DECIMAL DEC_CONST DELETE DIVIDE DO ELSE END ENDFILE EQ EXEC FETCH FILE FIXED FOR FROM GE GET GT ID IF INDEX INPUT INTO KEY KEYFROM LE LIST LPAREN LT MAIN MINUS MOD MODE NE NUMBER ON OPEN OPTIONS OTHER OUTPUT PLUS PROC PUT READ REWRITE RPAREN SELECT SEMICOLON SKIP SQL STRING SUBSTR THEN TIMES TO UNTIL UPDATE VARYING WHEN WHILE WRITEprogram : procedure_header declaration_list statement_list END ID SEMICOLONprocedure_header : ID COLON PROC OPTIONS LPAREN MAIN RPAREN SEMICOLON\n    variable_access : ID LPAREN NUMBER COMMA NUMBER RPAREN\n                   | ID LPAREN ID COMMA ID RPAREN\n                   | ID LPAREN ID COMMA NUMBER RPAREN\n                   | ID LPAREN NUMBER RPAREN                   \n                   | ID LPAREN ID RPAREN\n                   | ID                          \n    declaration_list : declaration_list declaration SEMICOLON\n                        | declaration SEMICOLONdeclaration : DCL id_list type_declaration\n                   | DCL id_list array_spec type_declarationdeclaration : DCL NUMBER ID COMMA field_listfield_list : NUMBER ID type_declaration\n                  | field_list COMMA NUMBER ID type_declarationid_list : ID\n               | id_list COMMA ID\n               | id_list COMMA ID array_specarray_spec : LPAREN NUMBER RPAREN\n                 | LPAREN NUMBER COMMA NUMBER RPARENtype_declaration : FIXED BIN LPAREN NUMBER RPAREN\n                        | FIXED DECIMAL LPAREN NUMBER RPAREN\n                        | FIXED DECIMAL LPAREN NUMBER COMMA NUMBER RPAREN\n                        | CHAR LPAREN NUMBER RPAREN\n                        | CHAR LPAREN NUMBER RPAREN VARYINGstatement_list : statement_list statement  \n                      | statement     \n                      | emptyempty :write_file : WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON\n                  | WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN KEYFROM LPAREN expression RPAREN SEMICOLONrewrite_file : REWRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON\n                    | REWRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN KEY LPAREN expression RPAREN SEMICOLONdelete_file : DELETE FILE LPAREN CHAR_CONST RPAREN SEMICOLON\n                   | DELETE FILE LPAREN CHAR_CONST RPAREN KEY LPAREN expression RPAREN SEMICOLONstatement : assignment_statement  \n                 | declaration                 \n                 | if_statement\n                 | select_statement\n                 | do_while_statement\n                 | do_until_statement\n                 | do_loop_statement\n                 | do_end_block\n                 | put_statement\n                 | get_list_statement\n                 | block_comment_statement\n                 | open_file\n                 | read_file\n                 | write_file\n                 | rewrite_file\n                 | delete_file\n                 | close_file                \n                 | on_endfile\n                 | on_key\n                 | call_statement\n                 | sql_statementblock_comment_statement : BLOCK_COMMENTassignment_statement : variable_access ASSIGN expression SEMICOLONexpression : expression PLUS expression\n                  | expression MINUS expression\n                  | expression TIMES expression\n                  | expression DIVIDE expression\n                  | LPAREN expression RPAREN\n                  | NUMBER\n                  | DEC_CONST\n                  | CHAR_CONST\n                  | SUBSTR\n                  | MOD\n                  | INDEX\n                  | DECIMAL\n                  | variable_accessexpression : SUBSTR LPAREN ID COMMA NUMBER COMMA NUMBER RPAREN\n                  | SUBSTR LPAREN ID COMMA NUMBER RPARENexpression : MOD LPAREN ID COMMA NUMBER RPARENexpression : INDEX LPAREN ID COMMA CHAR_CONST RPARENexpression : DECIMAL LPAREN ID RPARENif_statement : IF relational_expression THEN statement ELSE statement   \n                    | IF relational_expression THEN statement ELSE do_end_block\n                    | IF relational_expression THEN do_end_block ELSE statement  \n                    | IF relational_expression THEN do_end_block ELSE do_end_blockdo_end_block : DO SEMICOLON statement_list END SEMICOLONrelational_expression : expression EQ expression\n                             | expression NE expression\n                             | expression LT expression\n                             | expression LE expression\n                             | expression GT expression\n                             | expression GE expression\n                             | expression ASSIGN expressionexpression : expression CONCAT expressionput_statement : PUT SKIP LIST LPAREN element_list RPAREN SEMICOLONget_list_statement : GET LIST LPAREN id_list RPAREN SEMICOLONid_list : ID COMMA id_listelement_list : element\n                    | element_list COMMA elementelement : ID\n               | NUMBER\n               | CHAR_CONSTselect_statement : SELECT LPAREN expression RPAREN SEMICOLON when_list other_statement END SEMICOLONselect_end : END SEMICOLONwhen_list : when_list WHEN LPAREN expression RPAREN statement  \n                 | when_list WHEN LPAREN expression RPAREN do_end_block\n                 | WHEN LPAREN expression RPAREN statement  \n                 | WHEN LPAREN expression RPAREN do_end_block\n                 | emptyother_statement : OTHER statement  \n                       | OTHER do_end_block\n                       | emptydo_while_statement : DO WHILE LPAREN relational_expression RPAREN SEMICOLON statement do_end\n                          | DO WHILE LPAREN relational_expression RPAREN SEMICOLON statement_list do_enddo_until_statement : DO UNTIL LPAREN relational_expression RPAREN SEMICOLON statement_list do_enddo_loop_statement : DO ID ASSIGN do_value TO do_value SEMICOLON statement_list do_end\n                         | DO ID ASSIGN do_value TO do_value BY do_value SEMICOLON statement_list do_enddo_value : expression\n                | MINUS expressiondo_end : END SEMICOLONopen_file : OPEN FILE LPAREN CHAR_CONST RPAREN INPUT file_options SEMICOLON\n                 | OPEN FILE LPAREN CHAR_CONST RPAREN OUTPUT file_options SEMICOLON\n                 | OPEN FILE LPAREN CHAR_CONST RPAREN UPDATE file_options SEMICOLONfile_options : file_options ID\n                    | file_options ID LPAREN NUMBER RPAREN\n                    | emptyon_endfile : ON ENDFILE LPAREN CHAR_CONST RPAREN statement\n                  | ON ENDFILE LPAREN ID RPAREN statement\n                  | ON ENDFILE LPAREN CHAR_CONST RPAREN do_end_block\n                  | ON ENDFILE LPAREN ID RPAREN do_end_blockon_key : ON KEY LPAREN CHAR_CONST RPAREN statement\n              | ON KEY LPAREN ID RPAREN statement\n              | ON KEY LPAREN CHAR_CONST RPAREN do_end_block\n              | ON KEY LPAREN ID RPAREN do_end_blockread_file : READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN SEMICOLON\n                 | READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN KEY LPAREN expression RPAREN SEMICOLONclose_file : CLOSE FILE LPAREN CHAR_CONST RPAREN SEMICOLONcall_statement : CALL ID LPAREN argument_list RPAREN SEMICOLONargument_list : expression\n                     | argument_list COMMA expressionsql_statement : EXEC SQL STRING INTO ID SEMICOLONsql_statement : EXEC SQL DCL ID CURSOR FOR STRING SEMICOLON\n                     | EXEC SQL OPEN ID SEMICOLON\n                     | EXEC SQL FETCH ID INTO id_list SEMICOLON\n                     | EXEC SQL CLOSE ID SEMICOLONpl1_var : IDsql_query : STRING'
+    
+_lr_action_items = {'ID':([0,4,6,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,36,39,47,49,51,54,55,56,57,58,59,62,71,73,88,90,95,101,102,103,104,105,106,107,108,109,110,111,112,113,115,116,117,118,120,121,122,123,125,132,133,134,136,137,138,139,140,150,154,157,181,182,196,207,208,213,214,221,223,237,238,239,240,242,245,246,247,251,258,259,260,261,268,269,272,273,274,275,276,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,302,310,312,313,314,315,316,317,318,320,321,322,323,324,325,326,327,329,334,338,340,341,342,344,345,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,382,383,384,385,392,393,394,],[3,9,52,9,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,9,75,-57,86,-10,94,97,-26,-37,98,-9,9,9,9,9,-11,141,52,9,9,9,9,9,9,9,9,9,9,9,9,9,171,172,173,174,9,9,9,9,52,191,193,9,197,198,199,200,-12,210,-58,75,9,227,243,252,-13,9,9,-81,9,9,9,9,9,9,-138,52,-140,-24,-77,-43,-43,-79,9,9,227,-91,-29,-29,-29,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,331,9,9,-27,9,9,9,9,-90,345,-121,345,345,348,349,350,9,-139,9,-108,-109,-110,9,-116,-119,-117,-118,-137,-23,-15,-98,9,-115,-111,9,9,9,-130,-30,-32,-35,-112,-120,9,9,9,-131,-31,-33,]),'$end':([1,149,],[0,-1,]),'DCL':([2,4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,87,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,303,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[6,6,6,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,6,136,-11,6,6,-12,-58,-13,6,6,-81,6,6,6,6,-138,-140,-24,-77,-43,-43,-79,6,6,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,-2,6,-27,6,6,6,-90,-139,-108,-109,-110,6,-116,-117,-118,-137,-23,-15,-98,6,-115,-111,6,6,6,-130,-30,-32,-35,-112,-131,-31,-33,]),'COLON':([3,],[7,]),'END':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,121,140,154,208,219,221,245,247,251,258,259,260,261,265,267,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,308,311,313,314,315,316,318,329,335,336,338,340,341,342,344,346,347,352,353,354,356,359,360,361,368,369,370,372,374,376,378,379,380,381,392,393,394,],[-29,54,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,-29,-11,177,-12,-58,-13,-29,-81,-138,-140,-24,-77,-43,-43,-79,-29,-104,-29,-29,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,333,-107,339,339,339,-29,-90,-139,-105,-43,-108,-109,-110,339,-116,-117,-118,-137,-23,-15,-98,-115,-111,-29,-102,-43,339,-130,-30,-32,-35,-100,-43,-112,-131,-31,-33,]),'IF':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[34,34,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,34,-11,34,34,-12,-58,-13,34,34,-81,34,34,34,34,-138,-140,-24,-77,-43,-43,-79,34,34,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,34,-27,34,34,34,-90,-139,-108,-109,-110,34,-116,-117,-118,-137,-23,-15,-98,34,-115,-111,34,34,34,-130,-30,-32,-35,-112,-131,-31,-33,]),'SELECT':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[35,35,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,35,-11,35,35,-12,-58,-13,35,35,-81,35,35,35,35,-138,-140,-24,-77,-43,-43,-79,35,35,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,35,-27,35,35,35,-90,-139,-108,-109,-110,35,-116,-117,-118,-137,-23,-15,-98,35,-115,-111,35,35,35,-130,-30,-32,-35,-112,-131,-31,-33,]),'DO':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[36,36,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,36,-11,157,36,-12,-58,-13,157,157,-81,157,157,157,157,-138,-140,-24,-77,-43,-43,-79,36,36,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,157,-27,36,36,36,-90,-139,-108,-109,-110,36,-116,-117,-118,-137,-23,-15,-98,157,-115,-111,36,157,36,-130,-30,-32,-35,-112,-131,-31,-33,]),'PUT':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[37,37,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,37,-11,37,37,-12,-58,-13,37,37,-81,37,37,37,37,-138,-140,-24,-77,-43,-43,-79,37,37,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,37,-27,37,37,37,-90,-139,-108,-109,-110,37,-116,-117,-118,-137,-23,-15,-98,37,-115,-111,37,37,37,-130,-30,-32,-35,-112,-131,-31,-33,]),'GET':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[38,38,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,38,-11,38,38,-12,-58,-13,38,38,-81,38,38,38,38,-138,-140,-24,-77,-43,-43,-79,38,38,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,38,-27,38,38,38,-90,-139,-108,-109,-110,38,-116,-117,-118,-137,-23,-15,-98,38,-115,-111,38,38,38,-130,-30,-32,-35,-112,-131,-31,-33,]),'BLOCK_COMMENT':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[39,39,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,39,-11,39,39,-12,-58,-13,39,39,-81,39,39,39,39,-138,-140,-24,-77,-43,-43,-79,39,39,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,39,-27,39,39,39,-90,-139,-108,-109,-110,39,-116,-117,-118,-137,-23,-15,-98,39,-115,-111,39,39,39,-130,-30,-32,-35,-112,-131,-31,-33,]),'OPEN':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,87,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[40,40,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,40,137,-11,40,40,-12,-58,-13,40,40,-81,40,40,40,40,-138,-140,-24,-77,-43,-43,-79,40,40,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,40,-27,40,40,40,-90,-139,-108,-109,-110,40,-116,-117,-118,-137,-23,-15,-98,40,-115,-111,40,40,40,-130,-30,-32,-35,-112,-131,-31,-33,]),'READ':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[41,41,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,41,-11,41,41,-12,-58,-13,41,41,-81,41,41,41,41,-138,-140,-24,-77,-43,-43,-79,41,41,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,41,-27,41,41,41,-90,-139,-108,-109,-110,41,-116,-117,-118,-137,-23,-15,-98,41,-115,-111,41,41,41,-130,-30,-32,-35,-112,-131,-31,-33,]),'WRITE':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[42,42,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,42,-11,42,42,-12,-58,-13,42,42,-81,42,42,42,42,-138,-140,-24,-77,-43,-43,-79,42,42,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,42,-27,42,42,42,-90,-139,-108,-109,-110,42,-116,-117,-118,-137,-23,-15,-98,42,-115,-111,42,42,42,-130,-30,-32,-35,-112,-131,-31,-33,]),'REWRITE':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[43,43,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,43,-11,43,43,-12,-58,-13,43,43,-81,43,43,43,43,-138,-140,-24,-77,-43,-43,-79,43,43,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,43,-27,43,43,43,-90,-139,-108,-109,-110,43,-116,-117,-118,-137,-23,-15,-98,43,-115,-111,43,43,43,-130,-30,-32,-35,-112,-131,-31,-33,]),'DELETE':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[44,44,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,44,-11,44,44,-12,-58,-13,44,44,-81,44,44,44,44,-138,-140,-24,-77,-43,-43,-79,44,44,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,44,-27,44,44,44,-90,-139,-108,-109,-110,44,-116,-117,-118,-137,-23,-15,-98,44,-115,-111,44,44,44,-130,-30,-32,-35,-112,-131,-31,-33,]),'CLOSE':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,87,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[45,45,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,45,139,-11,45,45,-12,-58,-13,45,45,-81,45,45,45,45,-138,-140,-24,-77,-43,-43,-79,45,45,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,45,-27,45,45,45,-90,-139,-108,-109,-110,45,-116,-117,-118,-137,-23,-15,-98,45,-115,-111,45,45,45,-130,-30,-32,-35,-112,-131,-31,-33,]),'ON':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[46,46,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,46,-11,46,46,-12,-58,-13,46,46,-81,46,46,46,46,-138,-140,-24,-77,-43,-43,-79,46,46,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,46,-27,46,46,46,-90,-139,-108,-109,-110,46,-116,-117,-118,-137,-23,-15,-98,46,-115,-111,46,46,46,-130,-30,-32,-35,-112,-131,-31,-33,]),'CALL':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[47,47,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,47,-11,47,47,-12,-58,-13,47,47,-81,47,47,47,47,-138,-140,-24,-77,-43,-43,-79,47,47,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,47,-27,47,47,47,-90,-139,-108,-109,-110,47,-116,-117,-118,-137,-23,-15,-98,47,-115,-111,47,47,47,-130,-30,-32,-35,-112,-131,-31,-33,]),'EXEC':([4,8,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,39,49,55,56,58,73,88,101,121,140,154,208,213,214,221,237,238,239,240,245,247,251,258,259,260,261,268,269,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,310,313,314,315,316,318,329,338,340,341,342,344,346,347,352,353,354,356,358,359,360,361,367,370,372,374,376,378,381,392,393,394,],[48,48,-37,-27,-28,-36,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-10,-26,-37,-9,48,-11,48,48,-12,-58,-13,48,48,-81,48,48,48,48,-138,-140,-24,-77,-43,-43,-79,48,48,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,48,-27,48,48,48,-90,-139,-108,-109,-110,48,-116,-117,-118,-137,-23,-15,-98,48,-115,-111,48,48,48,-130,-30,-32,-35,-112,-131,-31,-33,]),'SEMICOLON':([5,9,10,36,52,63,64,65,66,67,68,69,70,88,97,100,140,141,147,151,153,157,165,166,167,168,169,170,175,177,180,198,200,201,204,208,218,220,222,224,230,235,236,241,243,251,254,255,256,257,270,271,274,275,276,295,296,297,299,300,301,305,306,307,320,321,322,323,328,333,339,343,345,353,354,355,363,364,365,366,382,389,390,391,],[49,-8,58,73,-16,-64,-65,-66,-67,-68,-69,-70,-71,-11,149,154,-12,-17,-92,-7,-6,73,-59,-60,-61,-62,-89,-63,219,221,-113,245,247,-18,-19,-13,-76,268,269,-114,273,280,282,291,293,-24,303,-4,-5,-3,316,318,-29,-29,-29,329,-21,-22,-20,-25,-14,-73,-74,-75,344,-121,346,347,352,356,359,361,-119,-23,-15,-72,372,374,376,378,-120,392,393,394,]),'NUMBER':([6,34,57,59,62,71,92,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,145,146,150,152,181,182,202,203,205,215,216,223,242,253,272,298,304,312,317,327,334,362,383,384,385,],[51,63,99,63,63,63,144,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,206,207,211,212,63,228,248,249,250,262,263,63,63,302,228,330,332,63,63,63,63,371,63,63,63,]),'PROC':([7,],[53,]),'LPAREN':([9,34,35,50,52,59,62,66,67,68,69,71,72,74,77,78,79,80,81,82,83,84,85,86,93,96,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,124,134,141,142,143,147,181,201,204,223,242,266,277,278,279,281,299,309,312,317,327,334,345,373,375,377,383,384,385,],[57,62,71,92,-16,62,62,115,116,117,118,62,120,122,125,126,127,128,129,130,131,132,133,134,145,148,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,182,62,92,202,203,-92,62,-18,-19,62,62,312,324,325,326,327,-20,334,62,62,62,62,362,383,384,385,62,62,62,]),'ASSIGN':([9,33,61,63,64,65,66,67,68,69,70,75,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,59,108,-64,-65,-66,-67,-68,-69,-70,-71,123,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'EQ':([9,61,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,102,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'NE':([9,61,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,103,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'LT':([9,61,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,104,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'LE':([9,61,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,105,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'GT':([9,61,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,106,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'GE':([9,61,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,107,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'PLUS':([9,61,63,64,65,66,67,68,69,70,100,114,119,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,180,195,218,224,255,256,257,292,305,306,307,337,351,355,357,386,387,388,],[-8,109,-64,-65,-66,-67,-68,-69,-70,-71,109,109,109,-7,-6,109,109,109,109,109,109,109,109,109,109,109,109,-63,109,109,-76,109,-4,-5,-3,109,-73,-74,-75,109,109,-72,109,109,109,109,]),'MINUS':([9,61,63,64,65,66,67,68,69,70,100,114,119,123,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,180,195,218,223,224,255,256,257,292,305,306,307,317,337,351,355,357,386,387,388,],[-8,110,-64,-65,-66,-67,-68,-69,-70,-71,110,110,110,181,-7,-6,110,110,110,110,110,110,110,110,110,110,110,110,-63,110,110,-76,181,110,-4,-5,-3,110,-73,-74,-75,181,110,110,-72,110,110,110,110,]),'TIMES':([9,61,63,64,65,66,67,68,69,70,100,114,119,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,180,195,218,224,255,256,257,292,305,306,307,337,351,355,357,386,387,388,],[-8,111,-64,-65,-66,-67,-68,-69,-70,-71,111,111,111,-7,-6,111,111,111,111,111,111,111,111,111,111,111,111,-63,111,111,-76,111,-4,-5,-3,111,-73,-74,-75,111,111,-72,111,111,111,111,]),'DIVIDE':([9,61,63,64,65,66,67,68,69,70,100,114,119,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,180,195,218,224,255,256,257,292,305,306,307,337,351,355,357,386,387,388,],[-8,112,-64,-65,-66,-67,-68,-69,-70,-71,112,112,112,-7,-6,112,112,112,112,112,112,112,112,112,112,112,112,-63,112,112,-76,112,-4,-5,-3,112,-73,-74,-75,112,112,-72,112,112,112,112,]),'CONCAT':([9,61,63,64,65,66,67,68,69,70,100,114,119,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,180,195,218,224,255,256,257,292,305,306,307,337,351,355,357,386,387,388,],[-8,113,-64,-65,-66,-67,-68,-69,-70,-71,113,113,113,-7,-6,113,113,113,113,113,113,113,113,113,113,113,113,-63,113,113,-76,113,-4,-5,-3,113,-73,-74,-75,113,113,-72,113,113,113,113,]),'RPAREN':([9,52,63,64,65,66,67,68,69,70,98,99,114,119,141,144,147,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,174,176,178,183,184,185,186,187,188,189,190,191,192,193,194,195,201,204,206,209,210,211,212,218,225,226,227,228,229,248,249,250,255,256,257,262,263,264,292,299,305,306,307,319,330,332,337,348,349,350,351,355,357,371,386,387,388,],[-8,-16,-64,-65,-66,-67,-68,-69,-70,-71,151,153,170,175,-17,204,-92,-7,-6,-82,-83,-84,-85,-86,-87,-88,-59,-60,-61,-62,-89,-63,218,220,222,230,231,232,233,234,235,236,237,238,239,240,241,-134,-18,-19,251,254,255,256,257,-76,271,-93,-95,-96,-97,296,297,299,-4,-5,-3,305,306,307,-135,-20,-73,-74,-75,-94,353,355,358,363,364,365,366,-72,367,382,389,390,391,]),'THEN':([9,60,63,64,65,66,67,68,69,70,151,153,158,159,160,161,162,163,164,165,166,167,168,169,170,218,255,256,257,305,306,307,355,],[-8,101,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-82,-83,-84,-85,-86,-87,-88,-59,-60,-61,-62,-89,-63,-76,-4,-5,-3,-73,-74,-75,-72,]),'TO':([9,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,179,180,218,224,255,256,257,305,306,307,355,],[-8,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,223,-113,-76,-114,-4,-5,-3,-73,-74,-75,-72,]),'COMMA':([9,50,52,63,64,65,66,67,68,69,70,94,98,99,141,144,147,151,153,165,166,167,168,169,170,171,172,173,183,194,195,201,204,208,218,225,226,227,228,229,249,251,255,256,257,262,292,295,296,297,299,300,301,305,306,307,319,353,354,355,],[-8,90,95,-64,-65,-66,-67,-68,-69,-70,-71,146,150,152,-17,205,90,-7,-6,-59,-60,-61,-62,-89,-63,215,216,217,90,242,-134,-18,-19,253,-76,272,-93,-95,-96,-97,298,-24,-4,-5,-3,304,-135,90,-21,-22,-20,-25,-14,-73,-74,-75,-94,-23,-15,-72,]),'BY':([9,63,64,65,66,67,68,69,70,151,153,165,166,167,168,169,170,180,218,224,255,256,257,270,305,306,307,355,],[-8,-64,-65,-66,-67,-68,-69,-70,-71,-7,-6,-59,-60,-61,-62,-89,-63,-113,-76,-114,-4,-5,-3,317,-73,-74,-75,-72,]),'ELSE':([13,14,15,16,17,18,20,21,22,23,24,25,26,27,28,29,30,31,32,39,56,88,140,154,155,156,208,221,245,247,251,258,259,260,261,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,318,329,338,340,341,344,346,347,352,353,354,356,359,360,372,374,376,378,381,392,393,394,],[-36,-38,-39,-40,-41,-42,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-37,-11,-12,-58,213,214,-13,-81,-138,-140,-24,-77,-43,-43,-79,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,-90,-139,-108,-109,-110,-116,-117,-118,-137,-23,-15,-98,-115,-111,-130,-30,-32,-35,-112,-131,-31,-33,]),'WHEN':([13,14,15,16,17,18,20,21,22,23,24,25,26,27,28,29,30,31,32,39,56,88,140,154,208,219,221,245,247,251,258,259,260,261,265,267,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,318,329,338,340,341,344,346,347,352,353,354,356,359,360,368,369,372,374,376,378,379,380,381,392,393,394,],[-36,-38,-39,-40,-41,-42,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-37,-11,-12,-58,-13,266,-81,-138,-140,-24,-77,-43,-43,-79,309,-104,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,-90,-139,-108,-109,-110,-116,-117,-118,-137,-23,-15,-98,-115,-111,-102,-43,-130,-30,-32,-35,-100,-43,-112,-131,-31,-33,]),'OTHER':([13,14,15,16,17,18,20,21,22,23,24,25,26,27,28,29,30,31,32,39,56,88,140,154,208,219,221,245,247,251,258,259,260,261,265,267,273,280,282,283,284,285,286,287,288,289,290,291,293,296,297,300,301,318,329,338,340,341,344,346,347,352,353,354,356,359,360,368,369,372,374,376,378,379,380,381,392,393,394,],[-36,-38,-39,-40,-41,-42,-44,-45,-46,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-37,-11,-12,-58,-13,-29,-81,-138,-140,-24,-77,-43,-43,-79,310,-104,-91,-34,-132,-122,-43,-123,-43,-126,-43,-127,-43,-133,-136,-21,-22,-25,-14,-90,-139,-108,-109,-110,-116,-117,-118,-137,-23,-15,-98,-115,-111,-102,-43,-130,-30,-32,-35,-100,-43,-112,-131,-31,-33,]),'DEC_CONST':([34,59,62,71,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,181,223,242,312,317,327,334,383,384,385,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'CHAR_CONST':([34,59,62,71,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,126,127,128,129,130,131,132,133,134,181,182,217,223,242,272,312,317,327,334,383,384,385,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,184,185,186,187,188,189,190,192,65,65,229,264,65,65,229,65,65,65,65,65,65,65,]),'SUBSTR':([34,59,62,71,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,181,223,242,312,317,327,334,383,384,385,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'MOD':([34,59,62,71,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,181,223,242,312,317,327,334,383,384,385,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'INDEX':([34,59,62,71,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,181,223,242,312,317,327,334,383,384,385,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'DECIMAL':([34,59,62,71,91,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,181,223,242,312,317,327,334,383,384,385,],[69,69,69,69,143,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'WHILE':([36,157,],[72,72,]),'UNTIL':([36,157,],[74,74,]),'SKIP':([37,],[76,]),'LIST':([38,76,],[77,124,]),'FILE':([40,41,42,43,44,45,],[78,79,80,81,82,83,]),'ENDFILE':([46,],[84,]),'KEY':([46,235,363,365,],[85,281,373,377,]),'SQL':([48,],[87,]),'FIXED':([50,52,89,141,147,201,204,252,299,331,],[91,-16,91,-17,-92,-18,-19,91,-20,91,]),'CHAR':([50,52,89,141,147,201,204,252,299,331,],[93,-16,93,-17,-92,-18,-19,93,-20,93,]),'OPTIONS':([53,],[96,]),'STRING':([87,294,],[135,328,]),'FETCH':([87,],[138,]),'BIN':([91,],[142,]),'INTO':([135,199,232,],[196,246,277,]),'MAIN':([148,],[209,]),'CURSOR':([197,],[244,]),'INPUT':([231,],[274,]),'OUTPUT':([231,],[275,]),'UPDATE':([231,],[276,]),'FROM':([233,234,],[278,279,]),'FOR':([244,],[294,]),'VARYING':([251,],[300,]),'KEYFROM':([364,],[375,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'procedure_header':([0,],[2,]),'declaration_list':([2,],[4,]),'declaration':([2,4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[5,10,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'statement_list':([4,73,268,269,316,361,],[8,121,314,315,342,370,]),'statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[11,55,11,155,55,258,261,283,285,287,289,313,11,335,55,55,11,55,368,11,379,55,]),'empty':([4,73,219,265,268,269,274,275,276,316,361,],[12,12,267,311,12,12,321,321,321,12,12,]),'assignment_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'if_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'select_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'do_while_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'do_until_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'do_loop_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'do_end_block':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[19,19,19,156,19,259,260,284,286,288,290,19,19,336,19,19,19,19,369,19,380,19,]),'put_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'get_list_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'block_comment_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'open_file':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'read_file':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'write_file':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'rewrite_file':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'delete_file':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'close_file':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'on_endfile':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'on_key':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'call_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'sql_statement':([4,8,73,101,121,213,214,237,238,239,240,268,269,310,314,315,316,342,358,361,367,370,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'variable_access':([4,8,34,59,62,71,73,101,102,103,104,105,106,107,108,109,110,111,112,113,120,121,122,123,134,181,213,214,223,237,238,239,240,242,268,269,310,312,314,315,316,317,327,334,342,358,361,367,370,383,384,385,],[33,33,70,70,70,70,33,33,70,70,70,70,70,70,70,70,70,70,70,70,70,33,70,70,70,70,33,33,70,33,33,33,33,70,33,33,33,70,33,33,33,70,70,70,33,33,33,33,33,70,70,70,]),'id_list':([6,95,125,246,],[50,147,183,295,]),'relational_expression':([34,120,122,],[60,176,178,]),'expression':([34,59,62,71,102,103,104,105,106,107,108,109,110,111,112,113,120,122,123,134,181,223,242,312,317,327,334,383,384,385,],[61,100,114,119,158,159,160,161,162,163,164,165,166,167,168,169,61,61,180,195,224,180,292,337,180,351,357,386,387,388,]),'type_declaration':([50,89,252,331,],[88,140,301,354,]),'array_spec':([50,141,],[89,201,]),'do_value':([123,223,317,],[179,270,343,]),'argument_list':([134,],[194,]),'field_list':([146,],[208,]),'element_list':([182,],[225,]),'element':([182,272,],[226,319,]),'when_list':([219,],[265,]),'other_statement':([265,],[308,]),'file_options':([274,275,276,],[320,322,323,]),'do_end':([313,314,315,342,370,],[338,340,341,360,381,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('program -> procedure_header declaration_list statement_list END ID SEMICOLON','program',6,'p_program','plithon.py',362),
+  ('procedure_header -> ID COLON PROC OPTIONS LPAREN MAIN RPAREN SEMICOLON','procedure_header',8,'p_procedure_header','plithon.py',367),
+  ('variable_access -> ID LPAREN NUMBER COMMA NUMBER RPAREN','variable_access',6,'p_variable_access','plithon.py',372),
+  ('variable_access -> ID LPAREN ID COMMA ID RPAREN','variable_access',6,'p_variable_access','plithon.py',373),
+  ('variable_access -> ID LPAREN ID COMMA NUMBER RPAREN','variable_access',6,'p_variable_access','plithon.py',374),
+  ('variable_access -> ID LPAREN NUMBER RPAREN','variable_access',4,'p_variable_access','plithon.py',375),
+  ('variable_access -> ID LPAREN ID RPAREN','variable_access',4,'p_variable_access','plithon.py',376),
+  ('variable_access -> ID','variable_access',1,'p_variable_access','plithon.py',377),
+  ('declaration_list -> declaration_list declaration SEMICOLON','declaration_list',3,'p_declaration_list','plithon.py',391),
+  ('declaration_list -> declaration SEMICOLON','declaration_list',2,'p_declaration_list','plithon.py',392),
+  ('declaration -> DCL id_list type_declaration','declaration',3,'p_declaration','plithon.py',400),
+  ('declaration -> DCL id_list array_spec type_declaration','declaration',4,'p_declaration','plithon.py',401),
+  ('declaration -> DCL NUMBER ID COMMA field_list','declaration',5,'p_structure_declaration','plithon.py',412),
+  ('field_list -> NUMBER ID type_declaration','field_list',3,'p_field_list','plithon.py',417),
+  ('field_list -> field_list COMMA NUMBER ID type_declaration','field_list',5,'p_field_list','plithon.py',418),
+  ('id_list -> ID','id_list',1,'p_id_list','plithon.py',425),
+  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','plithon.py',426),
+  ('id_list -> id_list COMMA ID array_spec','id_list',4,'p_id_list','plithon.py',427),
+  ('array_spec -> LPAREN NUMBER RPAREN','array_spec',3,'p_array_spec','plithon.py',437),
+  ('array_spec -> LPAREN NUMBER COMMA NUMBER RPAREN','array_spec',5,'p_array_spec','plithon.py',438),
+  ('type_declaration -> FIXED BIN LPAREN NUMBER RPAREN','type_declaration',5,'p_type_declaration','plithon.py',445),
+  ('type_declaration -> FIXED DECIMAL LPAREN NUMBER RPAREN','type_declaration',5,'p_type_declaration','plithon.py',446),
+  ('type_declaration -> FIXED DECIMAL LPAREN NUMBER COMMA NUMBER RPAREN','type_declaration',7,'p_type_declaration','plithon.py',447),
+  ('type_declaration -> CHAR LPAREN NUMBER RPAREN','type_declaration',4,'p_type_declaration','plithon.py',448),
+  ('type_declaration -> CHAR LPAREN NUMBER RPAREN VARYING','type_declaration',5,'p_type_declaration','plithon.py',449),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list','plithon.py',458),
+  ('statement_list -> statement','statement_list',1,'p_statement_list','plithon.py',459),
+  ('statement_list -> empty','statement_list',1,'p_statement_list','plithon.py',460),
+  ('empty -> <empty>','empty',0,'p_empty','plithon.py',469),
+  ('write_file -> WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON','write_file',10,'p_write_file','plithon.py',475),
+  ('write_file -> WRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN KEYFROM LPAREN expression RPAREN SEMICOLON','write_file',14,'p_write_file','plithon.py',476),
+  ('rewrite_file -> REWRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN SEMICOLON','rewrite_file',10,'p_rewrite_file','plithon.py',481),
+  ('rewrite_file -> REWRITE FILE LPAREN CHAR_CONST RPAREN FROM LPAREN ID RPAREN KEY LPAREN expression RPAREN SEMICOLON','rewrite_file',14,'p_rewrite_file','plithon.py',482),
+  ('delete_file -> DELETE FILE LPAREN CHAR_CONST RPAREN SEMICOLON','delete_file',6,'p_delete_file','plithon.py',486),
+  ('delete_file -> DELETE FILE LPAREN CHAR_CONST RPAREN KEY LPAREN expression RPAREN SEMICOLON','delete_file',10,'p_delete_file','plithon.py',487),
+  ('statement -> assignment_statement','statement',1,'p_statement','plithon.py',491),
+  ('statement -> declaration','statement',1,'p_statement','plithon.py',492),
+  ('statement -> if_statement','statement',1,'p_statement','plithon.py',493),
+  ('statement -> select_statement','statement',1,'p_statement','plithon.py',494),
+  ('statement -> do_while_statement','statement',1,'p_statement','plithon.py',495),
+  ('statement -> do_until_statement','statement',1,'p_statement','plithon.py',496),
+  ('statement -> do_loop_statement','statement',1,'p_statement','plithon.py',497),
+  ('statement -> do_end_block','statement',1,'p_statement','plithon.py',498),
+  ('statement -> put_statement','statement',1,'p_statement','plithon.py',499),
+  ('statement -> get_list_statement','statement',1,'p_statement','plithon.py',500),
+  ('statement -> block_comment_statement','statement',1,'p_statement','plithon.py',501),
+  ('statement -> open_file','statement',1,'p_statement','plithon.py',502),
+  ('statement -> read_file','statement',1,'p_statement','plithon.py',503),
+  ('statement -> write_file','statement',1,'p_statement','plithon.py',504),
+  ('statement -> rewrite_file','statement',1,'p_statement','plithon.py',505),
+  ('statement -> delete_file','statement',1,'p_statement','plithon.py',506),
+  ('statement -> close_file','statement',1,'p_statement','plithon.py',507),
+  ('statement -> on_endfile','statement',1,'p_statement','plithon.py',508),
+  ('statement -> on_key','statement',1,'p_statement','plithon.py',509),
+  ('statement -> call_statement','statement',1,'p_statement','plithon.py',510),
+  ('statement -> sql_statement','statement',1,'p_statement','plithon.py',511),
+  ('block_comment_statement -> BLOCK_COMMENT','block_comment_statement',1,'p_block_comment_statement','plithon.py',515),
+  ('assignment_statement -> variable_access ASSIGN expression SEMICOLON','assignment_statement',4,'p_assignment_statement','plithon.py',519),
+  ('expression -> expression PLUS expression','expression',3,'p_expression','plithon.py',523),
+  ('expression -> expression MINUS expression','expression',3,'p_expression','plithon.py',524),
+  ('expression -> expression TIMES expression','expression',3,'p_expression','plithon.py',525),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression','plithon.py',526),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','plithon.py',527),
+  ('expression -> NUMBER','expression',1,'p_expression','plithon.py',528),
+  ('expression -> DEC_CONST','expression',1,'p_expression','plithon.py',529),
+  ('expression -> CHAR_CONST','expression',1,'p_expression','plithon.py',530),
+  ('expression -> SUBSTR','expression',1,'p_expression','plithon.py',531),
+  ('expression -> MOD','expression',1,'p_expression','plithon.py',532),
+  ('expression -> INDEX','expression',1,'p_expression','plithon.py',533),
+  ('expression -> DECIMAL','expression',1,'p_expression','plithon.py',534),
+  ('expression -> variable_access','expression',1,'p_expression','plithon.py',535),
+  ('expression -> SUBSTR LPAREN ID COMMA NUMBER COMMA NUMBER RPAREN','expression',8,'p_expression_substr','plithon.py',563),
+  ('expression -> SUBSTR LPAREN ID COMMA NUMBER RPAREN','expression',6,'p_expression_substr','plithon.py',564),
+  ('expression -> MOD LPAREN ID COMMA NUMBER RPAREN','expression',6,'p_expression_mod','plithon.py',571),
+  ('expression -> INDEX LPAREN ID COMMA CHAR_CONST RPAREN','expression',6,'p_expression_index','plithon.py',575),
+  ('expression -> DECIMAL LPAREN ID RPAREN','expression',4,'p_expression_decimal','plithon.py',579),
+  ('if_statement -> IF relational_expression THEN statement ELSE statement','if_statement',6,'p_if_statement','plithon.py',583),
+  ('if_statement -> IF relational_expression THEN statement ELSE do_end_block','if_statement',6,'p_if_statement','plithon.py',584),
+  ('if_statement -> IF relational_expression THEN do_end_block ELSE statement','if_statement',6,'p_if_statement','plithon.py',585),
+  ('if_statement -> IF relational_expression THEN do_end_block ELSE do_end_block','if_statement',6,'p_if_statement','plithon.py',586),
+  ('do_end_block -> DO SEMICOLON statement_list END SEMICOLON','do_end_block',5,'p_do_end_block','plithon.py',590),
+  ('relational_expression -> expression EQ expression','relational_expression',3,'p_relational_expression','plithon.py',595),
+  ('relational_expression -> expression NE expression','relational_expression',3,'p_relational_expression','plithon.py',596),
+  ('relational_expression -> expression LT expression','relational_expression',3,'p_relational_expression','plithon.py',597),
+  ('relational_expression -> expression LE expression','relational_expression',3,'p_relational_expression','plithon.py',598),
+  ('relational_expression -> expression GT expression','relational_expression',3,'p_relational_expression','plithon.py',599),
+  ('relational_expression -> expression GE expression','relational_expression',3,'p_relational_expression','plithon.py',600),
+  ('relational_expression -> expression ASSIGN expression','relational_expression',3,'p_relational_expression','plithon.py',601),
+  ('expression -> expression CONCAT expression','expression',3,'p_expression_concat','plithon.py',605),
+  ('put_statement -> PUT SKIP LIST LPAREN element_list RPAREN SEMICOLON','put_statement',7,'p_put_statement','plithon.py',610),
+  ('get_list_statement -> GET LIST LPAREN id_list RPAREN SEMICOLON','get_list_statement',6,'p_get_list_statement','plithon.py',614),
+  ('id_list -> ID COMMA id_list','id_list',3,'p_id_list_multiple','plithon.py',619),
+  ('element_list -> element','element_list',1,'p_element_list','plithon.py',623),
+  ('element_list -> element_list COMMA element','element_list',3,'p_element_list','plithon.py',624),
+  ('element -> ID','element',1,'p_element','plithon.py',631),
+  ('element -> NUMBER','element',1,'p_element','plithon.py',632),
+  ('element -> CHAR_CONST','element',1,'p_element','plithon.py',633),
+  ('select_statement -> SELECT LPAREN expression RPAREN SEMICOLON when_list other_statement END SEMICOLON','select_statement',9,'p_select_statement','plithon.py',643),
+  ('select_end -> END SEMICOLON','select_end',2,'p_select_end','plithon.py',648),
+  ('when_list -> when_list WHEN LPAREN expression RPAREN statement','when_list',6,'p_when_list','plithon.py',652),
+  ('when_list -> when_list WHEN LPAREN expression RPAREN do_end_block','when_list',6,'p_when_list','plithon.py',653),
+  ('when_list -> WHEN LPAREN expression RPAREN statement','when_list',5,'p_when_list','plithon.py',654),
+  ('when_list -> WHEN LPAREN expression RPAREN do_end_block','when_list',5,'p_when_list','plithon.py',655),
+  ('when_list -> empty','when_list',1,'p_when_list','plithon.py',656),
+  ('other_statement -> OTHER statement','other_statement',2,'p_other_statement','plithon.py',665),
+  ('other_statement -> OTHER do_end_block','other_statement',2,'p_other_statement','plithon.py',666),
+  ('other_statement -> empty','other_statement',1,'p_other_statement','plithon.py',667),
+  ('do_while_statement -> DO WHILE LPAREN relational_expression RPAREN SEMICOLON statement do_end','do_while_statement',8,'p_do_while_statement','plithon.py',674),
+  ('do_while_statement -> DO WHILE LPAREN relational_expression RPAREN SEMICOLON statement_list do_end','do_while_statement',8,'p_do_while_statement','plithon.py',675),
+  ('do_until_statement -> DO UNTIL LPAREN relational_expression RPAREN SEMICOLON statement_list do_end','do_until_statement',8,'p_do_until_statement','plithon.py',680),
+  ('do_loop_statement -> DO ID ASSIGN do_value TO do_value SEMICOLON statement_list do_end','do_loop_statement',9,'p_do_loop_statement','plithon.py',684),
+  ('do_loop_statement -> DO ID ASSIGN do_value TO do_value BY do_value SEMICOLON statement_list do_end','do_loop_statement',11,'p_do_loop_statement','plithon.py',685),
+  ('do_value -> expression','do_value',1,'p_do_value','plithon.py',693),
+  ('do_value -> MINUS expression','do_value',2,'p_do_value','plithon.py',694),
+  ('do_end -> END SEMICOLON','do_end',2,'p_do_end','plithon.py',704),
+  ('open_file -> OPEN FILE LPAREN CHAR_CONST RPAREN INPUT file_options SEMICOLON','open_file',8,'p_open_file','plithon.py',709),
+  ('open_file -> OPEN FILE LPAREN CHAR_CONST RPAREN OUTPUT file_options SEMICOLON','open_file',8,'p_open_file','plithon.py',710),
+  ('open_file -> OPEN FILE LPAREN CHAR_CONST RPAREN UPDATE file_options SEMICOLON','open_file',8,'p_open_file','plithon.py',711),
+  ('file_options -> file_options ID','file_options',2,'p_file_options','plithon.py',715),
+  ('file_options -> file_options ID LPAREN NUMBER RPAREN','file_options',5,'p_file_options','plithon.py',716),
+  ('file_options -> empty','file_options',1,'p_file_options','plithon.py',717),
+  ('on_endfile -> ON ENDFILE LPAREN CHAR_CONST RPAREN statement','on_endfile',6,'p_on_endfile','plithon.py',726),
+  ('on_endfile -> ON ENDFILE LPAREN ID RPAREN statement','on_endfile',6,'p_on_endfile','plithon.py',727),
+  ('on_endfile -> ON ENDFILE LPAREN CHAR_CONST RPAREN do_end_block','on_endfile',6,'p_on_endfile','plithon.py',728),
+  ('on_endfile -> ON ENDFILE LPAREN ID RPAREN do_end_block','on_endfile',6,'p_on_endfile','plithon.py',729),
+  ('on_key -> ON KEY LPAREN CHAR_CONST RPAREN statement','on_key',6,'p_on_key','plithon.py',733),
+  ('on_key -> ON KEY LPAREN ID RPAREN statement','on_key',6,'p_on_key','plithon.py',734),
+  ('on_key -> ON KEY LPAREN CHAR_CONST RPAREN do_end_block','on_key',6,'p_on_key','plithon.py',735),
+  ('on_key -> ON KEY LPAREN ID RPAREN do_end_block','on_key',6,'p_on_key','plithon.py',736),
+  ('read_file -> READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN SEMICOLON','read_file',10,'p_read_file','plithon.py',741),
+  ('read_file -> READ FILE LPAREN CHAR_CONST RPAREN INTO LPAREN ID RPAREN KEY LPAREN expression RPAREN SEMICOLON','read_file',14,'p_read_file','plithon.py',742),
+  ('close_file -> CLOSE FILE LPAREN CHAR_CONST RPAREN SEMICOLON','close_file',6,'p_close_file','plithon.py',747),
+  ('call_statement -> CALL ID LPAREN argument_list RPAREN SEMICOLON','call_statement',6,'p_call_statement','plithon.py',751),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','plithon.py',756),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','plithon.py',757),
+  ('sql_statement -> EXEC SQL STRING INTO ID SEMICOLON','sql_statement',6,'p_sql_statement','plithon.py',761),
+  ('sql_statement -> EXEC SQL DCL ID CURSOR FOR STRING SEMICOLON','sql_statement',8,'p_sql_cursor_statement','plithon.py',767),
+  ('sql_statement -> EXEC SQL OPEN ID SEMICOLON','sql_statement',5,'p_sql_cursor_statement','plithon.py',768),
+  ('sql_statement -> EXEC SQL FETCH ID INTO id_list SEMICOLON','sql_statement',7,'p_sql_cursor_statement','plithon.py',769),
+  ('sql_statement -> EXEC SQL CLOSE ID SEMICOLON','sql_statement',5,'p_sql_cursor_statement','plithon.py',770),
+  ('pl1_var -> ID','pl1_var',1,'p_pl1_var','plithon.py',782),
+  ('sql_query -> STRING','sql_query',1,'p_sql_query','plithon.py',786),
+]
@@ -0,0 +1,46 @@
+# Incremental translation (plithon_incremental.py) against a full translation
+#
+# Usage: python -m unittest discover tests
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_incremental import IncrementalTranspiler
+
+STRUCTURE = """
+P: proc options(main);
+dcl 1 s, 2 first char(10), 2 family char(10);
+dcl n fixed bin(15);
+s.first = 'abc';
+put skip list(s.first);
+n = 0;
+put skip list(n);
+end P;
+"""
+
+class FailedEditTest(unittest.TestCase):
+    """An edit that fails, then one that doesn't touch the error."""
+
+    def check(self, incremental, source):
+        result, full = incremental.transpile(source), plithon.transpile(source)
+        self.assertEqual(result.ok, full.ok, full.errors)
+        if full.ok:
+            self.assertEqual(result.code, full.code)
+        return result
+
+    def test_unrelated_edit_after_failed_edit(self):
+        incremental = IncrementalTranspiler()
+        self.assertTrue(self.check(incremental, STRUCTURE).ok)
+        # the fields of s are gone: both translations fail
+        failed = STRUCTURE.replace("dcl 1 s, 2 first char(10), 2 family char(10);\n", "")
+        self.assertFalse(self.check(incremental, failed).ok)
+        # an edit elsewhere doesn't bring the code of the structure back
+        self.assertFalse(self.check(incremental, failed.replace("n = 0;", "n = 1;")).ok)
+        # nor does the fix of the error lose the edit
+        self.assertTrue(self.check(incremental, STRUCTURE.replace("n = 0;", "n = 1;")).ok)
+
+if __name__ == '__main__':
+    unittest.main()
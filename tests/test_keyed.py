@@ -0,0 +1,139 @@
+# KEYED files (plithon_runtime/keyed.py) and the statements using them
+#
+# Usage: python -m unittest discover tests
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import plithon
+from plithon_runtime.keyed import KeyCondition, KeyedFile
+
+ON_KEY = """
+prog: proc options(main);
+dcl line char(10);
+dcl n fixed bin(15);
+n = 0;
+on key('f') n = n + 1;
+open file('f') output keyed;
+line = 'one';
+write file('f') from(line) keyfrom(1);
+write file('f') from(line) keyfrom(1);
+close file('f');
+open file('f') input keyed;
+read file('f') into(line) key(2);
+read file('f') into(line) key(1);
+close file('f');
+put skip list(n);
+put skip list(line);
+end prog;
+"""
+
+class KeyedFileTest(unittest.TestCase):
+    """READ, WRITE, REWRITE and DELETE of a KEYED file."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.name = os.path.join(directory.name, 'f')
+
+    def created(self, records):
+        """Writes a KEYED file with the (key, record) pairs."""
+        keyed = KeyedFile(self.name, 'output')
+        for key, record in records:
+            self.assertTrue(keyed.write_key(key, record))
+        keyed.close()
+
+    def records(self):
+        """The records of the file in the order of their keys (READ without KEY)."""
+        keyed = KeyedFile(self.name, 'input')
+        records = list(iter(keyed.read, None))
+        keyed.close()
+        return records
+
+    def test_read_key(self):
+        self.created([(2, 'two'), (1, 'one'), ('b  ', 'bee')])
+        keyed = KeyedFile(self.name, 'input')
+        self.assertEqual(keyed.read_key(1), 'one')
+        # a key is a string without its trailing blanks
+        self.assertEqual(keyed.read_key('b'), 'bee')
+        self.assertIsNone(keyed.read_key(3))
+        # READ without KEY goes on after the record read last
+        self.assertEqual(keyed.read_key(1), 'one')
+        self.assertEqual(keyed.read(), 'two')
+        keyed.close()
+
+    def test_write_duplicate_key(self):
+        keyed = KeyedFile(self.name, 'output')
+        self.assertTrue(keyed.write_key(1, 'first'))
+        self.assertFalse(keyed.write_key(1, 'second'))
+        keyed.close()
+        self.assertEqual(self.records(), ['first'])
+
+    def test_rewrite_and_delete_after_read(self):
+        self.created([(1, 'one'), (2, 'two'), (3, 'three')])
+        keyed = KeyedFile(self.name, 'update')
+        self.assertEqual(keyed.read(), 'one')
+        self.assertTrue(keyed.rewrite('uno'))
+        self.assertEqual(keyed.read(), 'two')
+        self.assertTrue(keyed.delete())
+        self.assertEqual(keyed.read(), 'three')
+        self.assertIsNone(keyed.read())
+        self.assertFalse(keyed.delete(2))
+        keyed.close()
+        self.assertEqual(self.records(), ['uno', 'three'])
+
+    def test_rewrite_without_read(self):
+        self.created([(1, 'one')])
+        keyed = KeyedFile(self.name, 'update')
+        with self.assertRaises(ValueError):
+            keyed.rewrite('uno')
+        keyed.close()
+
+    def test_key_condition(self):
+        self.created([(1, 'one')])
+        keyed = KeyedFile(self.name, 'update')
+        self.assertFalse(keyed.write_key(1, 'uno'))
+        with self.assertRaises(KeyCondition) as caught:
+            keyed.key(None)
+        self.assertEqual((caught.exception.name, caught.exception.key), (self.name, 1))
+        raised = []
+        keyed.key(lambda: raised.append(keyed._key))
+        self.assertEqual(raised, [1])
+        keyed.close()
+
+    def test_committed_by_close(self):
+        keyed = KeyedFile(self.name, 'output')
+        keyed.write_key(1, 'one')
+        other = sqlite3.connect(self.name + '.db')
+        try:
+            count = "select count(*) from records"
+            self.assertEqual(other.execute(count).fetchone(), (0,))
+            keyed.close()
+            self.assertEqual(other.execute(count).fetchone(), (1,))
+        finally:
+            other.close()
+        self.assertEqual(self.records(), ['one'])
+
+class OnKeyTest(unittest.TestCase):
+    """ON KEY unit of a program for a duplicate WRITE KEYFROM and a READ KEY not found."""
+
+    def test_on_key(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+        result = plithon.transpile(ON_KEY)
+        self.assertTrue(result.ok, result.errors)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exec(compile(result.code, 'on_key', 'exec'), {'__name__': '__main__'})
+        self.assertEqual(output.getvalue().split('\n')[:2], ['2', 'one       '])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,233 @@
+# EXEC SQL runtime (plithon_runtime/sql.py) with SQLite and a fake DB-API driver
+#
+# Usage: python -m unittest discover tests
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plithon_runtime import sql
+from plithon_runtime.arrays import CharArray, fixed_array
+from plithon_runtime.fixed import FixedOverflow
+
+QUERY = "select a from t where b = :b and c like 'x%' and d = ':d' and e = :e"
+
+class FakeDriver:
+    """A DB-API module whose cursors record the statements they execute."""
+
+    class Error(Exception):
+        pass
+
+    class ProgrammingError(Error):
+        pass
+
+    def __init__(self, paramstyle):
+        self.paramstyle = paramstyle
+        self.cursors = 0
+        self.executed = []
+
+    def connect(self, **params):
+        return FakeConnection(self)
+
+class FakeConnection:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def cursor(self):
+        self.driver.cursors += 1
+        return FakeCursor(self.driver)
+
+    def close(self):
+        pass
+
+class FakeCursor:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def execute(self, sql, params=None):
+        self.driver.executed.append((sql, params))
+
+    def fetchone(self):
+        return ('value',)
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+def fake_connection(paramstyle):
+    """A Connection to a new FakeDriver with the paramstyle, and the driver."""
+    driver = FakeDriver(paramstyle)
+    sql.register_driver(f"fake_{paramstyle}", driver)
+    return sql.Connection({'driver': f"fake_{paramstyle}"}), driver
+
+def sqlite_connection():
+    """A Connection to an in-memory SQLite database with the table t."""
+    db = sql.Connection({'driver': 'sqlite', 'database': ':memory:', 'fetch_size': 2})
+    db.execute("create table t (id integer, amount, name text)", {})
+    for row in ((1, 1.25, 'ab'), (2, '3.5', 'cdefg'), (3, None, None), (4, 7, 'x')):
+        db.execute("insert into t values (:id, :amount, :name)", dict(zip(('id', 'amount', 'name'), row)))
+    return db
+
+class BindTest(unittest.TestCase):
+    """Host variables become the parameter markers of the driver."""
+
+    def test_paramstyles(self):
+        expected = {
+            'qmark': ("select a from t where b = ? and c like 'x%' and d = ':d' and e = ?", ['b', 'e']),
+            'numeric': ("select a from t where b = :1 and c like 'x%' and d = ':d' and e = :2", ['b', 'e']),
+            'named': ("select a from t where b = :b and c like 'x%' and d = ':d' and e = :e", None),
+            'format': ("select a from t where b = %s and c like 'x%%' and d = ':d' and e = %s", ['b', 'e']),
+            'pyformat': ("select a from t where b = %(b)s and c like 'x%%' and d = ':d' and e = %(e)s", None),
+        }
+        for paramstyle, result in expected.items():
+            with self.subTest(paramstyle=paramstyle):
+                self.assertEqual(sql.bind(QUERY, paramstyle), result)
+
+    def test_percent_without_host_variables(self):
+        # the driver doesn't format a text without parameters
+        self.assertEqual(sql.bind("select a from t where c like 'x%'", 'format'),
+                         ("select a from t where c like 'x%'", []))
+
+    def test_literals(self):
+        self.assertEqual(sql.host_variables("select ':a', 'it''s :b', :c from t where d = :d"), ['c', 'd'])
+
+    def test_parameters_passed(self):
+        values = {'b': 1, 'e': 'x'}
+        for paramstyle, params in (('qmark', [1, 'x']), ('format', [1, 'x']), ('named', values),
+                                   ('pyformat', values)):
+            with self.subTest(paramstyle=paramstyle):
+                db, driver = fake_connection(paramstyle)
+                db.execute(QUERY, values)
+                self.assertEqual(driver.executed, [(sql.bind(QUERY, paramstyle)[0], params)])
+
+    def tearDown(self):
+        for name in [name for name in sql.DRIVERS if name.startswith('fake_')]:
+            del sql.DRIVERS[name]
+
+class StatementCacheTest(unittest.TestCase):
+    """One cursor per statement text, reused for every execution."""
+
+    def test_cursor_reused(self):
+        db, driver = fake_connection('qmark')
+        for value in range(3):
+            db.execute(QUERY, {'b': value, 'e': value})
+        self.assertEqual(driver.cursors, 1)
+        self.assertEqual(len(driver.executed), 3)
+        db.execute("select 1", {})
+        self.assertEqual(driver.cursors, 2)
+
+    def test_declared_cursor_not_cached(self):
+        # an open cursor keeps its rows: every OPEN gets a cursor of its own
+        db, driver = fake_connection('qmark')
+        cursor = sql.Cursor(db, QUERY, lambda: {'b': 1, 'e': 2})
+        cursor.open()
+        cursor.open()
+        self.assertEqual(driver.cursors, 2)
+        self.assertNotIn(QUERY, db._statements)
+
+    def tearDown(self):
+        del sql.DRIVERS['fake_qmark']
+
+class SelectIntoTest(unittest.TestCase):
+    """EXEC SQL "select ..." INTO target;"""
+
+    def setUp(self):
+        self.db = sqlite_connection()
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_row(self):
+        self.assertEqual(sql.select_into(self.db, "select name from t where id = :k", {'k': 2}), 'cdefg')
+
+    def test_no_row(self):
+        self.assertIsNone(sql.select_into(self.db, "select name from t where id = :k", {'k': 9}))
+
+    def test_null(self):
+        self.assertIsNone(sql.select_into(self.db, "select name from t where id = :k", {'k': 3}))
+
+    def test_error(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertIsNone(sql.select_into(self.db, "select name from missing", {}))
+        self.assertIn("SQL Error", output.getvalue())
+        self.assertIn("missing", output.getvalue())
+
+class CursorTest(unittest.TestCase):
+    """EXEC SQL OPEN, FETCH and CLOSE of a declared cursor."""
+
+    def setUp(self):
+        self.db = sqlite_connection()
+
+    def tearDown(self):
+        self.db.close()
+
+    def cursor(self, low=0):
+        return sql.Cursor(self.db, "select id, amount, name from t where id > :k order by id", lambda: {'k': low})
+
+    def test_fetch_rows(self):
+        cursor = self.cursor()
+        cursor.open()
+        rows = []
+        # fetch_size 2: the rows come in two batches
+        while (row := cursor.fetch_row()) is not None:
+            self.assertEqual((cursor.sqlcode, cursor.rows), (0, 1))
+            rows.append(row[0])
+        self.assertEqual(rows, [1, 2, 3, 4])
+        self.assertEqual((cursor.sqlcode, cursor.rows), (sql.NOT_FOUND, 0))
+        cursor.close()
+
+    def test_host_variables_read_at_open(self):
+        low = [0]
+        cursor = sql.Cursor(self.db, "select id from t where id > :k order by id", lambda: {'k': low[0]})
+        low[0] = 2
+        cursor.open()
+        self.assertEqual(cursor.fetch_row(), (3,))
+        low[0] = 3
+        cursor.open()
+        self.assertEqual(cursor.fetch_row(), (4,))
+
+    def test_fetch_after_close(self):
+        cursor = self.cursor()
+        cursor.open()
+        cursor.close()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(cursor.fetch_row())
+        self.assertLess(cursor.sqlcode, 0)
+
+    def test_fetch_into_arrays(self):
+        ids = fixed_array(31, 3)
+        amounts = fixed_array((10 ** 5 - 1).bit_length(), 3)    # fixed dec(5,2)
+        names = CharArray(3, 3)
+        cursor = self.cursor()
+        cursor.open()
+        formats = [('ids', 0, -2 ** 31, 2 ** 31 - 1), ('amounts', 2, -99999, 99999), None]
+        self.assertEqual(cursor.fetch_into([ids, amounts, names], formats), 3)
+        self.assertEqual((cursor.sqlcode, cursor.rows), (0, 3))
+        self.assertEqual(list(ids), [1, 2, 3])
+        # the scaled values, NULL leaves an element unchanged
+        self.assertEqual(list(amounts), [125, 350, 0])
+        self.assertEqual([names.item(offset) for offset in range(3)], ['ab ', 'cde', '   '])
+        # the last row: the other elements keep their values
+        self.assertEqual(cursor.fetch_into([ids, amounts, names], formats), 1)
+        self.assertEqual((cursor.sqlcode, cursor.rows), (sql.NOT_FOUND, 1))
+        self.assertEqual(list(ids), [4, 2, 3])
+        self.assertEqual(list(amounts), [700, 350, 0])
+        self.assertEqual(names.item(0), 'x  ')
+        cursor.close()
+
+    def test_fetch_into_overflow(self):
+        amounts = fixed_array((10 ** 2 - 1).bit_length(), 4)    # fixed dec(2,2)
+        cursor = self.cursor()
+        cursor.open()
+        with self.assertRaises(FixedOverflow) as caught:
+            cursor.fetch_into([fixed_array(15, 4), amounts], [None, ('amounts', 2, -99, 99)])
+        self.assertEqual(str(caught.exception), "FIXEDOVERFLOW: 1.25 assigned to amounts")
+
+if __name__ == '__main__':
+    unittest.main()